@@ -1,19 +1,40 @@
 import os
 import sys
 from dataclasses import dataclass
+from importlib import import_module
 from pathlib import Path
-from typing import Literal, Optional, Sequence, Type
+from typing import TYPE_CHECKING, Literal, Optional, Sequence, Type
 
-from .cli_parser import assure_args, parse_cli, parse_config_file
 from .exceptions import Cancelled, InterfaceNotAvailable
-from .form_dict import DataClass, EnvClass
-from .interfaces import get_interface
-from .mininterface import EnvClass, Mininterface
 from .settings import MininterfaceSettings
-from .start import Start
-from .subcommands import Command, SubcommandPlaceholder
-from .tag import Tag
-from .tag.alias import Options, Validation
+
+if TYPE_CHECKING:  # The rest is loaded lazily, see __getattr__
+    from .form_dict import DataClass, EnvClass
+    from .interfaces import get_interface
+    from .mininterface import Mininterface
+    from .start import Start
+    from .subcommands import Command, SubcommandPlaceholder
+    from .tag import Tag
+    from .tag.alias import Options, Validation
+
+_lazy = {"DataClass": ".form_dict",
+         "EnvClass": ".form_dict",
+         "get_interface": ".interfaces",
+         "Mininterface": ".mininterface",
+         "Start": ".start",
+         "Command": ".subcommands",
+         "SubcommandPlaceholder": ".subcommands",
+         "Tag": ".tag",
+         "Options": ".tag.alias",
+         "Validation": ".tag.alias"}
+""" Attributes loaded on the first access so that `import mininterface` stays fast. """
+
+
+def __getattr__(name):
+    if mod := _lazy.get(name):
+        globals()[name] = getattr(import_module(mod, __name__), name)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # NOTE:
 # ask_for_missing does not work with tyro Positional, stays missing.
@@ -29,17 +50,17 @@ class _Empty:
     pass
 
 
-def run(env_or_list: Type[EnvClass] | list[Type[Command]] | None = None,
+def run(env_or_list: "Type[EnvClass] | list[Type[Command]] | None" = None,
         ask_on_empty_cli: bool = False,
         title: str = "",
         config_file: Path | str | bool = True,
         add_verbosity: bool = True,
         ask_for_missing: bool = True,
         # We do not use InterfaceType as a type here because we want the documentation to show full alias:
-        interface: Type[Mininterface] | Literal["gui"] | Literal["tui"] | Literal["text"] | None = None,
+        interface: "Type[Mininterface] | Literal['gui'] | Literal['tui'] | Literal['text'] | None" = None,
         args: Optional[Sequence[str]] = None,
         settings: Optional[MininterfaceSettings] = None,
-        **kwargs) -> Mininterface[EnvClass]:
+        **kwargs) -> "Mininterface[EnvClass]":
     """ The main access, start here.
     Wrap your configuration dataclass into `run` to access the interface. An interface is chosen automatically,
     with the preference of the graphical one, regressed to a text interface for machines without display.
@@ -151,6 +172,10 @@ def run(env_or_list: Type[EnvClass] | list[Type[Command]] | None = None,
     #     `if isinstance(config, FunctionType): config = lambda: config(**kwargs["default"])`
     #
     # Undocumented experimental: `default` keyword argument for tyro may serve for default values instead of a config file.
+    from .cli_parser import assure_args, parse_cli, parse_config_file
+    from .interfaces import get_interface
+    from .start import Start
+    from .subcommands import SubcommandPlaceholder
 
     # Prepare the config file
     if config_file is True and not kwargs.get("default"):
@@ -2,16 +2,22 @@ from typing import get_args, get_origin, Union
 from dataclasses import MISSING, fields, is_dataclass
 import os
 import re
+import sys
 from argparse import ArgumentParser
+from functools import lru_cache
+from pathlib import PurePath
+from threading import RLock
 from types import UnionType
 from typing import Callable, Iterable, Optional, TypeVar, Union, get_args, get_origin
 
-from tyro.extras import get_parser
+from .schema_cache import cached
 
 T = TypeVar("T")
 KT = str
 common_iterables = list, tuple, set
 """ collections, and not a str """
+tyro_lock = RLock()
+""" Building a tyro parser uses the tyro global caches. (Parsing does not need it.) """
 
 
 def flatten(d: dict[str, T | dict], include_keys: Optional[Callable[[str], list]] = None) -> Iterable[T]:
@@ -36,11 +42,12 @@ def flatten_keys(d: dict[KT, T | dict]) -> Iterable[tuple[KT, T]]:
 
 
 def guess_type(val: T) -> type[T]:
+    """ Ex: [1, 2] -> list[int], [1, "a"] -> list """
     t = type(val)
     if t in common_iterables:
-        elements_type = set(type(x) for x in val)
+        elements_type = set(map(type, val))
         if len(elements_type) == 1:
-            return t[list(elements_type)[0]]
+            return t[elements_type.pop()]
     return t
 
 
@@ -63,14 +70,76 @@ def get_descriptions(parser: ArgumentParser) -> dict:
             for action in parser._actions}
 
 
+@lru_cache(maxsize=128)
+def get_description_index(obj) -> dict[str, str]:
+    """ Descriptions of all the fields of a class.
+
+    Building a parser is expensive, hence the index is built just once per class
+    and shared by every form (or nested form) that uses the class.
+    Across the program launches, it might be kept in the [schema cache][mininterface.schema_cache].
+    Do not modify the returned dict.
+    """
+    def compute():
+        from tyro.extras import get_parser  # lazy, tyro takes long to import
+        with tyro_lock:
+            parser = get_parser(obj)
+        return get_descriptions(parser)
+    return cached("descriptions", obj, compute)
+
+
 def get_description(obj, param: str) -> str:
-    return get_descriptions(get_parser(obj))[param]
+    return get_description_index(obj)[param]
+
+
+def get_integration(module: str):
+    """ Return the module of an optional integration (`pydantic`, `attr`) or None.
+
+    We never import the integration ourselves. Till the module is imported,
+    the user cannot have any model of it, and we do not pay its import time.
+    """
+    return sys.modules.get(module)
 
 
 def yield_annotations(dataclass):
     yield from (cl.__annotations__ for cl in dataclass.__mro__ if is_dataclass(cl))
 
 
+@lru_cache(maxsize=1024)
+def _plain_types(annotation) -> Optional[tuple[type, ...]]:
+    """ `int` -> (int,), `int | str` -> (int, str). None if there is a generic, ex. `list[int]` or `int | list[int]`. """
+    args = get_args(annotation) if isinstance(annotation, UnionType) or get_origin(annotation) is Union \
+        else (annotation,)
+    if all(isinstance(arg, type) and get_origin(arg) is None for arg in args):
+        return args
+    return None
+
+
+def _all_match(values: Iterable, annotation) -> bool:
+    """ Whether every value matches the annotation. """
+    try:
+        plain = _plain_types(annotation)
+    except TypeError:  # unhashable annotation
+        plain = None
+    if plain is not None:
+        # Fast path: the loop over the values is done in C, we check just the distinct types.
+        return all(issubclass(t, plain) for t in set(map(type, values)))
+    return all(matches_annotation(item, annotation) for item in values)
+
+
+def _matches_collection(value, origin, subtypes: tuple) -> bool:
+    if origin is list:
+        return _all_match(value, subtypes[0])
+    elif origin is tuple:
+        if len(subtypes) != len(value):
+            return False
+        return all(matches_annotation(v, t) for v, t in zip(value, subtypes))
+    elif origin is dict:
+        key_type, value_type = subtypes
+        return _all_match(value.keys(), key_type) and _all_match(value.values(), value_type)
+    else:
+        return True
+
+
 def matches_annotation(value, annotation) -> bool:
     """ Check whether the value type corresponds to the annotation.
     Because built-in isinstance is not enough, it cannot determine parametrized generics.
@@ -85,18 +154,7 @@ def matches_annotation(value, annotation) -> bool:
         if not isinstance(value, origin):
             return False
 
-        subtypes = get_args(annotation)
-        if origin is list:
-            return all(matches_annotation(item, subtypes[0]) for item in value)
-        elif origin is tuple:
-            if len(subtypes) != len(value):
-                return False
-            return all(matches_annotation(v, t) for v, t in zip(value, subtypes))
-        elif origin is dict:
-            key_type, value_type = subtypes
-            return all(matches_annotation(k, key_type) and matches_annotation(v, value_type) for k, v in value.items())
-        else:
-            return True
+        return _matches_collection(value, origin, get_args(annotation))
 
     # ex. annotation=int
     return isinstance(value, annotation)
@@ -136,11 +194,21 @@ def subclass_matches_annotation(cls, annotation) -> bool:
         return False
 
 
+_scalars = str, int, float, bool
+
+
 def serialize_structure(obj):
     """ Ex: [Path("/tmp"), Path("/usr"), 1] -> ["/tmp", "/usr", 1]. """
     if isinstance(obj, (str, int, float)):
         return obj
-    elif isinstance(obj, Iterable) and not isinstance(obj, (str, bytes)):
+    elif type(obj) in common_iterables:
+        # Fast path for the flat collections, no recursion.
+        types = set(map(type, obj))
+        if all(t in _scalars for t in types):
+            return type(obj)(obj)
+        if all(issubclass(t, PurePath) for t in types):
+            return type(obj)(map(str, obj))
+    if isinstance(obj, Iterable) and not isinstance(obj, (str, bytes)):
         return type(obj)(serialize_structure(item) for item in obj)
     else:
         return str(obj)
@@ -1,76 +1,141 @@
 #
 # CLI and config file parsing.
 #
-from dataclasses import dataclass, fields, asdict
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextvars import ContextVar
+from copy import copy, deepcopy
+from dataclasses import dataclass, field, fields, make_dataclass, replace
 import logging
+import re
 import sys
 import warnings
+import argparse
 from argparse import Action, ArgumentParser
-from contextlib import ExitStack
+from contextlib import nullcontext
 from dataclasses import MISSING, fields, is_dataclass
+from inspect import signature
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Optional, Sequence, Type, Union
-from unittest.mock import patch
+from threading import Lock
+from typing import Annotated, Any, Generic, Iterable, Iterator, Optional, Sequence, Type, Union
 
-import yaml
-from tyro import cli
+from tyro import _argparse_formatter, cli
 from tyro._argparse_formatter import TyroArgumentParser
 from tyro._singleton import MISSING_NONPROP
 from tyro.extras import get_parser
 
-from .auxiliary import yield_annotations,  dataclass_asdict_no_defaults, merge_dicts
+try:  # the cached parser builds on these tyro internals, see _has_tyro_internals
+    from tyro import _arguments, _calling, _fields, _resolver, _strings, _unsafe_cache
+    from tyro._parsers import ParserSpecification
+    _InstantiationError = _calling.InstantiationError
+except (ImportError, AttributeError):
+    _arguments = _calling = _fields = _resolver = _strings = _unsafe_cache = None
+    ParserSpecification = Any
+    _InstantiationError = ()  # never caught
+
+from .auxiliary import (get_description, get_integration, yield_annotations, dataclass_asdict_no_defaults, merge_dicts,
+                        tyro_lock)
 from .settings import GuiSettings, MininterfaceSettings, TextSettings, TextualSettings, WebSettings
 from .form_dict import EnvClass, MissingTagValue
 from .tag import Tag
 from .tag.tag_factory import tag_factory
 from .validators import not_empty
 
-# Pydantic is not a project dependency, that is just an optional integration
-try:  # Pydantic is not a dependency but integration
-    from pydantic import BaseModel
-    pydantic = True
-except ImportError:
-    pydantic = False
-    BaseModel = False
-try:   # Attrs is not a dependency but integration
-    import attr
-except ImportError:
-    attr = None
-
 
 WrongFields = dict[str, Tag]
 
-eavesdrop = ""
-""" Used to intercept an error message from tyro """
+_missing: ContextVar[Optional[list[str]]] = ContextVar("missing", default=None)
+""" Missing required options of the current parse_cli call (None if we do not ask for them).
+Context variables keep the state per thread, the parsers themselves are shared. """
+_argv: ContextVar[list[str]] = ContextVar("argv", default=[])
+
+
+def _has_tyro_internals() -> bool:
+    """ Whether the tyro internals the cached parser builds on are present, with the expected signatures.
+    Another tyro version might not have them, then the parser falls back to the public tyro.cli. """
+    expected = {
+        "from_callable_or_type": ("f", "markers", "description", "parent_classes", "default_instance",
+                                  "intern_prefix", "extern_prefix", "add_help"),
+        "apply": ("self", "parser", "force_required_subparsers"),
+        "callable_with_args": ("f", "parser_definition", "default_instance", "value_from_prefixed_field_name",
+                               "field_name_prefix"),
+        "resolve_params_and_aliases": ("typ",),
+        "is_struct_type": ("typ", "default_instance"),
+    }
+    try:
+        functions = {"from_callable_or_type": ParserSpecification.from_callable_or_type,
+                     "apply": ParserSpecification.apply,
+                     "callable_with_args": _calling.callable_with_args,
+                     "resolve_params_and_aliases": _resolver.TypeParamResolver.resolve_params_and_aliases,
+                     "is_struct_type": _fields.is_struct_type}
+        # used as they are
+        _strings.dummy_field_name, _strings.get_delimeter, _strings.DELIMETER, _unsafe_cache.clear_cache
+        _arguments.ArgumentDefinition, _argparse_formatter.TyroArgparseHelpFormatter
+        _argparse_formatter.monkeypatch_len, _argparse_formatter.THEME
+        for name in ("args", "child_from_prefix", "subparsers_from_intern_prefix"):
+            ParserSpecification.__dataclass_fields__[name]
+    except (AttributeError, KeyError):
+        return False
+    return all(tuple(signature(functions[name]).parameters)[:len(params)] == params
+               for name, params in expected.items())
+
+
+_TYRO_INTERNALS = _has_tyro_internals()
+""" If False, the parsers are not cached, the tyro.cli is used instead. """
+_delimeter: ContextVar[Optional[str]] = ContextVar("delimeter", default=None)
+""" The delimiter of the parser being built or instantiated from. tyro keeps it in its global state,
+shared by the threads, hence its getter is replaced. """
+
+
+def _get_delimeter():
+    return _delimeter.get() or _strings.DELIMETER  # tyro.cli itself sets the global one
+
 
+if _TYRO_INTERNALS:
+    _strings.get_delimeter = _get_delimeter
 
-class Patches:
-    """ Various mocking patches. """
 
-    @staticmethod
-    def custom_error(self: TyroArgumentParser, message: str):
+class _Parser(TyroArgumentParser):
+    """ Tyro parser able to hand over the missing required options. """
+
+    @property
+    def _args(self):
+        """ Used by tyro in the error messages. """
+        return _argv.get()
+
+    @_args.setter
+    def _args(self, _):
+        pass  # tyro sets it on the parser building, we have it per call
+
+    def error(self, message: str):
         """ Fetch missing required options in GUI.
         On missing argument, tyro fail. We cannot determine which one was missing, except by intercepting
         the error message function. Then, we reconstruct the missing options.
         Thanks to this we will be able to invoke a UI dialog with the missing options only.
+        We let the parsing continue so that the rest of the CLI is parsed at once.
         """
-        global eavesdrop
+        if (missing := _missing.get()) is None:
+            return super().error(message)
         if not message.startswith("the following arguments are required:"):
             return super(TyroArgumentParser, self).error(message)
-        eavesdrop = message
-        raise SystemExit(2)  # will be catched
+        missing.extend(message.partition(":")[2].strip().split(", "))
+
+
+class _VerboseParser(_Parser):
+    """ Adds the verbosity flag. """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._add_verbosity()
 
-    @staticmethod
-    def custom_init(self: TyroArgumentParser, *args, **kwargs):
-        super(TyroArgumentParser, self).__init__(*args, **kwargs)
+    def _add_verbosity(self):
         default_prefix = '-' if '-' in self.prefix_chars else self.prefix_chars[0]
         self.add_argument(default_prefix+'v', default_prefix*2+'verbose', action='count', default=0,
                           help="Verbosity level. Can be used twice to increase.")
 
-    @staticmethod
-    def custom_parse_known_args(self: TyroArgumentParser, args=None, namespace=None):
-        namespace, args = super(TyroArgumentParser, self).parse_known_args(args, namespace)
+    def parse_known_args(self, args=None, namespace=None):
+        namespace, args = super().parse_known_args(args, namespace)
         # NOTE We may check that the Env does not have its own `verbose``
         if hasattr(namespace, "verbose"):
             if namespace.verbose > 0:
@@ -101,12 +166,239 @@ def assure_args(args: Optional[Sequence[str]] = None):
     return args
 
 
+@dataclass
+class _CachedParser:
+    """ Parser built once for the given type and parser kwargs, ready to parse any argv. """
+    f: Any
+    """ The type form as resolved by tyro (wrapped in a dummy dataclass if it is not a struct). """
+    default_instance: Any
+    dummy_wrapped: bool
+    spec: ParserSpecification
+    parser: _Parser
+    use_underscores: bool
+    kwargs: dict
+    """ Keeps the objects the cache key refers to by their id alive. """
+    refresh: bool = False
+    """ Some defaults are mutable, they must not be shared among the parsed objects. """
+
+    @classmethod
+    def build(cls, type_form, parser_class: Type[_Parser] = _Parser,
+              prog: Optional[str] = None, description: Optional[str] = None, default=None,
+              use_underscores: bool = False, console_outputs: bool = True, add_help: bool = True,
+              config: Optional[Sequence] = None, registry=None):
+        # NOTE This mirrors tyro._cli._cli_impl, split into the build and the parse part.
+        # It uses the tyro internals, checked by _has_tyro_internals.
+        kwargs = dict(prog=prog, description=description, default=default, use_underscores=use_underscores,
+                      console_outputs=console_outputs, add_help=add_help, config=config, registry=registry)
+        f = Annotated[(type_form, *config)] if config else type_form
+        default_instance = MISSING_NONPROP if default is None else default
+        _unsafe_cache.clear_cache()
+        # tyro's ansi_context patches `argparse.len` and removes the patch on exit, which is not thread-safe
+        # (a thread would remove it while another is formatting). The patch is kept instead.
+        argparse.len = _argparse_formatter.monkeypatch_len
+        token = _delimeter.set("_" if use_underscores else "-")
+        try:
+            with registry or nullcontext():
+                f = _resolver.TypeParamResolver.resolve_params_and_aliases(f)
+                dummy_wrapped = not _fields.is_struct_type(f, default_instance)
+                if dummy_wrapped:
+                    f = make_dataclass("dummy", [(_strings.dummy_field_name, f, field())], frozen=True)
+                    default_instance = f(default_instance)
+
+                _arguments.USE_RICH = True
+                spec = ParserSpecification.from_callable_or_type(f, markers=set(), description=description,
+                                                                 parent_classes=set(), default_instance=default_instance,
+                                                                 intern_prefix="", extern_prefix="", add_help=add_help)
+                parser = parser_class(prog=prog, formatter_class=_argparse_formatter.TyroArgparseHelpFormatter,
+                                      allow_abbrev=False, add_help=add_help)
+                parser._parser_specification = spec
+                parser._parsing_known_args = False
+                parser._console_outputs = console_outputs
+                spec.apply(parser, force_required_subparsers=False)
+        finally:
+            _delimeter.reset(token)
+        _unsafe_cache.clear_cache()
+        return cls(f, default_instance, dummy_wrapped, spec, parser, use_underscores, kwargs,
+                   any(isinstance(arg.field.default, _MUTABLE) for arg in _iterate_args(spec)))
+
+    def fix_args(self, args: Sequence[str]) -> list[str] | None:
+        """ Swap the delimiters like tyro does (--field_name -> --field-name).
+        Returns None if tyro should handle the args itself (shell completion). """
+        args = list(args)
+        for i, arg in enumerate(args):
+            if arg.startswith("--"):
+                arg, eq, val = arg.partition("=")
+                args[i] = "--" + _swap_delimeters(arg[2:], self.use_underscores) + eq + val
+        if args and args[0].replace("_", "-") in ("--tyro-print-completion", "--tyro-write-completion"):
+            return None
+        return args
+
+    def parse_args(self, args: list[str], missing: Optional[list[str]] = None):
+        """ Parse the args. If the `missing` list is given, it is filled with the missing required options
+        instead of failing. """
+        tokens = _argv.set(args), _missing.set(missing)
+        try:
+            return self.parser.parse_args(args)
+        finally:
+            _argv.reset(tokens[0])
+            _missing.reset(tokens[1])
+
+    def instantiate(self, namespace, overrides: dict[str, Any], args: list[str]):
+        """ Create the object from the parsed namespace.
+
+        Args:
+            namespace: Result of the parse_args.
+            overrides: Argument dest → value to be used instead of the field default.
+            args: The parsed args (not needed here, the namespace is used).
+
+        Raises:
+            _calling.InstantiationError: The values from the CLI are invalid.
+        """
+        values = vars(namespace)
+        if self.dummy_wrapped:
+            values = {k.replace(_strings.dummy_field_name, ""): v for k, v in values.items()}
+        spec = _fresh_spec(self.spec, overrides) if self.refresh or overrides else self.spec
+        # tyro matches the field names with the delimiter, see _delimeter.
+        token = _delimeter.set("_" if self.use_underscores else "-")
+        try:
+            get_out, _ = _calling.callable_with_args(self.f, spec, self.default_instance, values,
+                                                     field_name_prefix="")
+        finally:
+            _delimeter.reset(token)
+        out = get_out()
+        if self.dummy_wrapped:
+            out = getattr(out, _strings.dummy_field_name)
+        return out
+
+
+@dataclass
+class _PlainParser:
+    """ Used instead of the _CachedParser if the tyro internals are not as expected.
+    The parser built with the public tyro API finds the missing options, then tyro.cli parses the args again. """
+    type_form: Any
+    parser: _Parser
+    use_underscores: bool
+    kwargs: dict
+
+    fix_args = _CachedParser.fix_args
+
+    @classmethod
+    def build(cls, type_form, parser_class: Type[_Parser] = _Parser, **kwargs):
+        parser = get_parser(type_form, **kwargs)
+        parser.__class__ = parser_class  # intercept the error messages
+        if parser_class is _VerboseParser:
+            parser._add_verbosity()
+        return cls(type_form, parser, kwargs.get("use_underscores", False), kwargs)
+
+    def parse_args(self, args: list[str], missing: Optional[list[str]] = None):
+        tokens = _argv.set(args), _missing.set(missing)
+        try:
+            return self.parser.parse_args(args)
+        finally:
+            _argv.reset(tokens[0])
+            _missing.reset(tokens[1])
+
+    def instantiate(self, namespace, overrides: dict[str, Any], args: list[str]):
+        """ Create the object with tyro.cli, the overrides put into the default. """
+        kwargs = self.kwargs
+        if overrides:
+            default = SimpleNamespace() if kwargs.get("default") is None else copy(kwargs["default"])
+            for dest, value in overrides.items():
+                setattr(default, dest.replace("-", "_"), value)
+            kwargs = kwargs | {"default": default}
+        if isinstance(self.parser, _VerboseParser):  # already processed
+            args = [arg for arg in args if not _VERBOSITY_FLAG.fullmatch(arg)]
+        with tyro_lock, warnings.catch_warnings():  # tyro.cli keeps the delimiter globally
+            # tyro warns that the SimpleNamespace default is not an instance of the type form
+            warnings.simplefilter("ignore")
+            return cli(self.type_form, args=args, **kwargs)
+
+
+_VERBOSITY_FLAG = re.compile(r"-v+|--verbose")
+_MUTABLE = (list, dict, set)
+_PARSER_CACHE_SIZE = 64
+_parsers: OrderedDict[tuple, _CachedParser | _PlainParser] = OrderedDict()
+""" The parsers built so far, the least recently used first. """
+_parsers_lock = Lock()
+
+
+def _swap_delimeters(p: str, use_underscores: bool) -> str:
+    """ The same as tyro._strings.swap_delimeters, without its global state. """
+    if use_underscores:
+        return p.replace("-", "_")
+    stripped = p.lstrip("_")
+    return p[: len(p) - len(stripped)] + stripped.replace("_", "-")
+
+
+def _iterate_args(spec: ParserSpecification):
+    yield from spec.args
+    for child in spec.child_from_prefix.values():
+        yield from _iterate_args(child)
+    for subparsers in spec.subparsers_from_intern_prefix.values():
+        for child in subparsers.parser_from_name.values():
+            yield from _iterate_args(child)
+
+
+def _fresh_spec(spec: ParserSpecification, overrides: dict[str, Any]) -> ParserSpecification:
+    """ Copy the specification parts whose defaults must not be shared between the parses or are overriden.
+    The cached spec itself is never modified. """
+    args = []
+    for arg in spec.args:
+        if arg.lowered.dest in overrides:
+            default = overrides[arg.lowered.dest]
+        elif isinstance(arg.field.default, _MUTABLE):
+            # tyro evaluates the default_factory just once, when building the spec
+            default = deepcopy(arg.field.default)
+        else:
+            args.append(arg)
+            continue
+        new = replace(arg, field=replace(arg.field, default=default))
+        new.__dict__["lowered"] = arg.lowered  # reuse the cached property, the argument itself has not changed
+        args.append(new)
+    return replace(spec,
+                   args=args,
+                   child_from_prefix={k: _fresh_spec(v, overrides) for k, v in spec.child_from_prefix.items()},
+                   subparsers_from_intern_prefix={
+                       k: replace(v, parser_from_name={n: _fresh_spec(p, overrides)
+                                                       for n, p in v.parser_from_name.items()})
+                       for k, v in spec.subparsers_from_intern_prefix.items()})
+
+
+def _get_parser(type_form, kwargs: dict, add_verbosity: bool) -> _CachedParser | _PlainParser:
+    """ Return a cached parser or build a new one.
+
+    The `default` and the `registry` are keyed by their identity, hence they should not be mutated
+    after being passed here.
+    """
+    key = (type_form, add_verbosity,
+           *sorted((k, id(v) if k in ("default", "registry") else tuple(v) if k == "config" else v)
+                   for k, v in kwargs.items() if v is not None))
+    with _parsers_lock:
+        if entry := _parsers.get(key):
+            _parsers.move_to_end(key)
+            return entry
+    with tyro_lock:
+        if not (entry := _parsers.get(key)):  # another thread might have built it meanwhile
+            entry = (_CachedParser if _TYRO_INTERNALS else _PlainParser).build(
+                type_form, _VerboseParser if add_verbosity else _Parser, **kwargs)
+    with _parsers_lock:
+        _parsers[key] = entry
+        while len(_parsers) > _PARSER_CACHE_SIZE:
+            _parsers.popitem(last=False)
+    return entry
+
+
 def parse_cli(env_or_list: Type[EnvClass] | list[Type[EnvClass]],
               kwargs: dict,
               add_verbosity: bool = True,
               ask_for_missing: bool = True,
               args: Optional[Sequence[str]] = None) -> tuple[EnvClass, WrongFields]:
     """ Run the tyro parser to fetch program configuration from CLI """
+    type_form, add_verbosity = _get_type_form(env_or_list, add_verbosity)
+    return _parse(_get_parser(type_form, kwargs, add_verbosity), type_form, args, ask_for_missing)
+
+
+def _get_type_form(env_or_list: Type[EnvClass] | list[Type[EnvClass]], add_verbosity: bool):
     type_form = env_or_list
     if isinstance(type_form, list):
         # We have to convert the list of possible classes (subcommands) to union for tyro.
@@ -119,57 +411,133 @@ def parse_cli(env_or_list: Type[EnvClass] | list[Type[EnvClass]],
     else:
         env_classes = [env_or_list]
 
-    parser: ArgumentParser = get_parser(type_form, **kwargs)
-
-    # Mock parser, inject special options into
-    patches = []
-    if ask_for_missing:  # Get the missing flags from the parser
-        patches.append(patch.object(TyroArgumentParser, 'error', Patches.custom_error))
-    if add_verbosity:  # Mock parser to add verbosity
-        # The verbose flag is added only if neither the env_class nor any of the subcommands have the verbose flag already
-        if all("verbose" not in cl.__annotations__ for cl in env_classes):
-            patches.extend((
-                patch.object(TyroArgumentParser, '__init__', Patches.custom_init),
-                patch.object(TyroArgumentParser, 'parse_known_args', Patches.custom_parse_known_args)
-            ))
-
-    # Run the parser, with the mocks
+    # The verbose flag is added only if neither the env_class nor any of the subcommands have the verbose flag already
+    add_verbosity = add_verbosity and all("verbose" not in cl.__annotations__ for cl in env_classes)
+    return type_form, add_verbosity
+
+
+def _parse(parser: _CachedParser | _PlainParser, type_form, args: Optional[Sequence[str]], ask_for_missing: bool):
+    if (fixed_args := parser.fix_args(sys.argv[1:] if args is None else args)) is None:
+        return cli(type_form, args=args, **parser.kwargs), {}  # let tyro print the shell completion
+    missing = [] if ask_for_missing else None  # Get the missing flags from the parser
+    namespace = parser.parse_args(fixed_args, missing)
+
+    # Some required arguments are missing. Determine which.
+    # As we put a made up default value instead of the missing ones, there is no need to parse the CLI again.
+    wf = {}
+    overrides = {}
+    if missing:
+        for arg in missing:
+            treat_missing(type_form, overrides, parser.parser, wf, arg)
+        if len(overrides) != len(missing):
+            # Not all of them could be treated, we let the CLI fail (with a graceful message from tyro).
+            token = _argv.set(fixed_args)  # for the tyro error message
+            try:
+                parser.parser.error("the following arguments are required: " + ", ".join(missing))
+            finally:
+                _argv.reset(token)
+
     try:
-        with ExitStack() as stack:
-            [stack.enter_context(p) for p in patches]  # apply just the chosen mocks
-            res = cli(type_form, args=args, **kwargs)
-            if res is MISSING_NONPROP:
-                # NOTE tyro does not work if a required positional is missing tyro.cli()
-                # returns just NonpropagatingMissingType (MISSING_NONPROP).
-                # If this is supported, I might set other attributes like required (date, time).
-                # Fail if missing:
-                #   files: Positional[list[Path]]
-                # Works if missing but imposes following attributes are non-required (have default values):
-                #   files: Positional[list[Path]] = field(default_factory=list)
-                pass
-            return res, {}
-    except BaseException as e:
-        if ask_for_missing and getattr(e, "code", None) == 2 and eavesdrop:
-            # Some required arguments are missing. Determine which.
-            wf = {}
-            for arg in _fetch_eavesdrop_args():
-                treat_missing(type_form, kwargs, parser, wf, arg)
-
-            # Second attempt to parse CLI
-            # Why catching warnings? All the meaningful warnings
-            # have been produces during the first attempt.
-            # Now, when we defaulted all the missing fields with None,
-            # tyro produces 'UserWarning: The field (...) but the default value has type <class 'str'>.'
-            # (This is not true anymore; to support pydantic we put a default value of the type,
-            # so there is probably no more warning to be caught.)
-            with warnings.catch_warnings():
-                warnings.simplefilter('ignore')
-                return cli(type_form, args=args, **kwargs), wf
-        raise
-
-
-def treat_missing(env_class, kwargs: dict, parser: ArgumentParser, wf: dict, arg: str):
-    """ See the [mininterface.subcommands.SubcommandPlaceholder] for CLI expectation """
+        res = parser.instantiate(namespace, overrides, fixed_args)
+    except _InstantiationError as e:
+        _print_instantiation_error(parser.parser, e)
+        sys.exit(2)
+    if res is MISSING_NONPROP:
+        # NOTE tyro does not work if a required positional is missing tyro.cli()
+        # returns just NonpropagatingMissingType (MISSING_NONPROP).
+        # If this is supported, I might set other attributes like required (date, time).
+        # Fail if missing:
+        #   files: Positional[list[Path]]
+        # Works if missing but imposes following attributes are non-required (have default values):
+        #   files: Positional[list[Path]] = field(default_factory=list)
+        pass
+    return res, wf
+
+
+class PreparedParser(Generic[EnvClass]):
+    """ Parse many argument vectors, ex. in a long-running worker.
+    The parser and the config file defaults are prepared just once.
+
+    ```python
+    from dataclasses import dataclass
+    from mininterface.cli_parser import PreparedParser
+
+    @dataclass
+    class Env:
+        number: int = 3
+
+    parser = PreparedParser(Env)
+    env, wrong_fields = parser.parse(["--number", "5"])
+    for env, wrong_fields in parser.parse_many([["--number", "1"], ["--number", "2"]]):
+        print(env.number)  # 1, 2
+    ```
+
+    Args:
+        env_or_list: Dataclass with the configuration or a list of the subcommands.
+        config_file: File to load YAML with the defaults.
+        add_verbosity: Adds the verbose flag that sets the logging level.
+        ask_for_missing: If some required fields are missing, they are returned as the wrong fields
+            (and filled with a made up value) instead of the program exit.
+    Kwargs:
+        The same as for [argparse.ArgumentParser](https://docs.python.org/3/library/argparse.html).
+    """
+
+    def __init__(self, env_or_list: Type[EnvClass] | list[Type[EnvClass]],
+                 config_file: Path | str | None = None,
+                 add_verbosity: bool = False,
+                 ask_for_missing: bool = True,
+                 **kwargs):
+        self._init_args = env_or_list, config_file, add_verbosity, ask_for_missing, kwargs
+        kwargs, _ = parse_config_file(env_or_list, Path(config_file) if config_file else None, **kwargs)
+        self._type_form, add_verbosity = _get_type_form(env_or_list, add_verbosity)
+        self._ask_for_missing = ask_for_missing
+        # Held here, hence never evicted from the parser cache.
+        self._parser = _get_parser(self._type_form, kwargs, add_verbosity)
+
+    def parse(self, argv: Sequence[str]) -> tuple[EnvClass, WrongFields]:
+        """ Parse a single argument vector. Returns a fresh env instance and the wrong (missing) fields.
+        Thread-safe: the parser is shared, the state of a parse (including the tyro delimiter)
+        is kept in context variables, no lock is taken. (Mind the GIL, the threads do not parse in parallel.) """
+        return _parse(self._parser, self._type_form, argv, self._ask_for_missing)
+
+    def parse_many(self, argvs: Iterable[Sequence[str]],
+                   processes: Optional[int] = None,
+                   chunksize: int = 256) -> Iterator[tuple[EnvClass, WrongFields]]:
+        """ Parse the argument vectors, in the order.
+
+        Args:
+            argvs: The argument vectors.
+            processes: Fan out to a process pool of this size. Worth for very large batches only.
+                The env class must be picklable then (defined at a module level).
+            chunksize: Number of argument vectors sent to a process at once.
+        """
+        if not processes:
+            yield from map(self.parse, argvs)
+            return
+        with ProcessPoolExecutor(processes, initializer=_init_worker, initargs=self._init_args) as executor:
+            yield from executor.map(_parse_in_worker, argvs, chunksize=chunksize)
+
+
+_worker_parser: Optional[PreparedParser] = None
+""" The parser of a process pool worker. """
+
+
+def _init_worker(*args):
+    global _worker_parser
+    env_or_list, config_file, add_verbosity, ask_for_missing, kwargs = args
+    _worker_parser = PreparedParser(env_or_list, config_file, add_verbosity, ask_for_missing, **kwargs)
+
+
+def _parse_in_worker(argv):
+    return _worker_parser.parse(argv)
+
+
+def treat_missing(env_class, overrides: dict, parser: ArgumentParser, wf: dict, arg: str):
+    """ See the [mininterface.subcommands.SubcommandPlaceholder] for CLI expectation
+
+    Args:
+        overrides: Filled with the argument dest → made up default value.
+    """
     if arg.startswith("{"):
         # we should never come here, as treating missing subcommand should be treated by run/start.choose_subcommand
         return
@@ -178,7 +546,6 @@ def treat_missing(env_class, kwargs: dict, parser: ArgumentParser, wf: dict, arg
     except:
         # missing subcommand flag not implemented
         return
-    argument.default = "DEFAULT"  # NOTE I do not know whether used
     if "." in argument.dest:
         # missing nested required argument handler not implemented, we let the CLI fail
         # (with a graceful message from tyro)
@@ -196,27 +563,45 @@ def treat_missing(env_class, kwargs: dict, parser: ArgumentParser, wf: dict, arg
         # NOTE: We put MissingTagValue to the UI to clearly state that the value is missing.
         # However, the UI then is not able to use ex. the number filtering capabilities.
         # Putting there None is not a good idea as dataclass_to_tagdict fails if None is not allowed by the annotation.
+        # The description comes from the per-class index, shared with the forms built later.
         tag = wf[field_name] = tag_factory(MissingTagValue(),
-                                           argument.help.replace("(required)", ""),
+                                           get_description(env_class, field_name),
                                            validation=not_empty,
                                            _src_class=env_class,
                                            _src_key=field_name
                                            )
-        # Why `_make_default_value`? We need to put a default value so that the parsing will not fail.
+        # Why `_make_default_value`? We need to put a default value so that the object creation will not fail.
         # A None would be enough because Mininterface will ask for the missing values
         # promply, however, Pydantic model would fail.
         # As it serves only for tyro parsing and the field is marked wrong, the made up value is never used or seen.
-        set_default(kwargs, field_name, tag._make_default_value())
-
+        overrides[argument.dest] = tag._make_default_value()
 
-def _fetch_eavesdrop_args():
-    return eavesdrop.partition(":")[2].strip().split(", ")
 
-
-def set_default(kwargs, field_name, val):
-    if "default" not in kwargs:
-        kwargs["default"] = SimpleNamespace()
-    setattr(kwargs["default"], field_name, val)
+def _print_instantiation_error(parser: _Parser, e: "_calling.InstantiationError"):
+    """ Print the value error the way tyro.cli does. """
+    if not parser._console_outputs:
+        return
+    from rich.console import Console, Group
+    from rich.padding import Padding
+    from rich.panel import Panel
+    from rich.rule import Rule
+    from rich.style import Style
+
+    if isinstance(e.arg, _arguments.ArgumentDefinition):
+        flags = '/'.join(e.arg.lowered.name_or_flags)
+        title = f"[bright_red][bold]Error parsing {flags}[/bold]:[/bright_red] {e.message}"
+        helptext = [] if e.arg.lowered.help is None else [
+            Rule(style=Style(color="red")),
+            "Argument helptext:",
+            Padding(Group(f"{flags} [bold]{e.arg.lowered.metavar}[/bold]", e.arg.lowered.help), pad=(0, 0, 0, 4)),
+            *([Rule(style=Style(color="red")), f"For full helptext, see [bold]{parser.prog} --help[/bold]"]
+              if parser.add_help else [])]
+    else:
+        title = f"[bright_red][bold]Error parsing {e.arg}[/bold]:[/bright_red] {e.message}"
+        helptext = []
+    Console(theme=_argparse_formatter.THEME.as_rich_theme(), stderr=True).print(
+        Panel(Group(title, *helptext), title="[bold]Value error[/bold]", title_align="left",
+              border_style=Style(color="red")))
 
 
 def parse_config_file(env_or_list: Type[EnvClass] | list[Type[EnvClass]],
@@ -252,6 +637,7 @@ def parse_config_file(env_or_list: Type[EnvClass] | list[Type[EnvClass]],
     if "default" not in kwargs and not subcommands and config_file:
         # Undocumented feature. User put a namespace into kwargs["default"]
         # that already serves for defaults. We do not fetch defaults yet from a config file.
+        import yaml  # lazy, needed just when a config file exists
         disk = yaml.safe_load(config_file.read_text()) or {}  # empty file is ok
         if confopt := disk.pop("mininterface", None):
             # Section 'mininterface' in the config file.
@@ -300,9 +686,9 @@ def _create_with_missing(env, disk: dict):
     """
 
     # Determine model
-    if pydantic and issubclass(env, BaseModel):
+    if (pydantic := get_integration("pydantic")) and issubclass(env, pydantic.BaseModel):
         m = _process_pydantic
-    elif attr and attr.has(env):
+    elif (attr := get_integration("attr")) and attr.has(env):
         m = _process_attr
     else:  # dataclass
         m = _process_dataclass
@@ -324,6 +710,7 @@ def _create_with_missing(env, disk: dict):
 
 
 def _process_pydantic(env, disk):
+    BaseModel = get_integration("pydantic").BaseModel
     for name, f in env.model_fields.items():
         if name in disk:
             if isinstance(f.default, BaseModel):
@@ -336,6 +723,7 @@ def _process_pydantic(env, disk):
 
 
 def _process_attr(env, disk):
+    attr = get_integration("attr")
     for f in attr.fields(env):
         if f.name in disk:
             if attr.has(f.default):
@@ -7,7 +7,7 @@ from warnings import warn
 from ..redirectable import Redirectable
 
 
-from ..form_dict import EnvClass, TagDict
+from ..form_dict import EnvClass, FlatForm, TagDict
 
 if TYPE_CHECKING:
     from ..mininterface.adaptor import BackendAdaptor
@@ -37,6 +37,8 @@ class Facet(Generic[EnvClass]):
 
     _form: TagDict | None = None
     """ Experimental (apparently read-only) access to the current form. """
+    _flat: FlatForm | None = None
+    """ The current form flattened, the adaptors iterate it. """
     _env: EnvClass | None = None
     """ Experimental access to the Mininterface.env.
     If you change something, it will not probably be shown in the form because there is no refresh mechanism.
@@ -46,8 +48,16 @@ class Facet(Generic[EnvClass]):
         self.adaptor = adaptor
         self._env = env
 
-    def _fetch_from_adaptor(self, form: TagDict):
+    def _fetch_from_adaptor(self, form: TagDict, flat: FlatForm | None = None):
+        if flat is None:
+            if form is self._form and self._flat is not None:
+                flat = self._flat  # the same form being revised is not flattened again
+            else:
+                flat = FlatForm(form)
+                for tag in flat:  # a new dialog validates all the values
+                    tag._validated = None
         self._form = form
+        self._flat = flat
 
     def _clear(self):
         """ Experimental.
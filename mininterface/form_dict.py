@@ -5,28 +5,19 @@ import logging
 from warnings import warn
 from dataclasses import fields, is_dataclass
 from types import FunctionType, MethodType, SimpleNamespace
-from typing import (TYPE_CHECKING, Any, Callable, Optional, Type, TypeVar,
+from typing import (TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional, Type, TypeVar,
                     Union, get_args, get_type_hints)
 
 
-from .auxiliary import get_description
+from .auxiliary import flatten, get_description, get_integration
 from .tag.tag import MissingTagValue, Tag, TagValue
-from .tag.tag_factory import tag_assure_type, tag_fetch, tag_factory
+from .tag.tag_factory import new_tag, tag_assure_type, tag_fetch, tag_factory
 
 if TYPE_CHECKING:  # remove the line as of Python3.11 and make `"Self" -> Self`
     from typing import Self
 
     from . import Mininterface
 
-try:
-    import attr
-except ImportError:
-    attr = None
-try:
-    from pydantic import BaseModel
-except ImportError:
-    BaseModel = None
-
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +66,95 @@ FormDictOrEnv = TypeVar('FormDictOrEnv', bound=FormDict | DataClass)
 # FormDictOrEnv = TypeVar('FormDictOrEnv', FormDict, Type[EnvClass], EnvClass)
 
 
+class FlatForm:
+    """ The TagDict flattened just once per dialog.
+
+    The tags lie in a single list, along with their paths (the keys of the sections and the tag key).
+    The submit, the adaptors and the web wire protocol iterate the list
+    instead of walking the nested TagDict again and again. The nested view is derived on demand.
+    """
+
+    def __init__(self, form: TagDict):
+        self.form = form
+        """ The nested TagDict. """
+        self.tags: list[Tag] = []
+        self.paths: list[tuple[str, ...]] = []
+        """ The path of the tag at the same index. Ex. `("", "my_field")` or `("section", "subsection", "my_field")`. """
+        self.sections: list[tuple[int, tuple[str, ...]]] = []
+        """ The section boundaries. The index of the first tag of the section (or of the following tag
+            if the section has no direct tag) and the section path. """
+        self._layout: list[tuple[int, str, bool]] = []
+        """ The dict items in the order of the nested dict: the parent section (0 is the root, 1 the first section...),
+            the key and whether the item is a tag (or a section). """
+        self._walk(form, (), 0)
+
+    def _walk(self, d: TagDict, prefix: tuple[str, ...], parent: int):
+        for key, val in d.items():
+            if isinstance(val, dict):
+                path = prefix + (key,)
+                self.sections.append((len(self.tags), path))
+                self._layout.append((parent, key, False))
+                self._walk(val, path, len(self.sections))
+            else:
+                if isinstance(val, Tag) and not val.name:  # restore the name from the user provided dict
+                    val.name = key
+                self.tags.append(val)
+                self.paths.append(prefix + (key,))
+                self._layout.append((parent, key, True))
+
+    def __iter__(self) -> Iterator[Tag]:
+        return iter(self.tags)
+
+    def __len__(self):
+        return len(self.tags)
+
+    def with_sections(self, section: Callable[[tuple[str, ...]], Iterable]) -> Iterator[Tag | Any]:
+        """ The tags, with the output of the `section` callback inserted at each top-level section start.
+        (The nested sections are not headed, their tags continue the top-level section.) """
+        sections = (s for s in self.sections if len(s[1]) == 1)
+        boundary = next(sections, None)
+        for i, tag in enumerate(self.tags):
+            while boundary and boundary[0] == i:
+                yield from section(boundary[1])
+                boundary = next(sections, None)
+            yield tag
+        while boundary:
+            yield from section(boundary[1])
+            boundary = next(sections, None)
+
+    def zip(self, ui: dict | Iterable) -> Iterator[tuple[Tag, Any]]:
+        """ Pairs the tags with the UI values.
+        The values are either in a list (in the tags order) or in a nested dict of the same form. """
+        return zip(self.tags, flatten(ui) if isinstance(ui, dict) else ui)
+
+    def nested(self, values: Iterable) -> dict:
+        """ The nested dict of the same form, having the values (one per tag, in the tags order) instead of the tags. """
+        out = {}
+        sections = [out]
+        values = iter(values)
+        for parent, key, is_tag in self._layout:
+            if is_tag:
+                sections[parent][key] = next(values)
+            else:  # a section, even an empty one, keeps its place
+                sections[parent][key] = section = {}
+                sections.append(section)
+        return out
+
+    def resolve(self, extract_main=False) -> dict:
+        """ The nested dict of the tag values. See `formdict_resolve`. """
+        out = self.nested(map(_resolve_val, self.tags))
+        if extract_main and "" in out:
+            main = out.pop("")
+            return {**main, **out}
+        return out
+
+
+def _resolve_val(v):
+    while isinstance(v, Tag):
+        v = v.val
+    return formdict_resolve(v, _root=False) if isinstance(v, dict) else v
+
+
 def formdict_resolve(d: FormDict, extract_main=False, _root=True) -> dict:
     """ For the testing purposes, returns a new dict when all Tags are replaced with their values.
 
@@ -104,10 +184,9 @@ def dict_to_tagdict(data: dict, mininterface: Optional["Mininterface"] = None) -
         else:  # scalar or Tag value
             d = {"facet": getattr(mininterface, "facet", None)}
             if not isinstance(val, Tag):
-                tag = Tag(val, "", name=key, _src_dict=data, _src_key=key, **d)
+                tag = new_tag(val, "", name=key, _src_dict=data, _src_key=key, **d)
             else:
-                tag = tag_fetch(val, d, key)
-            tag = tag_assure_type(tag)
+                tag = tag_assure_type(tag_fetch(val, d, key))
             fd[key] = tag
     return fd
 
@@ -129,13 +208,13 @@ def iterate_attributes(env: DataClass):
         # Why using fields instead of vars(env)? There might be some helper parameters in the dataclasses that should not be form editable.
         for f in fields(env):
             yield f.name, getattr(env, f.name)
-    elif BaseModel and isinstance(env, BaseModel):
+    elif (pydantic := get_integration("pydantic")) and isinstance(env, pydantic.BaseModel):
         for param, val in vars(env).items():
             yield param, val
         # NOTE private pydantic attributes might be printed to forms, because this makes test fail for nested models
         # for param, val in env.model_dump().items():
         #     yield param, val
-    elif attr and attr.has(env):
+    elif (attr := get_integration("attr")) and attr.has(env):
         for f in attr.fields(env.__class__):
             yield f.name, getattr(env, f.name)
     else:  # might be a normal class; which is unsupported but mostly might work
@@ -149,13 +228,13 @@ def iterate_attributes_keys(env: DataClass):
         # Why using fields instead of vars(env)? There might be some helper parameters in the dataclasses that should not be form editable.
         for f in fields(env):
             yield f.name
-    elif BaseModel and isinstance(env, BaseModel):
+    elif (pydantic := get_integration("pydantic")) and isinstance(env, pydantic.BaseModel):
         for param, val in vars(env).items():
             yield param
         # NOTE private pydantic attributes might be printed to forms, because this makes test fail for nested models
         # for param, val in env.model_dump().items():
         #     yield param, val
-    elif attr and attr.has(env):
+    elif (attr := get_integration("attr")) and attr.has(env):
         for f in attr.fields(env.__class__):
             yield f.name
     else:  # might be a normal class; which is unsupported but mostly might work
@@ -177,7 +256,7 @@ def dataclass_to_tagdict(env: EnvClass | Type[EnvClass], mininterface: Optional[
     for param, val in iterate_attributes(env):
         if isinstance(val, MissingTagValue):
             val = None  # need to convert as MissingTagValue has .__dict__ too
-        if hasattr(val, "__dict__") and not isinstance(val, (FunctionType, MethodType)):  # nested config hierarchy
+        if hasattr(val, "__dict__") and not isinstance(val, (FunctionType, MethodType, Tag)):  # nested config hierarchy
             # nested config hierarchy
             # Why checking the isinstance? See Tag._is_a_callable.
             subdict[param] = dataclass_to_tagdict(val, mininterface, _nested=True)
@@ -1,8 +1,5 @@
 # Access to interfaces via this module assures lazy loading
-from code import interact
-from dataclasses import replace
 from importlib import import_module
-from os import isatty
 import sys
 from typing import Literal, Optional, Type
 
@@ -4,7 +4,7 @@ from enum import Enum
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, Callable, Generic, Literal, Optional, Type, TypeVar, overload
 
-from ..tag.select_tag import OptionsType, SelectTag
+from ..tag.select_tag import OptionsProvider, OptionsType, SelectTag
 
 from .adaptor import BackendAdaptor, MinAdaptor
 
@@ -12,11 +12,10 @@ from ..settings import MininterfaceSettings, UiSettings
 
 from ..exceptions import Cancelled
 
-from ..cli_parser import parse_cli
 from ..subcommands import Command
 from ..facet import Facet
-from ..form_dict import (DataClass, EnvClass, FormDict, dataclass_to_tagdict,
-                         dict_to_tagdict, formdict_resolve)
+from ..form_dict import (DataClass, EnvClass, FlatForm, FormDict, dataclass_to_tagdict,
+                         dict_to_tagdict)
 from ..tag.tag import Tag, TagValue
 
 if TYPE_CHECKING:  # remove the line as of Python3.11 and make `"Self" -> Self`
@@ -99,7 +98,8 @@ class Mininterface(Generic[EnvClass]):
 
         # Continual window
 
-        Do not vanish between dialogs (the GUI window stays the same)
+        Do not vanish between dialogs (the GUI window stays the same, the textual app keeps running,
+        so the dialogs follow each other without the terminal being set up again)
 
         # Stdout redirection
 
@@ -286,8 +286,11 @@ class Mininterface(Generic[EnvClass]):
             default = options
             options = options.__class__
 
-        if skippable and len(options) == 1:  # Directly choose the answer
-            if isinstance(options, type) and issubclass(options, Enum):  # Enum type, ex: val=ColorEnum
+        lazy = isinstance(options, OptionsProvider)
+        if skippable and (options.count() if lazy else len(options)) == 1:  # Directly choose the answer
+            if lazy:  # ex: a database query
+                out = options.page(0, 1)[0][1]
+            elif isinstance(options, type) and issubclass(options, Enum):  # Enum type, ex: val=ColorEnum
                 out = list(options)[0]
             elif isinstance(options, dict):
                 out = next(iter(options.values()))
@@ -424,8 +427,9 @@ class Mininterface(Generic[EnvClass]):
               ) -> FormDict | DataClass | EnvClass:
         _form = self.env if form is None else form
         if isinstance(_form, dict):
-            return formdict_resolve(adaptor.run_dialog(dict_to_tagdict(_form, self), title=title, submit=submit), extract_main=True)
+            return FlatForm(adaptor.run_dialog(dict_to_tagdict(_form, self), title=title, submit=submit)).resolve(extract_main=True)
         if isinstance(_form, type):  # form is a class, not an instance
+            from ..cli_parser import parse_cli  # lazy, tyro takes long to import
             _form, wf = parse_cli(_form, {}, False, False, args=[])  # NOTE what to do with wf?
         if is_dataclass(_form):  # -> dataclass or its instance (now it's an instance)
             # the original dataclass is updated, hence we do not need to catch the output from launch_callback
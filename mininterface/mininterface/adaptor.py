@@ -5,12 +5,25 @@ from ..settings import UiSettings
 from ..tag import Tag
 
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from inspect import iscoroutinefunction
 from typing import TYPE_CHECKING, Callable, Literal, Optional
 
 if TYPE_CHECKING:
     from . import Mininterface
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache
+def _get_on_change_executor() -> ThreadPoolExecutor:
+    """ A single worker, the async on_change callbacks run one after another. """
+    return ThreadPoolExecutor(1, thread_name_prefix="mininterface-on-change")
+
 
 class BackendAdaptor(ABC):
     """
@@ -25,6 +38,8 @@ class BackendAdaptor(ABC):
         self.interface = interface
         self.facet = interface.facet = self.__annotations__["facet"](self, interface.env)
         self.settings = settings or self.__annotations__["settings"]()
+        self._on_change_pending: dict[int, tuple[int, Callable[[], None] | None]] = {}
+        """ Tag id → the count of its on_change dispatches and the function cancelling the scheduled callback. """
 
     @abstractmethod
     def widgetize(self, tag: Tag):
@@ -38,6 +53,65 @@ class BackendAdaptor(ABC):
         """
         self.facet._fetch_from_adaptor(form)
 
+    def _call_later(self, delay: float, f: Callable[[], None]) -> Callable[[], None] | None:
+        """ Schedule the function in the UI thread. Return the function cancelling it.
+        (Without an event loop, the function is called right now.) """
+        f()
+
+    def _call_from_thread(self, f: Callable[[], None]):
+        """ Call the function in the UI thread from another thread. """
+        f()
+
+    def _on_change(self, tag: Tag):
+        """ Dispatch the tag.on_change callback. The changes within the delay coalesce into a single callback.
+        A sync callback runs in the UI thread (it may access the UI), hence should be quick.
+        An async callback runs in a worker thread, its result is applied only if no other change has come meanwhile.
+        (A callback superseded before it starts is skipped.) """
+        key = id(tag)
+        generation, cancel = self._on_change_pending.get(key, (0, None))
+        if cancel:
+            cancel()
+        generation += 1
+        self._on_change_pending[key] = generation, None
+
+        def is_current():
+            return self._on_change_pending.get(key, (None,))[0] == generation
+
+        def done():
+            if is_current():  # a newer change keeps its own entry
+                del self._on_change_pending[key]
+
+        def run():
+            if iscoroutinefunction(tag.on_change):
+                self._on_change_pending[key] = generation, None  # kept till the result is applied or dropped
+                _get_on_change_executor().submit(run_async)
+            else:
+                done()
+                tag.on_change(tag)
+
+        def run_async():
+            apply = None
+            try:
+                if is_current():
+                    apply = asyncio.run(tag.on_change(tag))
+            except Exception:
+                logger.exception("The on_change callback of %s failed", tag.name)
+            finally:
+                self._call_from_thread(lambda: finish(apply))
+
+        def finish(apply):
+            try:
+                if callable(apply) and is_current():
+                    apply()
+            finally:
+                done()
+
+        delay = self.settings.on_change_delay if tag.on_change_delay is None else tag.on_change_delay
+        if delay:
+            self._on_change_pending[key] = generation, self._call_later(delay, run)
+        else:
+            run()
+
     def submit_done(self) -> str | Literal[True]:
         if self.post_submit_action:
             try:
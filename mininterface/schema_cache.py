@@ -0,0 +1,116 @@
+""" Opt-in on-disk cache of the class schemas, making the cold starts faster.
+
+Enable it with the environment variable `MININTERFACE_CACHE=1`. The cache is stored
+in `$XDG_CACHE_HOME/mininterface/` (`~/.cache/mininterface/`). Or set the variable to a directory path.
+
+```bash
+MININTERFACE_CACHE=1 ./program.py
+```
+"""
+import hashlib
+import inspect
+import json
+import os
+import sys
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+stats = CacheStats()
+""" Hits and misses of the current process. """
+
+
+def get_cache_dir() -> Optional[Path]:
+    """ The cache directory or None if the cache is disabled. """
+    val = os.environ.get("MININTERFACE_CACHE")
+    if not val or val == "0":
+        return None
+    if val != "1":
+        return Path(val)
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "mininterface"
+
+
+@lru_cache
+def _versions() -> str:
+    """ Python version and the identity of the installed tyro and mininterface.
+    (importlib.metadata would take longer than the whole cache saves.) """
+    out = [sys.version]
+    for package in ("tyro", "mininterface"):
+        if (spec := find_spec(package)) and spec.origin:
+            st = os.stat(spec.origin)
+            out.append(f"{spec.origin}:{st.st_mtime_ns}:{st.st_size}")
+    return "|".join(out)
+
+
+@lru_cache
+def _read(path: str) -> bytes:
+    return Path(path).read_bytes()
+
+
+def _sources(cls, seen: set) -> list[bytes]:
+    """ The source files of the class, its parents and of the nested classes.
+    The field names are added as a class might be created dynamically (ex. make_dataclass). """
+    out = []
+    for c in inspect.getmro(cls):
+        if c in seen or c.__module__ == "builtins":
+            continue
+        seen.add(c)
+        out.append(_read(sys.modules[c.__module__].__file__))
+        out.append(" ".join(c.__dict__.get("__annotations__", ())).encode())
+        if is_dataclass(c):
+            # Nested dataclasses have their descriptions too. (Other types are not hashed, it would cost the reflection.)
+            out.extend(src for f in fields(c) if isinstance(f.type, type) and is_dataclass(f.type)
+                       for src in _sources(f.type, seen))
+    return out
+
+
+def get_key(kind: str, cls: type) -> Optional[str]:
+    """ Hash of the class source file and of the versions.
+    None if the source is not available (ex. a class created in an interactive session). """
+    try:
+        sources = _sources(cls, set())
+    except (OSError, TypeError, KeyError, AttributeError):
+        return None
+    h = hashlib.sha256("\0".join((kind, cls.__module__, cls.__qualname__, _versions())).encode())
+    for source in sources:
+        h.update(source)
+    return h.hexdigest()[:32]
+
+
+def cached(kind: str, cls: type, compute: Callable[[], T]) -> T:
+    """ Return the JSON serializable value computed for the class from the disk cache,
+    or compute and store it. The cache gets invalidated automatically whenever the class source changes
+    or another version of tyro, mininterface or Python is installed.
+
+    Why JSON and not pickle? The cache directory might be shared, we do not want to execute anything from it.
+    """
+    if not (directory := get_cache_dir()) or not isinstance(cls, type) or not (key := get_key(kind, cls)):
+        return compute()
+
+    path = directory / f"{kind}-{key}.json"
+    try:
+        val = json.loads(path.read_text())
+    except (OSError, ValueError):
+        stats.misses += 1
+        val = compute()
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(val))
+            tmp.replace(path)  # atomic, a concurrently starting program never reads a half-written file
+        except OSError:
+            pass
+    else:
+        stats.hits += 1
+    return val
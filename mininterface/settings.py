@@ -12,6 +12,11 @@ class UiSettings:
     toggle_widget: str = "f4"
     """ Shortcuts to toggle ex. calendar or file picker. """
 
+    on_change_delay: float = 0
+    """ Seconds the [`on_change`][mininterface.Tag.on_change] callbacks wait for further changes.
+    The fast successive changes (ex. moving through the options by arrows) coalesce into a single callback.
+    Overridable per tag by [`Tag.on_change_delay`][mininterface.Tag.on_change_delay]. """
+
     # NOTE should be used in tkinter
     # But we have to convert textual shortcut to tkinter shortcut with something like this
     # mods = {
@@ -35,6 +40,9 @@ class GuiSettings(UiSettings):
     combobox_since: int = 5
     """ The threshold to switch from radio buttons to a combobox. """
 
+    search_since: int = 1000
+    """ The threshold to switch to a list with a search entry, rendering the options page by page. """
+
     radio_select_on_focus: bool = False
     """ Select the radio button on focus. Ex. when navigating by arrows. """
 
@@ -46,7 +54,13 @@ class TuiSettings(UiSettings):
 
 @dataclass
 class TextualSettings(TuiSettings):
-    ...
+    search_since: int = 1000
+    """ The threshold to switch from radio buttons (or a selection list) to a list with a search input,
+    rendering the options page by page. """
+
+    virtualize_since: int = 200
+    """ The threshold to mount just the form fields near the viewport, the others when scrolled to.
+    The sections become collapsible then. """
 
 
 @dataclass
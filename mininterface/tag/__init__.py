@@ -3,6 +3,6 @@ from .callback_tag import CallbackTag
 from .datetime_tag import DatetimeTag
 from .path_tag import PathTag
 from .secret_tag import SecretTag
-from .select_tag import SelectTag
+from .select_tag import OptionsProvider, SelectTag
 
-__all__ = ["Tag", "CallbackTag", "DatetimeTag", "PathTag", "SecretTag", "SelectTag"]
+__all__ = ["Tag", "CallbackTag", "DatetimeTag", "PathTag", "SecretTag", "SelectTag", "OptionsProvider"]
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Any, Callable
 
 
-@dataclass
+@dataclass(slots=True)
 class CallbackTag(Tag):
     ''' Callback function is guaranteed to receive the [Tag][mininterface.Tag] as a parameter.
 
@@ -75,7 +75,7 @@ class CallbackTag(Tag):
     m.form()
     ```
     '''
-    val: Callable[[str], Any]
+    val: Callable[[str], Any] = None
 
     def _run_callable(self):
         return self.val(self)
@@ -0,0 +1,211 @@
+""" Conversion of the UI values (mostly str) to the annotated types.
+
+The type reflection is done just once per annotation, the result is a converter function cached globally.
+"""
+from ast import literal_eval
+from datetime import date, time
+from functools import lru_cache
+from types import NoneType, UnionType
+from typing import Any, Callable, Optional, Union, get_args, get_origin
+from warnings import warn
+
+from ..auxiliary import common_iterables, matches_annotation, subclass_matches_annotation
+from ..experimental import SubmitButton
+
+Converter = Callable[[str], Any]
+""" Takes the UI str and returns the value of the annotated type (or the str itself if not convertible).
+Raises ValueError if the value is not a valid iterable. """
+
+
+def _cached(f):
+    """ Cache for the annotations. The unhashable ones (ex. `Annotated` with a list metadata) are computed every time. """
+    cached_f = lru_cache(maxsize=1024)(f)
+
+    def _(annotation, *args):
+        try:
+            return cached_f(annotation, *args)
+        except TypeError:  # unhashable
+            return f(annotation, *args)
+    _.cache_clear = cached_f.cache_clear
+    _.cache_info = cached_f.cache_info
+    return _
+
+
+@_cached
+def get_possible_types(annotation) -> list[tuple[type | None, type | list[type]]]:
+    """ Possible types we can cast the value to.
+    For annotation `list[int] | tuple[str] | str | None`,
+    it returns `[(list,int), (tuple,str), (None,str)]`.
+
+    Filters out None.
+    """
+    def _(annot):
+        if origin := get_origin(annot):  # list[str] -> list, list -> None
+            subtype = get_args(annot)  # list[str] -> (str,), list -> ()
+            if origin in [UnionType, Union]:  # ex: `int | None`, `list[int] | None`, `Optional[list[int]]`
+                return [_(subt) for subt in subtype]
+            if origin is tuple:
+                return origin, list(subtype)
+            elif (len(subtype) == 1):
+                return origin, subtype[0]
+            else:
+                warn(f"This parametrized generic not implemented: {annot}")
+        elif annot is not None and annot is not NoneType:
+            # from UnionType, we get a NoneType
+            return None, annot
+        return False  # to be filtered out
+    out = _(annotation)
+    return [x for x in (out if isinstance(out, list) else [out]) if x is not False]
+
+
+@_cached
+def is_subclass(annotation, class_type: type | tuple[type]) -> bool:
+    """ Whether the class_type is a subclass of the annotation or of any of its possible types. """
+    try:
+        if issubclass(annotation, class_type):
+            return True
+    except TypeError:  # None, Union etc cast an error
+        pass
+    for origin, subtype in get_possible_types(annotation):
+        # ex: checking that class_type=Path is subclass of annotation=list[Path] <=> subtype=Path
+        if origin is tuple and isinstance(subtype, list):
+            # ex. tuple[int, int] -> origin = tuple, subtype = [int, int]
+            if get_origin(class_type) is tuple \
+                    and all(subt1 is subt2 for subt1, subt2 in zip(get_args(class_type), subtype)):
+                return True
+            continue
+        elif get_origin(subtype):
+            pass  # ex. tuple in `list[tuple[str, str]]`, not implemented
+        elif isinstance(class_type, tuple):  # (PosixPath, Path)
+            if any(subclass_matches_annotation(ct, subtype) for ct in class_type):
+                return True
+        elif subclass_matches_annotation(class_type, subtype):  # tuple
+            return True
+    return False
+
+
+@_cached
+def get_checker(annotation) -> Callable[[Any], bool]:
+    """ Check if the value conforms the annotation. Like `isinstance` but able to parse complex annotation. """
+    if annotation is None:  # no annotation check, everything is fine then
+        return lambda _: True
+    elif annotation is SubmitButton:  # NOTE EXPERIMENTAL
+        return lambda val: val is True or val is False
+    return lambda val: matches_annotation(val, annotation)
+
+
+_BRACKETS = {"[": "]", "(": ")", "{": "}"}
+
+
+def parse_scalars(ui_value: str, cast_to: type) -> Optional[list]:
+    """ Bulk parse a literal of the collection of scalars, ex. `[1, 2]` or `['/tmp', '/usr']`.
+    Numbers (int, float) are expected unquoted, other types quoted. No nesting nor escape sequences.
+
+    Returns None if the value is not that simple, the caller should use literal_eval then.
+    Much faster than literal_eval, the value is just split, no syntax tree is built.
+    """
+    ui_value = ui_value.strip()
+    if len(ui_value) < 2 or _BRACKETS.get(ui_value[0]) != ui_value[-1] or "\\" in ui_value:
+        return None
+    body = ui_value[1:-1]
+    if not body.strip():
+        return []
+    if ui_value[0] == "(" and "," not in body:
+        return None  # `(1)` is not a tuple
+    parts = body.split(",")
+
+    if cast_to is int or cast_to is float:
+        if cast_to is float and ("n" in body or "N" in body):
+            return None  # literal_eval does not know `nan` nor `inf`
+        try:
+            return list(map(cast_to, parts))  # int() and float() strip the whitespace themselves
+        except ValueError:  # ex. `[0x10]` or `[1,]` that literal_eval understands
+            return None
+
+    items = []
+    for part in parts:
+        part = part.strip()
+        quote = part[:1]
+        if quote not in ("'", '"') or len(part) < 2 or part[-1] != quote or quote in part[1:-1]:
+            return None  # ex. a comma or a quote in the string
+        items.append(part[1:-1])
+    return list(map(cast_to, items))
+
+
+def _get_caster(origin, cast_to) -> Callable[[str, Callable[[], Any]], Any]:
+    """ The literal is given as a function so that a scalar candidate does not need to evaluate it. """
+    if origin:
+        # Textual ask_number -> user writes '123', this has to be converted to int 123
+        # NOTE: Unfortunately, type(list) looks awful here. @see TextualInterface.form comment.
+        # (Maybe that's better now.)
+        if isinstance(cast_to, list):
+            # this is a tuple, tuple returns a list, each value is converted to another type
+            return lambda _, literal: origin(cast_to_(v) for cast_to_, v in zip(cast_to, literal()))
+
+        def cast(ui_value, literal):
+            if (items := parse_scalars(ui_value, cast_to)) is not None:
+                return origin(items)
+            return origin(cast_to(v) for v in literal())
+        return cast
+    return lambda ui_value, _: cast_to(ui_value)
+
+
+@_cached
+def get_converter(annotation) -> Converter:
+    """ Compile the converter of the UI str to the annotated type. """
+    check = get_checker(annotation)
+    nullable = NoneType in get_args(annotation)
+    casters = [_get_caster(origin, cast_to) for origin, cast_to in get_possible_types(annotation)]
+
+    # The first conversion attempt, determined by the annotation.
+    pre: Optional[Converter] = None
+    if annotation == Optional[int]:
+        def pre(ui_value):
+            try:
+                return int(ui_value)
+            except (ValueError, TypeError):
+                return ui_value
+    elif annotation in common_iterables:
+        # basic support for iterables, however, it will not work for custom subclasses of these built-ins
+        def pre(ui_value):
+            try:
+                return literal_eval(ui_value)
+            except (SyntaxError, ValueError):
+                raise ValueError(f"Not a valid iterable: {ui_value}")
+    elif is_subclass(annotation, (time, date)) and (fromisoformat := getattr(annotation, "fromisoformat", None)):
+        def pre(ui_value):
+            try:
+                return fromisoformat(ui_value)
+            except ValueError:
+                return ui_value
+
+    def convert(ui_value: str):
+        if ui_value == "" and nullable:
+            # The user is not able to set the value to None, they left it empty.
+            # Cast back to None as None is one of the allowed types.
+            # Ex: `severity: int | None = None`
+            return None
+        out_value = pre(ui_value) if pre else ui_value
+
+        if isinstance(out_value, str) and not check(out_value):
+            literal_cache = []
+
+            def literal():
+                if not literal_cache:
+                    literal_cache.append(literal_eval(ui_value))
+                return literal_cache[0]
+
+            try:
+                for caster in casters:
+                    try:
+                        candidate = caster(ui_value, literal)
+                    except (TypeError, ValueError, SyntaxError):
+                        continue
+                    if check(candidate):
+                        return candidate
+                return annotation(ui_value)
+            except (TypeError, ValueError, SyntaxError):
+                # Automatic conversion failed
+                pass
+        return out_value
+    return convert
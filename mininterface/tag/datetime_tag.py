@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from datetime import date, datetime, time
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class DatetimeTag(Tag):
     """
     Datetime, date and time types are supported.
@@ -72,13 +72,13 @@ class DatetimeTag(Tag):
 
     # NOTE calling DatetimeTag("2025-02") should convert str to date?
     def __post_init__(self):
-        super().__post_init__()
+        super(DatetimeTag, self).__post_init__()
         if self.annotation:
             self.date = issubclass(self.annotation, date)
             self.time = issubclass(self.annotation, time) or issubclass(self.annotation, datetime)
 
     def __hash__(self):  # every Tag child must have its own hash method to be used in Annotated
-        return super().__hash__()
+        return super(DatetimeTag, self).__hash__()
 
     def _make_default_value(self):
         return datetime.now()
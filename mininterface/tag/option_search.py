@@ -0,0 +1,67 @@
+""" Type-to-filter search over the option labels, shared by the interfaces. """
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, islice
+from typing import Iterable, Iterator, Optional
+
+
+class OptionSearch:
+    """ Case-insensitive substring search over the labels.
+
+    When the user types further (the new query contains the previous one),
+    the previous matches are just narrowed. A new query of at least three characters
+    is searched in all the labels joined into a single text, by `str.find` (so the scan runs in C),
+    the match positions are mapped back to the labels by bisection.
+    Shorter queries match most of the labels. Their matches are kept: the labels containing a character
+    are found by a single scan, the two-character queries narrow the matches of their first character.
+
+    Returns the indices of the matching labels, in the order of the labels.
+    """
+
+    def __init__(self, labels: Iterable[str]):
+        self.labels = [label.casefold().replace("\n", " ") for label in labels]
+        self._text = "\n".join(self.labels)
+        self._starts = list(accumulate((len(label) + 1 for label in self.labels), initial=0))
+        """ Position of each label in the text. """
+        self._last: tuple[str, list[int]] | None = None
+        """ The last query and all its matches. """
+        self._short: dict[str, array] = {}
+        """ The short queries searched so far and all their matches. """
+
+    def _short_matches(self, query: str) -> array:
+        if (found := self._short.get(query)) is None:
+            labels = self.labels
+            candidates = range(len(labels)) if len(query) == 1 else self._short_matches(query[0])
+            found = self._short[query] = array("I", (i for i in candidates if query in labels[i]))
+        return found
+
+    def _scan(self, query: str) -> Iterator[int]:
+        text, starts = self._text, self._starts
+        pos = text.find(query)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            yield i
+            pos = text.find(query, starts[i + 1])  # continue from the next label
+
+    def _matches(self, query: str) -> Iterator[int]:
+        labels = self.labels
+        if self._last and self._last[0] in query:  # narrowing the previous results
+            return (i for i in self._last[1] if query in labels[i])
+        if len(query) < 3:
+            return iter(self._short_matches(query))
+        return self._scan(query)
+
+    def search(self, query: str, limit: Optional[int] = None) -> list[int]:
+        """ The indices of the labels containing the query. At most `limit` of them. """
+        query = query.casefold()
+        if not query:
+            return list(range(len(self.labels) if limit is None else min(limit, len(self.labels))))
+        if "\n" in query:
+            return []
+        if self._last and self._last[0] == query:
+            return self._last[1] if limit is None else self._last[1][:limit]
+        if limit is not None:
+            return list(islice(self._matches(query), limit))
+        out = list(self._matches(query))
+        self._last = query, out
+        return out
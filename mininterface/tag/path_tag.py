@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class PathTag(Tag):
     """
     Contains a Path or their list. Use this helper object to select files.
@@ -56,7 +56,7 @@ class PathTag(Tag):
 
         # Determine the annotation from the value and correct it,
         # as the Tag.guess_type will fetch a mere `str` from `PathTag("/var")`
-        super().__post_init__()
+        super(PathTag, self).__post_init__()
         if self.annotation == str:  # PathTag("/var")
             self.annotation = Path
         if self.annotation == list[str]:  # PathTag(["/var"])
@@ -71,10 +71,39 @@ class PathTag(Tag):
                     self.multiple = True
                     break
 
-    def _validate(self, value):
-        """Validate the path value based on exist and is_dir attributes"""
+    def _is_blocking(self):
+        # the filesystem might be a network one
+        return bool(self.exist or self.is_dir or self.is_file) or super(PathTag, self)._is_blocking()
+
+    def _check(self):
+        """ Check the exist and is_dir attributes, the filesystem is accessed. """
+        res = super(PathTag, self)._check()
+        passed, value = res if isinstance(res, tuple) else (res, self.val)
+        if passed is not True:
+            return res
+        for path in value if isinstance(value, (list, tuple)) else [value]:
+            try:
+                path = Path(path)
+            except Exception:
+                continue  # see _validate
 
-        value = super()._validate(value)
+            if self.exist and not path.exists():
+                return f"Path does not exist: {path}"
+
+            if self.is_dir and self.is_file:
+                return f"Path cannot be both a file and a directory: {path}"
+
+            if self.is_dir and not path.is_dir():
+                return f"Path is not a directory: {path}"
+
+            if self.is_file and not path.is_file():
+                return f"Path is not a file: {path}"
+        return res
+
+    def _validate(self, value, checked=None):
+        """Validate the path format and count. (The exist and is_dir attributes are checked in _check.)"""
+
+        value = super(PathTag, self)._validate(value, checked)
         # Check for multiple paths before any conversion
         if not self.multiple and isinstance(value, (list, tuple)):
             self.set_error_text("Multiple paths are not allowed")
@@ -91,20 +120,4 @@ class PathTag(Tag):
                     self.set_error_text(f"Invalid path format: {path}")
                     raise ValueError()
 
-            if self.exist and not path.exists():
-                self.set_error_text(f"Path does not exist: {path}")
-                raise ValueError()
-
-            if self.is_dir and self.is_file:
-                self.set_error_text(f"Path cannot be both a file and a directory: {path}")
-                raise ValueError()
-
-            if self.is_dir and not path.is_dir():
-                self.set_error_text(f"Path is not a directory: {path}")
-                raise ValueError()
-
-            if self.is_file and not path.is_file():
-                self.set_error_text(f"Path is not a file: {path}")
-                raise ValueError()
-
         return value
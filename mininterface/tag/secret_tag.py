@@ -4,7 +4,7 @@ from . import Tag
 from dataclasses import dataclass
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class SecretTag(Tag):
     """
     Contains a secret value that should be masked in the UI.
@@ -31,7 +31,7 @@ class SecretTag(Tag):
     """ Internal state for visibility """
 
     def __hash__(self):  # every Tag child must have its own hash method to be used in Annotated
-        return super().__hash__()
+        return super(SecretTag, self).__hash__()
 
     def toggle_visibility(self):
         """Toggle the masked state"""
@@ -42,7 +42,7 @@ class SecretTag(Tag):
         """Value representation, suitable for an UI that does not handle a masked representation itself."""
         if self._masked and self.val:
             return "•" * len(str(self.val))
-        return super()._get_ui_val()
+        return super(SecretTag, self)._get_ui_val()
 
     def __repr__(self):
         """Ensure secrets are not accidentally exposed in logs/repr"""
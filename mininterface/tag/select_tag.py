@@ -1,15 +1,69 @@
-from dataclasses import dataclass
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Iterable, Optional, Type
 from warnings import warn
 
+from .option_search import OptionSearch
 from .tag import Tag, TagValue
 
 OptionsReturnType = list[tuple[str, TagValue, bool, tuple[str]]]
 OptionLabel = str
 RichOptionLabel = OptionLabel | tuple[OptionLabel]
+
+
+class OptionsProvider(ABC):
+    """ Options that are not loaded at once. Use it to select from millions of entries.
+    The interfaces request just the visible window and the search results.
+
+    ```python
+    import sqlite3
+    from mininterface import run
+    from mininterface.tag import OptionsProvider
+
+    class Hosts(OptionsProvider):
+        def __init__(self, db: str):
+            self.db = sqlite3.connect(db)
+
+        def count(self):
+            return self.db.execute("SELECT COUNT(*) FROM hosts").fetchone()[0]
+
+        def page(self, offset, limit):
+            return self.db.execute("SELECT name, id FROM hosts ORDER BY name LIMIT ? OFFSET ?",
+                                   (limit, offset)).fetchall()
+
+        def search(self, query, limit):
+            return self.db.execute("SELECT name, id FROM hosts WHERE name LIKE ? ORDER BY name LIMIT ?",
+                                   (f"%{query}%", limit)).fetchall()
+
+        def resolve(self, value):
+            if row := self.db.execute("SELECT name FROM hosts WHERE id = ?", (value,)).fetchone():
+                return row[0]
+
+    m = run()
+    host_id = m.select(Hosts("hosts.db"))
+    ```
+    """
+
+    @abstractmethod
+    def count(self) -> int:
+        """ Number of all the options. """
+
+    @abstractmethod
+    def page(self, offset: int, limit: int) -> list[tuple[OptionLabel, TagValue]]:
+        """ The options (label, value) in the window. """
+
+    @abstractmethod
+    def search(self, query: str, limit: int) -> list[tuple[OptionLabel, TagValue]]:
+        """ The options (label, value) that match the query, at most `limit` of them. """
+
+    @abstractmethod
+    def resolve(self, value: TagValue) -> OptionLabel | None:
+        """ The label of the value. None if the value is not an option. Used for the validation. """
+
+
 OptionsType = list[TagValue] | tuple[TagValue] | set[TagValue] | dict[RichOptionLabel,
-                                                                      TagValue] | list[Enum] | Type[Enum]
+                                                                      TagValue] | list[Enum] | Type[Enum] | OptionsProvider
 """ You can denote the options in many ways.
 Either put options in an iterable or to a dict `{labels: value}`.
 Values might be Tags as well. Let's take a detailed look. We will use the `run.choice(OptionsType)` to illustrate the examples.
@@ -90,13 +144,17 @@ m.choice([Color.GREEN, Color.BLUE])
 
 ![Options from enum list](asset/choice_enum_list.avif)
 
+## Lazy options
+
+When there are too many options to load them at once (ex. the rows of a database), implement the [`OptionsProvider`][mininterface.tag.OptionsProvider].
+
 ## Further examples
 
 See [mininterface.choice][mininterface.Mininterface.choice] or [`SelectTag.options`][mininterface.tag.SelectTag.options] for further usage.
 """
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class SelectTag(Tag):
     """ Handle options – radio buttons / select box.
     The value serves as the initially selected choice.
@@ -145,8 +203,12 @@ class SelectTag(Tag):
 
     tips: OptionsType | None = None
 
+    _index: Optional["_OptionIndex"] = field(default=None, init=False, repr=False, compare=False)
+
     def __repr__(self):
-        return super().__repr__()[:-1] + f", options={[k for k, *_ in self._get_options()]})"
+        if self._is_lazy():
+            return super(SelectTag, self).__repr__()[:-1] + f", options={self.options!r})"
+        return super(SelectTag, self).__repr__()[:-1] + f", options={[k for k, *_ in self._get_options()]})"
 
     def __post_init__(self):
         # Determine multiple
@@ -165,7 +227,7 @@ class SelectTag(Tag):
         # Disabling annotation is not a nice workaround, but it is needed for the `super().update` to be processed
         self.annotation = type(self)
         reset_name = not self.name
-        super().__post_init__()
+        super(SelectTag, self).__post_init__()
         if reset_name:
             # Inheriting the name of the default value in self.val (done in post_init)
             # does not make sense to me. Let's reset here so that we receive
@@ -186,7 +248,7 @@ class SelectTag(Tag):
                 self.val = None
 
     def __hash__(self):  # every Tag child must have its own hash method to be used in Annotated
-        return super().__hash__()
+        return super(SelectTag, self).__hash__()
 
     @classmethod
     def _get_tag_val(cls, v) -> TagValue:
@@ -198,15 +260,15 @@ class SelectTag(Tag):
     def _get_selected_key(self):
         if self.multiple:
             raise AttributeError
-        for k, val, *_ in self._get_options():
-            if val is self.val:
-                return k
-        return None
+        return self._get_index().get_key(self.val)
 
     def _get_selected_keys(self):
         if not self.multiple:
             raise AttributeError
-        return [k for k, val, *_ in self._get_options() if val in self.val]
+        if self._is_lazy():
+            return [self.options.resolve(v) for v in self.val]
+        selected = _Values(self.val)
+        return [k for k, val, *_ in self._get_index().get_rows() if val in selected]
 
     @classmethod
     def _repr_val(cls, v):
@@ -218,9 +280,33 @@ class SelectTag(Tag):
             return str(v.value)
         return str(v)
 
+    def __setattr__(self, name, value):
+        if name in ("options", "tips"):
+            # Invalidate the option index. (Note that an in-place modification of the options is not detected.)
+            super(SelectTag, self).__setattr__("_index", None)
+            super(SelectTag, self).__setattr__("_validated", None)
+        super(SelectTag, self).__setattr__(name, value)
+
+    def __getstate__(self):
+        state = super(SelectTag, self).__getstate__()
+        state["_index"] = None
+        return state
+
+    def _get_index(self) -> "_OptionIndex":
+        """ The options are indexed just once, till they change. """
+        if self._index is None:
+            self._index = _OptionIndex(self)
+        return self._index
+
+    def _is_lazy(self) -> bool:
+        return isinstance(self.options, OptionsProvider)
+
     def _build_options(self) -> dict[OptionLabel, TagValue]:
-        """ Whereas self.options might have different format, this returns a canonic dict. """
+        """ Whereas self.options might have different format, this returns a canonic dict.
+        (Empty for the lazy options.) """
+        return self._get_index().options
 
+    def _build_options_uncached(self) -> dict[OptionLabel, TagValue]:
         if self.options is None:
             return {}
         if isinstance(self.options, dict):
@@ -247,29 +333,29 @@ class SelectTag(Tag):
         Args:
             delim: Delimit the 1th argument with the chars. (If label are tuples.)
         """
-
-        index = set(self.tips or tuple())
-        front = []
-        back = []
-
-        options = self._build_options()
-
-        keys = options.keys()
-        labels: Iterable[tuple[str, tuple[str]]]
-        """ First is the str-label, second is guaranteed to be a tupled label"""
-
-        if len(options) and isinstance(next(iter(options)), tuple):
-            labels = self._span_to_lengths(keys, delim)
-        else:
-            labels = ((key, (key,)) for key in keys)
-
-        for (label, tupled), v in zip(labels, options.values()):
-            tupled: tuple[str]
-            if v in index:
-                front.append((label, v, True, tupled))
-            else:
-                back.append((label, v, False, tupled))
-        return front + back
+        return list(self._get_index().get_rows(delim))
+
+    def _count_options(self, query: str = "") -> int:
+        """ Number of the options. With the query, the number of the options containing it (capped for the lazy options). """
+        if self._is_lazy():
+            return len(self._get_index().search(query)) if query else self.options.count()
+        return len(self._search_options(query)) if query else len(self._get_index().options)
+
+    def _search_options(self, query: str) -> list[int]:
+        """ Positions of the options (in the `_get_options`) whose label contains the query.
+        Type-to-filter uses this. Not available for the lazy options. """
+        return self._get_index().search_positions(query)
+
+    def _get_page(self, offset: int, limit: int, query: str = "") -> OptionsReturnType:
+        """ A window of the `_get_options`. With the query, a window of the options containing it.
+        The lazy options are fetched from the provider, just the window. Tips are not moved to the front then.
+        """
+        index = self._get_index()
+        if query:
+            return index.search(query, offset, limit)
+        if self._is_lazy():
+            return index.wrap(self.options.page(offset, limit))
+        return index.get_rows()[offset:offset + limit]
 
     def _span_to_lengths(self, keys: Iterable[tuple[str]], delim=" - "):
         """ Span key tuple into a table
@@ -288,23 +374,25 @@ class SelectTag(Tag):
 
     def update(self, ui_value: TagValue | list[TagValue]) -> bool:
         """ ui_value is one of the self.options values  """
-        ch = self._build_options()
+        index = self._get_index()
+        ch = index.options
+
+        allowed = "the options" if self._is_lazy() else list(ch.keys())
 
         if self.multiple:
-            vals = set(ch.values())
-            if not all(v in vals for v in ui_value):
-                self.set_error_text(f"Must be one of {list(ch.keys())}")
+            if not all(v in index.values for v in ui_value):
+                self.set_error_text(f"Must be one of {allowed}")
                 return False
-            return super().update(ui_value)
+            return super(SelectTag, self).update(ui_value)
         else:
-            if ui_value in ch.values():
-                return super().update(ui_value)
+            if ui_value in index.values:
+                return super(SelectTag, self).update(ui_value)
             else:
-                self.set_error_text(f"Must be one of {list(ch.keys())}")
+                self.set_error_text(f"Must be one of {allowed}")
                 return False
 
-    def _validate(self, out_value):
-        vals = self._build_options().values()
+    def _validate(self, out_value, checked=None):
+        vals = self._get_index().values
 
         if self.multiple:
             if all(v in vals for v in out_value):
@@ -318,3 +406,121 @@ class SelectTag(Tag):
             else:
                 self.set_error_text(f"Not one of the allowed values")
                 raise ValueError
+
+
+class _Values:
+    """ Hashed membership test of the values. The unhashable values are compared one by one. """
+
+    def __init__(self, values: Iterable[TagValue]):
+        self.hashed = set()
+        self.unhashed = []
+        for v in values:
+            try:
+                self.hashed.add(v)
+            except TypeError:
+                self.unhashed.append(v)
+
+    def __contains__(self, value):
+        try:
+            if value in self.hashed:
+                return True
+        except TypeError:
+            pass
+        return any(value is v or value == v for v in self.unhashed)
+
+
+class _Resolvable:
+    """ Membership test of the lazy options. """
+
+    def __init__(self, provider: OptionsProvider):
+        self.provider = provider
+
+    def __contains__(self, value):
+        return self.provider.resolve(value) is not None
+
+
+class _OptionIndex:
+    """ The canonic options of a SelectTag, with the lookups.
+    Built once, the SelectTag drops it when its options or tips change. """
+
+    LAZY_PAGE = 100
+    """ The lazy options are not fetched all. This number is used where the first options are needed. """
+    SEARCH_LIMIT = 1000
+
+    def __init__(self, tag: SelectTag):
+        self.tag = tag
+        self.provider = tag.options if tag._is_lazy() else None
+        if self.provider:
+            self.options = {}
+            self.values = _Resolvable(self.provider)
+        else:
+            self.options = tag._build_options_uncached() or {}
+            self.values = _Values(self.options.values())
+        self._rows: dict[str, OptionsReturnType] = {}
+        self._keys: dict[int, OptionLabel] | None = None
+        self._tips: _Values | None = None
+        self._search: OptionSearch | None = None
+
+    def get_rows(self, delim=" - ") -> OptionsReturnType:
+        """ See SelectTag._get_options """
+        if delim not in self._rows:
+            if self.provider:
+                self._rows[delim] = self.wrap(self.provider.page(0, self.LAZY_PAGE))
+            else:
+                self._rows[delim] = self._build_rows(delim)
+        return self._rows[delim]
+
+    def wrap(self, page: list[tuple[OptionLabel, TagValue]]) -> OptionsReturnType:
+        """ Add the tip flags and the tupled label to the lazy options. """
+        if self._tips is None:
+            self._tips = _Values(self.tag.tips or tuple())
+        return [(label, v, v in self._tips, (label,)) for label, v in page]
+
+    def search_positions(self, query: str) -> list[int]:
+        """ Positions of the rows whose label contains the query. """
+        if self._search is None:
+            self._search = OptionSearch(label for label, *_ in self.get_rows())
+        return self._search.search(query)
+
+    def search(self, query: str, offset: int = 0, limit: Optional[int] = None) -> OptionsReturnType:
+        """ The options whose label contains the query. """
+        if self.provider:
+            return self.wrap(self.provider.search(query, self.SEARCH_LIMIT))[offset:None if limit is None else offset + limit]
+        rows = self.get_rows()
+        positions = self.search_positions(query)
+        return [rows[i] for i in positions[offset:None if limit is None else offset + limit]]
+
+    def get_key(self, value) -> OptionLabel | None:
+        """ The label of the value (compared by identity). """
+        if self.provider:
+            return self.provider.resolve(value)
+        if self._keys is None:
+            self._keys = {}
+            for k, val, *_ in self.get_rows():
+                self._keys.setdefault(id(val), k)
+        return self._keys.get(id(value))
+
+    def _build_rows(self, delim) -> OptionsReturnType:
+        tag = self.tag
+        index = _Values(tag.tips or tuple())
+        front = []
+        back = []
+
+        options = self.options
+
+        keys = options.keys()
+        labels: Iterable[tuple[str, tuple[str]]]
+        """ First is the str-label, second is guaranteed to be a tupled label"""
+
+        if len(options) and isinstance(next(iter(options)), tuple):
+            labels = tag._span_to_lengths(keys, delim)
+        else:
+            labels = ((key, (key,)) for key in keys)
+
+        for (label, tupled), v in zip(labels, options.values()):
+            tupled: tuple[str]
+            if v in index:
+                front.append((label, v, True, tupled))
+            else:
+                back.append((label, v, False, tupled))
+        return front + back
@@ -1,16 +1,20 @@
-from ast import literal_eval
-from dataclasses import dataclass, fields
-from datetime import date, time
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait as futures_wait
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from functools import lru_cache
+from inspect import iscoroutinefunction
+from threading import local
+from time import monotonic
 from types import FunctionType, MethodType, NoneType, UnionType
 from typing import (TYPE_CHECKING, Any, Callable, Iterable, Optional, TypeVar,
                     Union, get_args, get_origin)
-from warnings import warn
 
-from ..auxiliary import (common_iterables, flatten, guess_type,
-                         matches_annotation, serialize_structure,
-                         subclass_matches_annotation)
+from ..auxiliary import get_integration, guess_type, serialize_structure
 from ..experimental import FacetCallback, SubmitButton
+from .converter import get_checker, get_converter, get_possible_types, is_subclass
 from .internal import (BoolWidget, CallbackButtonWidget, FacetButtonWidget,
                        RecommendedWidget, SubmitButtonWidget)
 from .type_stubs import TagCallback
@@ -20,26 +24,12 @@ if TYPE_CHECKING:
         Self  # remove the line as of Python3.11 and make `"Self" -> Self`
 
     from ..facet import Facet
-    from ..form_dict import TagDict
+    from ..form_dict import FlatForm, TagDict
 else:
     # NOTE this is needed for tyro dataclass serialization (which still does not work
     # as Tag is not a frozen object, you cannot use it as an annotation)
     Facet = object
 
-# Pydantic is not a project dependency, that is just an optional integration
-try:  # Pydantic is not a dependency but integration
-    from pydantic import ValidationError as PydanticValidationError
-    from pydantic import create_model
-    pydantic = True
-except ImportError:
-    pydantic = False
-    PydanticValidationError = None
-    create_model = None
-try:   # Attrs is not a dependency but integration
-    import attr
-except ImportError:
-    attr = None
-
 
 UiValue = TypeVar("UiValue")
 """ Candidate for the TagValue. Produced by the UI. Might be of the same type as the target TagValue, or str."""
@@ -58,6 +48,142 @@ PydanticFieldInfo = TypeVar("PydanticFieldInfo", bound=Any)  # see why TagValue
 AttrsFieldInfo = TypeVar("AttrsFieldInfo", bound=Any)  # see why TagValue bounded to Any?
 
 
+def _pydantic_model(annotation, field_info: PydanticFieldInfo):
+    return get_integration("pydantic").create_model('ValidationModel', check=(annotation, field_info))
+
+
+def _attrs_model(validator):
+    attr = get_integration("attr")
+    return attr.make_class('ValidationModel', {"check": attr.ib(validator=validator)})
+
+
+@lru_cache(maxsize=1024)
+def _get_cached_validation_model(factory, *args):
+    return factory(*args)
+
+
+def _get_validation_model(factory, *args):
+    """ Building a class at every validation would be slow. The model is built once per the field. """
+    try:
+        return _get_cached_validation_model(factory, *args)
+    except TypeError:  # unhashable annotation
+        return factory(*args)
+
+
+VALIDATION_WORKERS = 8
+""" The count of the blocking validations running at once. """
+
+
+_worker = local()
+""" Marks the threads of the validation executor. """
+
+
+def _mark_worker():
+    _worker.is_worker = True
+
+
+@lru_cache
+def _get_validation_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(VALIDATION_WORKERS, thread_name_prefix="mininterface-validation",
+                              initializer=_mark_worker)
+
+
+def _timed_out(timeout: float) -> str:
+    return f"Validation timed out after {timeout} s"
+
+
+def _wait(future: Future, timeout: float | None, on_timeout: Callable[[], Any]):
+    """ The future result. On timeout, the future is cancelled if it has not started yet
+    (a running validation cannot be interrupted, it is just not waited for anymore). """
+    try:
+        return future.result(timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        return on_timeout()
+
+
+class _Submission:
+    """ The form values being submitted. The checks of the blocking tags run concurrently in the validation executor,
+    the other tags are updated in the calling thread meanwhile.
+
+    Just the checks run in the workers. The values are converted and applied (the tag value, the source object,
+    the error text) in the calling thread, when the check result arrives in time.
+    """
+
+    def __init__(self, updater: Iterable[tuple["Tag", UiValue]]):
+        # Why not all() directly? We need all the Tag values be updated from the UI.
+        # If the revision is needed, the UI fetches the values from the Tag.
+        # We need the keep the values so that the user does not have to re-write them.
+        # On a revision, only the values changed by the user are updated (converted and validated).
+        blocking, immediate, self.cross_field = [], [], []
+        for tag, ui_value in updater:
+            if tag._is_validated(ui_value):
+                continue
+            if getattr(tag.validation, "cross_field", False):
+                self.cross_field.append((tag, ui_value))
+            elif tag._is_blocking():
+                blocking.append((tag, ui_value))
+            else:
+                immediate.append((tag, ui_value))
+
+        # Each tag sets its own error text, the result does not depend on the order the checks finish in.
+        self.results: list[bool] = []
+        self.pending: list[tuple["Tag", UiValue, TagValue, TagValue, Future, Optional[float]]] = []
+        """ tag, UI value, proposed value, former value, check, deadline """
+        start = monotonic()
+        for tag, ui_value in blocking:
+            try:
+                out_value = tag._convert(ui_value)
+            except ValueError:
+                self.results.append(False)
+                continue
+            last, tag.val = tag.val, out_value  # the check reads the proposed value
+            timeout = getattr(tag.validation, "timeout", None)
+            self.pending.append((tag, ui_value, out_value, last, _get_validation_executor().submit(tag._check),
+                                 None if timeout is None else start + timeout))
+        self.results.extend(tag.update(ui_value) for tag, ui_value in immediate)
+
+    def wait(self):
+        """ Wait for the checks, each till its timeout. """
+        for *_, future, deadline in self.pending:
+            futures_wait((future,), None if deadline is None else max(0, deadline - monotonic()))
+
+    async def wait_async(self):
+        """ Wait for the checks, each till its timeout, without blocking the event loop. """
+        for *_, future, deadline in self.pending:
+            await asyncio.wait((asyncio.wrap_future(future),),
+                               timeout=None if deadline is None else max(0, deadline - monotonic()))
+
+    def finish(self) -> bool:
+        """ Apply the check results. The validations reading other fields run the last, on the updated values.
+        Returns whether the form is alright or whether we should revise it. """
+        for tag, ui_value, out_value, last, future, _ in self.pending:
+            tag.val = last
+            if future.done():
+                self.results.append(tag._apply(ui_value, out_value, future))
+            else:  # not waited for anymore, a running check cannot be interrupted
+                future.cancel()
+                tag.set_error_text(_timed_out(tag.validation.timeout))
+                self.results.append(False)
+        self.pending.clear()
+        self.results.extend(tag.update(ui_value) for tag, ui_value in self.cross_field)
+        return all(self.results)
+
+    def cancel(self):
+        """ The submit is abandoned, the tags keep their former values. """
+        for tag, _, _, last, future, _ in self.pending:
+            tag.val = last
+            future.cancel()
+        self.pending.clear()
+
+
+def guess_annotation(val: TagValue) -> type:
+    """ The annotation of a Tag that has a value (not None) but no annotation. """
+    if isinstance(val, Enum) or (isinstance(val, type) and issubclass(val, Enum)):
+        return Enum
+    return guess_type(val)
+
+
 class MissingTagValue:
     """ The dataclass field has not received a value from the CLI.
     Before anything happens, run.ask_for_missing should re-ask for a real value instead of this placeholder.
@@ -67,7 +193,10 @@ class MissingTagValue:
         return "MISSING"
 
 
-@dataclass
+# NOTE Tags have __slots__ to stay small in the forms with thousands of them.
+# The children are slotted too. As the dataclass re-creates a slotted class, the methods of the children
+# cannot use the zero-argument `super()`, they call `super(Class, self)` instead.
+@dataclass(slots=True)
 class Tag:
     """ Wrapper around a value that encapsulates a description, validation etc.
         When you provide a value to an interface, you may instead use this object.
@@ -146,6 +275,9 @@ class Tag:
     ```
 
     NOTE Undocumented feature, we can return tuple [ValidationResult, FieldValue] to set the self.val.
+
+    On a form revision, the validation is re-run only for the changed values.
+    If the validation reads other fields, mark it with [`cross_field`][mininterface.validators.cross_field].
     """
 
     name: str | None = None
@@ -174,8 +306,24 @@ class Tag:
 
     ![Choice with on change callback](asset/on_change1.avif)
     ![Choice with on change callback chosen](asset/on_change2.avif)
+
+    A sync callback runs in the UI thread, so it may access the UI but it should be quick.
+    An async callback runs off the UI thread so that a slow callback does not stall the UI.
+    If it returns a function, the function is called back in the UI thread –
+    unless the value has changed meanwhile, then the stale result is dropped.
+
+    ```python
+    async def callback(tag: Tag):
+        preview = render_preview(tag.val)  # takes long
+        return lambda: tag.facet.set_title(preview)
+    ```
     """
 
+    on_change_delay: Optional[float] = None
+    """ Seconds the on_change callback waits for further changes.
+    The fast successive changes coalesce into a single callback.
+    If not set, [`UiSettings.on_change_delay`][mininterface.settings.UiSettings.on_change_delay] is used. """
+
     _src_dict: TD | None = None
     """ The original dict to be updated when UI ends."""
 
@@ -226,7 +374,7 @@ class Tag:
     ```
     """
 
-    _error_text = None
+    _error_text: Optional[str] = field(default=None, compare=False)
     """ Meant to be read only. Error text if type check or validation fail and the UI has to be revised """
 
     _pydantic_field: PydanticFieldInfo = None
@@ -236,6 +384,8 @@ class Tag:
     _last_ui_val: TagValue = None
     """ This is the value as was in the current UI. Used by on_change_trigger
         to determine whether the UI value changed. """
+    _validated: Optional[tuple[UiValue, TagValue]] = field(default=None, compare=False, repr=False)
+    """ The last UI value that passed the validation and the resulting value. """
 
     def __post_init__(self):
         """ Determine annotation and fetch other information. """
@@ -251,22 +401,19 @@ class Tag:
 
         # Fetch information from the parent object
         if self._src_class:
-            if pydantic:  # Pydantic integration
+            if get_integration("pydantic"):  # Pydantic integration
                 self._pydantic_field: dict | None = getattr(self._src_class, "model_fields", {}).get(self._src_key)
-            if attr:  # Attrs integration
+            if attr := get_integration("attr"):  # Attrs integration
                 try:
                     self._attrs_field: dict | None = attr.fields_dict(self._src_class).get(self._src_key)
                 except attr.exceptions.NotAnAttrsClassError:
                     pass
         if not self.annotation and self.val is not None:
-            if isinstance(self.val, Enum) or (isinstance(self.val, type) and issubclass(self.val, Enum)):
-                self.annotation = Enum
-            else:
-                # When having options with None default self.val, this would impose self.val be of a NoneType,
-                # preventing it to set a value.
-                # Why checking self.val is not None? We do not want to end up with
-                # annotated as a NoneType.
-                self.annotation = guess_type(self.val)
+            # When having options with None default self.val, this would impose self.val be of a NoneType,
+            # preventing it to set a value.
+            # Why checking self.val is not None? We do not want to end up with
+            # annotated as a NoneType.
+            self.annotation = guess_annotation(self.val)
 
         if self.annotation is SubmitButton:
             self.val = False
@@ -320,7 +467,7 @@ class Tag:
         (Skips the attributes that are already set.)
         """
         # TODO what about children? Like 'options' is not fetched from.
-        for attr in ('val', 'annotation', 'name', 'validation', 'on_change', "facet",
+        for attr in ('val', 'annotation', 'name', 'validation', 'on_change', 'on_change_delay', "facet",
                      "_src_obj", "_src_key", "_src_class",
                      "_original_desc", "_original_name", "original_val"):
             if getattr(self, attr, None) is None:
@@ -332,16 +479,16 @@ class Tag:
         return self
 
     def __getstate__(self):
-        state = self.__dict__.copy()
-        state["facet"] = None  # NOTE WebUi rather than deleting facet, try removing StdIO from it.
-        state["_src_dict"] = None
-        state["_src_obj"] = None
-        state["_src_class"] = None
+        # The tags have __slots__ and no __dict__, every attribute is a dataclass field.
+        state = {f.name: getattr(self, f.name) for f in fields(self)}
+        # NOTE WebUi rather than deleting facet, try removing StdIO from it.
+        state.update(facet=None, _src_dict=None, _src_obj=None, _src_class=None)
         return state
 
     def __setstate__(self, state):
         # NOTE check with WebUI. If not needed, remove.
-        self.__dict__.update(state)
+        for key, val in state.items():
+            object.__setattr__(self, key, val)
         self._update_source(self.val)
 
     def _is_a_callable(self) -> bool:
@@ -361,7 +508,10 @@ class Tag:
         if self._last_ui_val != ui_val:
             # NOTE we should refresh the Widget when update fails; see facet comment
             if self.update(ui_val) and self.on_change:
-                self.on_change(self)
+                if self.facet:
+                    self.facet.adaptor._on_change(self)
+                else:
+                    self.on_change(self)
             self._last_ui_val = ui_val
 
     def _recommend_widget(self) -> RecommendedWidget | type["Self"] | None:
@@ -402,54 +552,10 @@ class Tag:
                   'TypeError: cannot be a parameterized generic'
 
         """
-        if self.annotation is None:  # no annotation check, everything is fine then
-            return True
-        elif self.annotation is SubmitButton:  # NOTE EXPERIMENTAL
-            return val is True or val is False
-
-        return matches_annotation(val, self.annotation)
-        # NOTE remove
-        try:
-            return isinstance(val, self.annotation)
-        except TypeError:
-            if val is None and NoneType in get_args(self.annotation):
-                return True
-            for origin, subtype in self._get_possible_types():
-                if origin:
-                    if isinstance(val, origin) and all(isinstance(item, subtype) for item in val):
-                        return True
-                else:
-                    if isinstance(val, subtype):
-                        return True
-            return False
+        return get_checker(self.annotation)(val)
 
     def _is_subclass(self, class_type: type | tuple[type]):
-        # if origin := get_origin(self.annotation):  # list[str] -> list, list -> None
-        #     subtype = get_args(self.annotation)  # list[str] -> (str,), list -> ()
-        #     if origin in [UnionType, Union]:  # ex: `int | None`, `list[int] | None`, `Optional[list[int]]`
-        #         return any(subclass_matches_annotation(subt, class_type) for subt in subtype)
-        # return subclass_matches_annotation(self.annotation, class_type)
-        try:
-            if issubclass(self.annotation, class_type):
-                return True
-        except TypeError:  # None, Union etc cast an error
-            pass
-        for origin, subtype in self._get_possible_types():
-            # ex: checking that class_type=Path is subclass of annotation=list[Path] <=> subtype=Path
-            if origin is tuple and isinstance(subtype, list):
-                # ex. tuple[int, int] -> origin = tuple, subtype = [int, int]
-                if get_origin(class_type) is tuple \
-                        and all(subt1 is subt2 for subt1, subt2 in zip(get_args(class_type), subtype)):
-                    return True
-                continue
-            elif get_origin(subtype):
-                pass  # ex. tuple in `list[tuple[str, str]]`, not implemented
-            elif isinstance(class_type, tuple):  # (PosixPath, Path)
-                if any(subclass_matches_annotation(ct, subtype) for ct in class_type):
-                    return True
-            elif subclass_matches_annotation(class_type, subtype):  # tuple
-                return True
-        return False
+        return is_subclass(self.annotation, class_type)
 
     def _get_possible_types(self) -> list[tuple[type | None, type | list[type]]]:
         """ Possible types we can cast the value to.
@@ -458,23 +564,7 @@ class Tag:
 
         Filters out None.
         """
-        def _(annot):
-            if origin := get_origin(annot):  # list[str] -> list, list -> None
-                subtype = get_args(annot)  # list[str] -> (str,), list -> ()
-                if origin in [UnionType, Union]:  # ex: `int | None`, `list[int] | None`, `Optional[list[int]]`
-                    return [_(subt) for subt in subtype]
-                if origin is tuple:
-                    return origin, list(subtype)
-                elif (len(subtype) == 1):
-                    return origin, subtype[0]
-                else:
-                    warn(f"This parametrized generic not implemented: {annot}")
-            elif annot is not None and annot is not NoneType:
-                # from UnionType, we get a NoneType
-                return None, annot
-            return False  # to be filtered out
-        out = _(self.annotation)
-        return [x for x in (out if isinstance(out, list) else [out]) if x is not False]
+        return get_possible_types(self.annotation)
 
     def _src_obj_add(self, src):
         if self._src_obj is None:
@@ -554,22 +644,25 @@ class Tag:
                 continue
         return self.val
 
-    def _validate(self, out_value: TagValue) -> TagValue:
+    def _validate(self, out_value: TagValue, checked: Optional[Future] = None) -> TagValue:
         """ Runs
             * self.validation callback
             * pydantic validation
             * annotation type validation
 
+        Args:
+            checked: The result of self._check if it has already run concurrently.
+
         Returns:
             If succeeded, return the (possibly transformed) value.
 
         Raises:
             ValueError: If failed, raises ValueError.
         """
-        if self.validation:
+        if checked or self.validation or self._is_blocking():
             last = self.val
             self.val = out_value
-            res = self.validation(self)
+            res = checked.result() if checked else self._check()
             if isinstance(res, tuple):
                 passed, out_value = res
                 self.val = out_value
@@ -582,18 +675,16 @@ class Tag:
 
         # pydantic_check
         if self._pydantic_field:
+            pydantic = get_integration("pydantic")
             try:
-                create_model('ValidationModel', check=(self.annotation, self._pydantic_field))(check=out_value)
-            except PydanticValidationError as e:
+                _get_validation_model(_pydantic_model, self.annotation, self._pydantic_field)(check=out_value)
+            except pydantic.ValidationError as e:
                 self.set_error_text(e.errors()[0]["msg"])
                 raise ValueError
         # attrs check
         if self._attrs_field:
             try:
-                attr.make_class(
-                    'ValidationModel',
-                    {"check": attr.ib(validator=self._attrs_field.validator)}
-                )(check=out_value)
+                _get_validation_model(_attrs_model, self._attrs_field.validator)(check=out_value)
             except ValueError as e:
                 self.set_error_text(str(e))
                 raise
@@ -626,75 +717,87 @@ class Tag:
         Returns:
             bool, whether the value is alright or whether the revision is needed.
         """
-        self.remove_error_text()
-        out_value = ui_value  # The proposed value, with fixed type.
+        if self.annotation == TagCallback and isinstance(ui_value, str):
+            self.remove_error_text()
+            return True  # NOTE, EXPERIMENTAL
+        try:
+            out_value = self._convert(ui_value)
+        except ValueError:
+            return False
+        return self._apply(ui_value, out_value)
 
+    def _convert(self, ui_value: UiValue) -> TagValue:
+        """ The proposed value, with fixed type.
+
+        Raises:
+            ValueError: Not convertible, the error text is set.
+        """
+        self.remove_error_text()
         # Type conversion
         # Even though an interface might do some type conversion (str → int) independently,
         # other interfaces does not guarantee that. Hence, we need to do the type conversion too.
         # When the ui_value is not a str, it seems the interface did retain the original type
         # and no conversion is needed.
         if self.annotation and isinstance(ui_value, str):
-            if self.annotation == TagCallback:
-                return True  # NOTE, EXPERIMENTAL
-            if ui_value == "" and NoneType in get_args(self.annotation):
-                # The user is not able to set the value to None, they left it empty.
-                # Cast back to None as None is one of the allowed types.
-                # Ex: `severity: int | None = None`
-                out_value = None
-            elif self.annotation == Optional[int]:
-                try:
-                    out_value = int(ui_value)
-                except (ValueError, TypeError):
-                    pass
-            elif self.annotation in common_iterables:
-                # basic support for iterables, however, it will not work for custom subclasses of these built-ins
-                try:
-                    out_value = literal_eval(ui_value)
-                except (SyntaxError, ValueError):
-                    self.set_error_text(f"Not a valid {self._repr_annotation()}")
-                    return False
-            elif self._is_subclass((time, date)):
-                try:
-                    out_value = self.annotation.fromisoformat(ui_value)
-                except ValueError:
-                    pass
-
-            if not self._is_right_instance(out_value) and isinstance(out_value, str):
-                try:
-                    for origin, cast_to in self._get_possible_types():
-                        try:
-                            if origin:
-                                # Textual ask_number -> user writes '123', this has to be converted to int 123
-                                # NOTE: Unfortunately, type(list) looks awful here. @see TextualInterface.form comment.
-                                # (Maybe that's better now.)
-                                if isinstance(cast_to, list):
-                                    # this is a tuple, tuple returns a list, each value is converted to another type
-                                    candidate = origin(cast_to_(v)
-                                                       for cast_to_, v in zip(cast_to, literal_eval(ui_value)))
-                                else:
-                                    candidate = origin(cast_to(v) for v in literal_eval(ui_value))
-                            else:
-                                candidate = cast_to(ui_value)
-                        except (TypeError, ValueError, SyntaxError):
-                            continue
-                        if self._is_right_instance(candidate):
-                            out_value = candidate
-                            break
-                    else:
-                        out_value = self.annotation(ui_value)
-                except (TypeError, ValueError, SyntaxError):
-                    # Automatic conversion failed
-                    pass
+            try:
+                # The type reflection is done once per annotation, see the converter module.
+                return get_converter(self.annotation)(ui_value)
+            except ValueError:
+                self.set_error_text(f"Not a valid {self._repr_annotation()}")
+                raise
+        return ui_value
 
+    def _apply(self, ui_value: UiValue, out_value: TagValue, checked: Optional[Future] = None) -> bool:
+        """ Validate the proposed value and confirm it. See self._validate for the `checked`. """
         # User and type validation check
         try:
-            self.val = self._validate(out_value)   # checks succeeded, confirm the value
+            self.val = self._validate(out_value, checked)   # checks succeeded, confirm the value
         except ValueError:
             return False
         self._update_source(out_value)
+        self._validated = ui_value, self.val
         return True
 
+    def _check(self) -> ValidationResult | tuple[ValidationResult, TagValue]:
+        """ The part of the validation that might take long, it runs concurrently for a blocking tag.
+        It reads the proposed value as self.val and must not change the tag, self._validate applies the result. """
+        return self._call_validation() if self.validation else True
+
+    def _call_validation(self) -> ValidationResult | tuple[ValidationResult, TagValue]:
+        """ Runs the validation callback. An async one runs in its own event loop,
+        one with a timeout is given up after the timeout (and then fails). """
+        validation = self.validation
+        timeout = getattr(validation, "timeout", None)
+        if iscoroutinefunction(validation):
+            f = lambda: asyncio.run(validation(self))
+        elif timeout is None:
+            return validation(self)
+        else:
+            f = lambda: validation(self)
+        if getattr(_worker, "is_worker", False):
+            # Already off the caller thread (no event loop running here). Submitting again to the executor
+            # might exhaust the workers, hence the submit itself waits for this with the timeout.
+            return f()
+        # Another thread as there might be an event loop already running in this one (ex. Textual).
+        return _wait(_get_validation_executor().submit(f), timeout, lambda: _timed_out(timeout))
+
+    def _is_blocking(self) -> bool:
+        """ Whether the validation might take long (ex. accessing a network disk), hence the submit runs it concurrently. """
+        validation = self.validation
+        return validation is not None and (getattr(validation, "blocking", False) or iscoroutinefunction(validation))
+
+    def _is_validated(self, ui_value: UiValue) -> bool:
+        """ Whether the UI value has already passed the validation and the tag value has not changed since.
+        Then, a form revision does not need to convert and validate it again.
+        A validation that reads other fields is always re-run. """
+        if (validated := self._validated) is None or validated[1] is not self.val or self._error_text is not None \
+                or getattr(self.validation, "cross_field", False):
+            return False
+        try:
+            return type(validated[0]) is type(ui_value) and bool(validated[0] == ui_value)
+        except (TypeError, ValueError):  # ex. an ambiguous comparison
+            return False
+
     def _update_source(self, out_value):
         # Store to the source user data
         if self._src_dict:
@@ -739,14 +842,14 @@ class Tag:
         """ Returns whether the form is alright or whether we should revise it.
         Input is tuple of the Tags and their new values from the UI.
         """
-        # Why list? We need all the Tag values be updated from the UI.
-        # If the revision is needed, the UI fetches the values from the Tag.
-        # We need the keep the values so that the user does not have to re-write them.
-        return all(list(tag.update(ui_value) for tag, ui_value in updater))
+        submission = _Submission(updater)
+        submission.wait()
+        return submission.finish()
 
     @staticmethod
-    def _submit(fd: "TagDict", ui: dict):
+    def _submit(fd: "TagDict | FlatForm", ui: dict | list):
         """ Returns whether the form is alright or whether we should revise it.
-        Input is the TagDict and the UI dict in the very same form.
+        Input is the TagDict (or its FlatForm) and the UI dict in the very same form (or the list of the UI values).
         """
-        return Tag._submit_values(zip(flatten(fd), flatten(ui)))
+        from ..form_dict import FlatForm
+        return Tag._submit_values((fd if isinstance(fd, FlatForm) else FlatForm(fd)).zip(ui))
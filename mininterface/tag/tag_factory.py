@@ -1,12 +1,17 @@
 from copy import copy
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import date, time
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Type, get_type_hints
+from types import SimpleNamespace
+from typing import Any, Optional, Type, get_type_hints
 
 from . import DatetimeTag, SelectTag, Tag
 from .callback_tag import CallbackTag
+from .converter import _cached, is_subclass
 from .path_tag import PathTag
+from .tag import guess_annotation
 from .type_stubs import TagCallback
 
 
@@ -17,29 +22,150 @@ def _get_annotation_from_class_hierarchy(cls, key):
     return None
 
 
-def get_type_hint_from_class_hierarchy(cls, key):
+def get_type_hint_from_class_hierarchy(cls, key, _hints: Optional[dict] = None):
+    """ The type hint of the key, searched in the class hierarchy.
+
+    Args:
+        _hints: Cache of the `get_type_hints` per class, filled on the way.
+    """
     for base in cls.__mro__:
-        hints = get_type_hints(base)
+        if _hints is None:
+            hints = get_type_hints(base)
+        elif (hints := _hints.get(base)) is None:
+            hints = _hints[base] = get_type_hints(base)
         if key in hints:
             return hints[key]
     return None
 
 
-def _get_tag_type(tag: Tag) -> Type[Tag]:
-    """ Return the most specific Tag child that a tag value can be expressed with.
-        Ex. Return PathTag for a Tag having a Path as a value.
+@dataclass
+class FieldSchema:
+    """ How to build the tag of a class field. Resolved once per field. """
+
+    annotation: Any
+    """ The type hint, ex. `list[Path]` from `Annotated[list[Path], ...]`. """
+
+    field_type: Any = None
+    """ The raw annotation, ex. `Annotated[list[Path], ...]`. """
+
+    metadata: Optional[Tag] = None
+    """ The Tag from the `Annotated` metadata, a template for the field tag. """
+
+    def make_tag(self, val, description, *args, **kwargs) -> Tag:
+        """ Bind the current value. """
+        annotation = self.annotation
+        if annotation is TagCallback:
+            return CallbackTag(val, description, *args, **kwargs)
+        if self.metadata:
+            # The type of the Tag is another Tag
+            # Ex: `my_field: Validation(...) = 4`
+            new = copy(self.metadata)
+            new.val = val if val is not None else new.val
+            new.description = description or new.description
+            if new.annotation is None:
+                # Annotated[ **origin** list[Path], Tag(...)]
+                new.annotation = annotation or self.field_type.__origin__
+            # Annotated[date, Tag(name="hello")] = datetime.fromisoformat(...) -> DatetimeTag(date=True)
+            return tag_assure_type(new._fetch_from(_tag_source(*args, **kwargs)))
+        return new_tag(val, description, annotation, *args, **kwargs)
+
+
+@dataclass
+class FormSchema:
+    """ The compiled form of a class (dataclass, pydantic model, attrs).
+
+    Resolving the type hints and the `Annotated` metadata is expensive (`get_type_hints` per base class),
+    hence it is done just once per field. Building a form of the same class again just binds the current values.
+    """
+
+    cls: type
+    fields: dict[str, FieldSchema] = field(default_factory=dict)
+    _hints: dict[type, dict] = field(default_factory=dict)
+    """ The type hints of the classes in the hierarchy. """
+
+    def field(self, key: str) -> FieldSchema:
+        """ The field schema, resolved on the first use. """
+        try:
+            return self.fields[key]
+        except KeyError:
+            pass
+        # We now have annotation from `field: list[Path]` or `field: Annotated[list[Path], ...]`.
+        # But there might be still a better annotation in metadata `field: Annotated[list[Path], Tag(...)]`.
+        f = FieldSchema(get_type_hint_from_class_hierarchy(self.cls, key, self._hints))
+        if f.annotation is not TagCallback and (field_type := _get_annotation_from_class_hierarchy(self.cls, key)):
+            f.field_type = field_type
+            for metadata in getattr(field_type, '__metadata__', ()):
+                if isinstance(metadata, Tag):  # NOTE might fetch from a pydantic model too
+                    f.metadata = metadata
+                    break
+        self.fields[key] = f
+        return f
+
+
+@lru_cache(maxsize=1024)
+def get_form_schema(cls: type) -> FormSchema:
+    """ The compiled form, shared by all the forms of the class. """
+    return FormSchema(cls)
+
+
+@_cached
+def get_tag_type(annotation) -> Optional[Type[Tag]]:
+    """ The most specific Tag child that a value of the annotation can be expressed with.
+        Ex. Return PathTag for a Path. None if there is no specific child.
+        (The dispatch table, computed once per annotation.)
     """
-    if tag._is_subclass(Path):
+    if is_subclass(annotation, Path):
         return PathTag
-    if tag._is_subclass(date) or tag._is_subclass(time):
+    if is_subclass(annotation, date) or is_subclass(annotation, time):
         return DatetimeTag
-    if tag._is_subclass(Enum):
+    if is_subclass(annotation, Enum):
         return SelectTag
-    return type(tag)
+    return None
+
+
+def _get_tag_type(tag: Tag) -> Type[Tag]:
+    """ Return the most specific Tag child that a tag value can be expressed with.
+        Ex. Return PathTag for a Tag having a Path as a value.
+    """
+    return get_tag_type(tag.annotation) or type(tag)
+
+
+def new_tag(val=None, description=None, annotation=None, *args, **kwargs) -> Tag:
+    """ Construct the tag directly as the most specific Tag child, chosen by the annotation
+    (or by the value if there is no annotation).
+    Unlike `tag_assure_type(Tag(...))`, no intermediate Tag is constructed. """
+    if isinstance(val, Tag):  # the nested tag brings its own annotation, known after the construction
+        return tag_assure_type(Tag(val, description, annotation, *args, **kwargs))
+    if not annotation and val is not None:
+        annotation = guess_annotation(val)
+    if (type_ := get_tag_type(annotation)) is None:
+        return Tag(val, description, annotation, *args, **kwargs)
+    if not args and not kwargs.get("name") and kwargs.get("_src_key"):
+        # Tag would take the name from the key, whereas SelectTag keeps just an explicit name.
+        kwargs["name"] = kwargs["_src_key"]
+    return type_(val, description, annotation, *args, **kwargs)
+
+
+_TAG_DEFAULTS = {f.name: f.default for f in fields(Tag) if f.init and f.default is not MISSING}
+""" The defaults of the Tag init fields. """
+
+
+def _tag_source(*args, **kwargs):
+    """ The attributes `Tag(*args, **kwargs)` would offer to `Tag._fetch_from`,
+    without constructing the throwaway tag (with its post init, type guessing and integrations lookup). """
+    if args or kwargs.get("val") is not None:
+        return Tag(*args, **kwargs)
+    src = SimpleNamespace(**(_TAG_DEFAULTS | kwargs))
+    if not src.name:
+        src.name = src._src_key
+    src._original_desc = src.description
+    src._original_name = src.name
+    src.original_val = src.val
+    return src
 
 
 def tag_fetch(tag: Tag, ref: dict | None, name: str):
-    return tag._fetch_from(Tag(**ref), name)
+    return tag._fetch_from(_tag_source(**ref), name)
 
 
 def tag_assure_type(tag: Tag):
@@ -47,7 +173,7 @@ def tag_assure_type(tag: Tag):
     if (type_ := _get_tag_type(tag)) is not Tag and not isinstance(tag, type_):
         # I cannot use type_._fetch_from(tag) here as SelectTag.__post_init__
         # needs the self.val which would not be yet set.
-        return type_(**tag.__dict__)
+        return type_(**{f.name: getattr(tag, f.name) for f in fields(tag) if f.init})
     return tag
 
 
@@ -60,28 +186,6 @@ def tag_factory(val=None, description=None, annotation=None, *args, _src_obj=Non
         else:
             _src_class = _src_obj.__class__
     kwargs |= {"_src_obj": _src_obj, "_src_key": _src_key, "_src_class": _src_class}
-    if _src_class:
-        if not annotation:  # when we have _src_class, we assume to have _src_key too
-            annotation = get_type_hint_from_class_hierarchy(_src_class, _src_key)
-            if annotation is TagCallback:
-                return CallbackTag(val, description, *args, **kwargs)
-            else:
-                # We now have annotation from `field: list[Path]` or `field: Annotated[list[Path], ...]`.
-                # But there might be still a better annotation in metadata `field: Annotated[list[Path], Tag(...)]`.
-                field_type = _get_annotation_from_class_hierarchy(_src_class, _src_key)
-                if field_type:
-                    if hasattr(field_type, '__metadata__'):
-                        for metadata in field_type.__metadata__:
-                            if isinstance(metadata, Tag):  # NOTE might fetch from a pydantic model too
-                                # The type of the Tag is another Tag
-                                # Ex: `my_field: Validation(...) = 4`
-
-                                new = copy(metadata)
-                                new.val = val if val is not None else new.val
-                                new.description = description or new.description
-                                if new.annotation is None:
-                                    # Annotated[ **origin** list[Path], Tag(...)]
-                                    new.annotation = annotation or field_type.__origin__
-                                # Annotated[date, Tag(name="hello")] = datetime.fromisoformat(...) -> DatetimeTag(date=True)
-                                return tag_assure_type(new._fetch_from(Tag(*args, **kwargs)))
-    return tag_assure_type(Tag(val, description, annotation, *args, **kwargs))
+    if _src_class and not annotation:  # when we have _src_class, we assume to have _src_key too
+        return get_form_schema(_src_class).field(_src_key).make_tag(val, description, *args, **kwargs)
+    return new_tag(val, description, annotation, *args, **kwargs)
@@ -4,9 +4,9 @@ from pprint import pprint
 from typing import TYPE_CHECKING, Type, TypeVar
 
 from ..exceptions import Cancelled, InterfaceNotAvailable
-from ..form_dict import DataClass, EnvClass, FormDict, tag_assure_type
+from ..form_dict import DataClass, EnvClass, FormDict, new_tag
 from ..mininterface import Mininterface
-from ..tag.tag import Tag, TagValue
+from ..tag.tag import TagValue
 from .adaptor import TextAdaptor
 
 if TYPE_CHECKING:  # remove the line as of Python3.11 and make `"Self" -> Self`
@@ -89,7 +89,7 @@ class TextInterface(AssureInteractiveTerminal, Mininterface):
                 except EOFError:
                     raise Cancelled(".. cancelled")
                 # try:
-                t = tag_assure_type(Tag(txt, annotation=annotation))
+                t = new_tag(txt, annotation=annotation)
                 if t.update(txt):
                     return t.val
                 else:
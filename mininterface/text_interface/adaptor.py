@@ -4,7 +4,6 @@ from simple_term_menu import TerminalMenu
 
 from ..tag.select_tag import SelectTag
 
-from ..auxiliary import flatten
 from ..exceptions import Cancelled
 from ..form_dict import TagDict
 from ..mininterface import Tag
@@ -25,6 +24,9 @@ class TextAdaptor(BackendAdaptor):
     facet: TextFacet
     settings: TextSettings
 
+    PAGE = 20
+    """ Number of the options shown at once. Above that, the options are paged and searchable. """
+
     def widgetize(self, tag: Tag, only_label=False):
         """ Represent Tag in a text form """
 
@@ -39,6 +41,11 @@ class TextAdaptor(BackendAdaptor):
 
         match tag:
             # NOTE: PathTag, DatetimeTag not implemented
+            case SelectTag() if tag._is_lazy() or tag._count_options() > self.PAGE:
+                if only_label:
+                    keys = tag._get_selected_keys() if tag.multiple else tag._get_selected_key()
+                    return keys or f"({tag._count_options()} options)"
+                return self._choose_paged(tag)
             case SelectTag():
                 options, values = zip(*((label + (" <--" if tip else " "), v)
                                         for label, v, tip, _ in tag._get_options(delim=" - ")))
@@ -97,7 +104,7 @@ class TextAdaptor(BackendAdaptor):
                 self._run_dialog(form, title, submit)
             except Submit:
                 pass
-            if not Tag._submit_values((tag, tag.val) for tag in flatten(form)) or not self.submit_done():
+            if not Tag._submit_values((tag, tag.val) for tag in self.facet._flat) or not self.submit_done():
                 continue
             break
         return form
@@ -140,6 +147,45 @@ class TextAdaptor(BackendAdaptor):
                 break
         return form
 
+    def _choose_paged(self, tag: SelectTag):
+        """ Choose from the many options, page by page or from the search results. """
+        offset, query = 0, ""
+        selected = list(tag.val) if tag.multiple else None
+        while True:
+            rows = tag._get_page(offset, self.PAGE, query)
+            total = tag._count_options(query)
+            actions = []
+            if tag.multiple:
+                actions.append(("ok", None))
+            actions.append((f"search{f' (now: {query})' if query else ''}", "search"))
+            if offset:
+                actions.append(("previous page", -self.PAGE))
+            if offset + self.PAGE < total:
+                actions.append(("next page", self.PAGE))
+
+            items = [label + (" <--" if tip else " ") for label, _, tip, _ in rows]
+            if tag.multiple:
+                items = [("[x] " if v in selected else "[ ] ") + item for item, (_, v, *_) in zip(items, rows)]
+            title = f"{tag.name or ''} ({offset + 1}–{offset + len(rows)} of {total})" if rows else "Nothing found"
+            index = self._choose([label for label, _ in actions] + items, title=title)
+
+            if index >= len(actions):
+                value = rows[index - len(actions)][1]
+                if not tag.multiple:
+                    return value
+                if value in selected:
+                    selected.remove(value)
+                else:
+                    selected.append(value)
+                continue
+            match actions[index][1]:
+                case None:
+                    return selected
+                case "search":
+                    query, offset = self.interface.ask("Search"), 0
+                case shift:
+                    offset += shift
+
     def _choose(self, items: list, title=None, append_ok=False, multiple: bool = False) -> int | tuple[int]:
         it = items
         kwargs = {}
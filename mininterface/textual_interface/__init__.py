@@ -39,3 +39,7 @@ class TextualInterface(RichUiMixin, Redirectable, Mininterface):
             # non-terminal (cron) -> Mininterface
             raise InterfaceNotAvailable
         super().__init__(*args, **kwargs)
+
+    def __exit__(self, *args):
+        self._adaptor.end_session()
+        super().__exit__(*args)
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Any, Iterable
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
 from textual.widget import Widget
 from textual.widgets import Label, RadioButton, Rule
 
@@ -21,9 +22,9 @@ from ..tag.secret_tag import SecretTag
 from ..tag.internal import (BoolWidget, CallbackButtonWidget,
                             SubmitButtonWidget)
 from .facet import TextualFacet
-from .file_picker_input import FilePickerInputFactory
+from .file_picker_input import DirCache, FilePickerInputFactory
 from .textual_app import TextualApp
-from .widgets import (TagWidget, MyButton, MyCheckbox, MyInput, MyRadioSet, MyRadioButton, MySelectionList,
+from .widgets import (TagWidget, MyButton, MyCheckbox, MyInput, MyOptionList, MyRadioSet, MyRadioButton, MySelectionList,
                       MySubmitButton)
 
 if TYPE_CHECKING:
@@ -44,6 +45,10 @@ class TextualAdaptor(BackendAdaptor):
         self.app: TextualApp | None = None
         self.layout_elements = []
         self.button_app: ButtonAppType = False
+        self._session: Optional[tuple[asyncio.AbstractEventLoop, asyncio.Task]] = None
+        """ The event loop and the task of the app kept running between the dialogs. """
+        self.dir_cache = DirCache()
+        """ The directory listings of the file picker. """
 
     def widgetize(self, tag: Tag) -> Widget | TagWidget:
         """ Wrap Tag to a textual widget. """
@@ -52,6 +57,8 @@ class TextualAdaptor(BackendAdaptor):
 
         match tag:
             # NOTE: DatetimeTag not implemented
+            case SelectTag() if tag._is_lazy() or tag._count_options() >= self.settings.search_since:
+                o = MyOptionList(tag)
             case SelectTag():
                 if tag.multiple:
                     selected = set(tag.val)
@@ -101,8 +108,7 @@ class TextualAdaptor(BackendAdaptor):
 
     def buttons(self, text: str, buttons: list[tuple[str, Any]], focused: int = 1):
         self._build_buttons(text, buttons, focused)
-        self.app = app = TextualApp(self, False)
-        if not app.run():
+        if not self._run_app(False):
             raise Cancelled
         return self._get_buttons_val()
 
@@ -117,6 +123,15 @@ class TextualAdaptor(BackendAdaptor):
                 return button.tag.val
         raise Cancelled
 
+    def _call_later(self, delay: float, f: Callable[[], None]):
+        return self.app.set_timer(delay, f).stop
+
+    def _call_from_thread(self, f: Callable[[], None]):
+        try:
+            self.app.call_from_thread(f)
+        except RuntimeError:
+            pass  # the app is not running anymore, the result is stale
+
     def _try_submit(self, vals):
         # return not Tag._submit_values(vals) or not self.submit_done()
         return Tag._submit_values(vals) and self.submit_done()
@@ -124,23 +139,70 @@ class TextualAdaptor(BackendAdaptor):
     def run_dialog(self, form: TagDict, title: str = "", submit: bool | str = True) -> TagDict:
         self.button_app: ButtonAppType = False
         super().run_dialog(form, title, submit)
-        # Unfortunately, there seems to be no way to reuse the app.
-        # Which blocks using multiple form external .form() calls from the web interface.
-        # Textual cannot run in a thread, it seems it cannot run in another process, self.suspend() is of no use.
-        self.app = app = TextualApp(self, submit)
-        if title:
-            app.title = title
-
-        if not app.run():
+        if not self._run_app(submit, title):
             raise Cancelled
+        app = self.app
 
         # validate and store the UI value → Tag value → original value
-        vals = self._serialize_vals(app)
-
-        if not self._try_submit(vals):
+        if app.validated is None:
+            submitted = self._try_submit(self._serialize_vals(app))
+        else:  # the blocking validations have run in the app
+            submitted = app.validated and self.submit_done()
+        if not submitted:
             return self.run_dialog(form, title, submit)
 
         return form
 
+    def _run_app(self, submit: str | bool, title: str = "") -> bool | None:
+        """ Show the dialog and return whether it was submitted.
+
+        Within the with statement, the app is kept running between the dialogs (the terminal setup,
+        the stylesheet and the driver start happen just once). Textual cannot run in a thread,
+        hence the app runs in an event loop of our own, driven just while a dialog is shown.
+        Between the dialogs, the app is suspended, the terminal is given back.
+        """
+        if not self.interface._always_shown:
+            self.end_session()
+            self.app = app = TextualApp(self, submit)
+            if title:
+                app.title = title
+            return app.run()
+
+        dialog: asyncio.Future
+        if self._session:
+            loop, task = self._session
+            dialog = loop.create_future()
+            self.app.call_later(self.app.start_dialog, submit, title, dialog)
+        else:
+            loop = asyncio.new_event_loop()
+            self.app = app = TextualApp(self, submit)
+            if title:
+                app.title = title
+            app._dialog = dialog = loop.create_future()
+            task = loop.create_task(app.run_async())
+            self._session = loop, task
+        loop.run_until_complete(asyncio.wait((dialog, task), return_when=asyncio.FIRST_COMPLETED))
+        if not dialog.done():  # the app has ended (ex. crashed)
+            self.end_session()
+            return None
+        return dialog.result()
+
+    def end_session(self):
+        """ Exit the app kept running between the dialogs. """
+        if self._session:
+            loop, task = self._session
+            self._session = None
+            if not task.done():
+                self.app.exit()
+            try:
+                loop.run_until_complete(task)
+            finally:
+                loop.close()
+
     def _serialize_vals(self, app: TextualApp) -> ValsType:
-        return ((field.tag, field.get_ui_value()) for field in app.widgets if isinstance(field, TagWidget))
+        vals = ((field.tag, field.get_ui_value()) for field in app.widgets if isinstance(field, TagWidget))
+        if len(self.facet._flat) < self.settings.virtualize_since:
+            return vals
+        # A large form is mounted lazily, the values of the fields not mounted stay in their tags.
+        ui = {id(tag): ui_val for tag, ui_val in vals}
+        return ((tag, ui.get(id(tag), tag.val)) for tag in self.facet._flat)
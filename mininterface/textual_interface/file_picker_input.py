@@ -1,11 +1,18 @@
+import os
+from bisect import bisect_left
+from collections import OrderedDict
+from heapq import merge
+from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING
+from threading import Lock
+from typing import TYPE_CHECKING, Optional
 
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Button, Input, Tree, Static
-from textual.widgets.tree import TreeNode
+from textual.widgets.tree import NodeID, TreeNode
+from textual.worker import Worker, get_current_worker
 
 
 from ..tag.path_tag import PathTag
@@ -15,6 +22,53 @@ if TYPE_CHECKING:
     from .adaptor import TextualAdaptor
 
 
+Listing = list[tuple[str, bool]]
+""" Directory entries (name, is directory), directories first, sorted by name. Hidden ones are skipped. """
+
+
+class DirCache:
+    """ The directory listings of a session. A listing is reused till the directory mtime changes. """
+
+    SIZE = 256
+    """ Directories kept, the least recently used are dropped. """
+
+    def __init__(self):
+        self._listings: OrderedDict[str, tuple[int, Listing]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, path: Path, is_cancelled=lambda: False) -> Optional[Listing]:
+        """ Scan the directory (or reuse the listing). None if cancelled meanwhile.
+
+        Raises:
+            OSError: ex. PermissionError
+        """
+        key = str(path)
+        mtime = os.stat(key).st_mtime_ns
+        with self._lock:
+            if (cached := self._listings.get(key)) and cached[0] == mtime:
+                self._listings.move_to_end(key)
+                return cached[1]
+        entries = []
+        with os.scandir(key) as it:
+            for entry in it:
+                if is_cancelled():
+                    return None
+                if entry.name.startswith('.'):
+                    continue
+                try:
+                    # NOTE: d_type is cached by scandir, no stat call is needed (except for symlinks)
+                    entries.append((entry.name, entry.is_dir()))
+                except OSError:
+                    continue
+        entries.sort(key=lambda e: (not e[1], e[0].lower()))
+        with self._lock:
+            self._listings[key] = mtime, entries
+            self._listings.move_to_end(key)
+            if len(self._listings) > self.SIZE:
+                self._listings.popitem(last=False)
+        return entries
+
+
 class FileBrowser(Vertical):
     """A file browser dialog."""
 
@@ -75,9 +129,17 @@ class FileBrowser(Vertical):
     }
     """
 
-    def __init__(self, tag: PathTag):
+    PAGE = 500
+    """ Directory entries inserted into the tree at once. (The next pages are bigger.) """
+
+    def __init__(self, tag: PathTag, cache: Optional[DirCache] = None):
         super().__init__()
         self.tag = tag
+        self.cache = cache or DirCache()
+        self._loading: dict[TreeNode, Worker] = {}
+        """ The directories being loaded. """
+        self._index: list[tuple[str, NodeID]] = []
+        """ Lowercase labels of the entries in the tree (without the emoji), sorted. For the quick search. """
         self.selected_paths = []
 
         self._start_path = self._get_start_path_from_tag()
@@ -87,7 +149,6 @@ class FileBrowser(Vertical):
         self._status = None
         self._search_prefix = ""
         self._search_timer = None
-        self._is_quick_search = False
 
     def _get_start_path_from_tag(self) -> Path:
         """Get the starting path from the tag value or fallback to home directory."""
@@ -147,43 +208,89 @@ class FileBrowser(Vertical):
 
         self._tree = Tree("")
         self._tree.root.expand()
-        try:
-            self._add_directory(self._start_path, self._tree.root)
-        except Exception as e:
-            self._tree.root.add(f"⚠️ Error: {str(e)}")
         yield self._tree
 
         self._status = Static("", id="status_bar")
         self._update_status()
         yield self._status
 
+    def on_mount(self) -> None:
+        self._add_directory(self._start_path, self._tree.root)
+
     def _add_directory(self, path: Path, node: TreeNode) -> None:
-        """Add directory contents to the tree."""
+        """Add directory contents to the tree. They are loaded in a background thread."""
+        self._cancel_loading(node)
+        self._loading[node] = self.run_worker(lambda: self._load_directory(path, node),
+                                              group="listing", thread=True, exit_on_error=False)
+
+    def _load_directory(self, path: Path, node: TreeNode) -> None:
+        """ Runs in the worker thread. The entries are inserted page by page so that the UI stays responsive. """
+        worker = get_current_worker()
         try:
-            paths = sorted(
-                path.iterdir(),
-                key=lambda p: (not p.is_dir(), p.name.lower())
-            )
-
-            for item in paths:
-                if item.name.startswith('.'):
-                    continue
-
-                try:
-                    if item.is_dir():
-                        branch = node.add(f"📁 {item.name}", data=item, expand=False)
-                        if next(item.iterdir(), None) is not None:
-                            branch.add("Loading...")
-                    else:
-                        if not self.tag.is_dir:
-                            node.add(f"📄 {item.name}", data=item)
-                except PermissionError:
-                    continue
-
+            entries = self.cache.get(path, lambda: worker.is_cancelled)
         except PermissionError:
-            node.add("⚠️ Permission denied")
+            entries, error = None, "⚠️ Permission denied"
         except Exception as e:
-            node.add(f"⚠️ Error: {str(e)}")
+            entries, error = None, f"⚠️ Error: {str(e)}"
+        if worker.is_cancelled:
+            return
+        if entries is None:
+            self.app.call_from_thread(self._add_entries, node, [], worker, error)
+            return
+        if self.tag.is_dir:
+            entries = [e for e in entries if e[1]]
+        # The tree re-renders all its lines after an insertion, hence the pages grow.
+        # The first entries are displayed soon, while the large directory is not re-rendered too many times.
+        i, size = 0, self.PAGE
+        while i < len(entries):
+            if worker.is_cancelled:
+                return
+            self.app.call_from_thread(self._add_entries, node, entries[i:i + size], worker)
+            i, size = i + size, size * 2
+        if not entries:
+            self.app.call_from_thread(self._add_entries, node, [], worker)
+
+    def _add_entries(self, node: TreeNode, entries: Listing, worker: Worker, error: str = "") -> None:
+        if worker.is_cancelled:  # ex. the node has collapsed meanwhile
+            return
+        path = node.data or self._start_path
+        if not node.children or node.children[0].data is None:  # the first page replaces the "Loading..." placeholder
+            self._remove_children(node)
+        if error:
+            node.add(error)
+        page = []
+        for name, is_dir in entries:
+            if is_dir:
+                # NOTE: We do not check if the directory is empty, it would cost a directory read.
+                child = node.add(f"📁 {name}", data=path / name, expand=False)
+                child.add("Loading...")
+            else:
+                child = node.add(f"📄 {name}", data=path / name)
+            page.append((name.lower(), child.id))
+        page.sort()
+        index = self._index
+        if not index or not page or index[-1] <= page[0]:  # ex. the next page of a single directory
+            index.extend(page)
+        else:
+            index[:] = merge(index, page)
+
+    def _remove_children(self, node: TreeNode) -> None:
+        """ Remove the children from the tree and from the index. """
+        removed = set()
+        stack = list(node.children)
+        while stack:
+            child = stack.pop()
+            removed.add(child.id)
+            stack.extend(child.children)
+        if removed:
+            self._index[:] = (entry for entry in self._index if entry[1] not in removed)
+        node.remove_children()
+
+    def _cancel_loading(self, node: Optional[TreeNode] = None) -> None:
+        """ Cancel loading the node or all the nodes. """
+        for n in [node] if node else list(self._loading):
+            if worker := self._loading.pop(n, None):
+                worker.cancel()
 
     def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
         """Called when a node is expanded."""
@@ -191,9 +298,13 @@ class FileBrowser(Vertical):
         if not node.data:
             return
 
-        node.remove_children()
+        self._remove_children(node)
+        node.add("Loading...")
         self._add_directory(node.data, node)
 
+    def on_tree_node_collapsed(self, event: Tree.NodeCollapsed) -> None:
+        self._cancel_loading(event.node)
+
     def action_select(self) -> None:
         """Select the currently focused node."""
         if self._tree and self._tree.cursor_node:
@@ -216,45 +327,45 @@ class FileBrowser(Vertical):
         key = event.key
         if len(key) == 1 and key.isprintable():
             self._search_prefix += key
+            if self._search_timer:
+                self._search_timer.stop()
             self._search_timer = self.set_timer(1.0, self._reset_search)
             self._find_matching_node()
             self._update_status()
 
     def _find_matching_node(self) -> None:
-        """Find and focus the first node that starts with the search prefix without triggering selection."""
+        """Find and focus a node that starts with the search prefix without triggering selection.
+        The first matching node (in the name order) at or after the cursor is taken,
+        or the first matching one if there is none. (When the prefix grows, the node at the cursor may still match.)"""
         if not self._tree or not self._search_prefix:
             return
 
-        def walk_nodes(node, depth=0):
-            """Walk through nodes in a depth-first manner, yielding nodes in display order."""
-            if depth > 0:  # Skip the root node
-                yield node
-            for child in node.children:
-                yield from walk_nodes(child, depth + 1)
-
-        # Get all nodes in display order (excluding the root)
-        nodes = list(walk_nodes(self._tree.root))
-
-        # Find the first matching node
-        for node in nodes:
-            label = node.label.plain
-            if label.startswith(("📁", "📄")):
-                label = label[2:].strip()
-
-            if label.lower().startswith(self._search_prefix.lower()):
-                # set the flag to indicate this is a quick search focus change
-                self._is_quick_search = True
-                self._tree.select_node(node)
-                self._tree.scroll_to_node(node)
-                self._is_quick_search = False
+        tree = self._tree
+        prefix = self._search_prefix.lower()
+        lo = bisect_left(self._index, (prefix,))
+        hi = bisect_left(self._index, (prefix + "\U0010ffff",), lo)
+        if lo == hi:
+            return
+
+        tree.last_line  # the node lines are built lazily, assure they are up to date
+        cursor = tree.cursor_line if tree.cursor_line >= 0 else -1
+        start = cursor if len(prefix) > 1 else cursor + 1
+        first = None
+        for _, node_id in islice(self._index, lo, hi):
+            line = (node := tree.get_node_by_id(node_id)).line
+            if line < 0:  # in a collapsed directory
+                continue
+            if line >= start:
                 break
+            first = first or node
+        else:
+            node = first  # wrap around
+        if node:
+            # NOTE: select_node would post NodeSelected, choosing the file
+            tree.move_cursor(node)
 
     def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
         """Called when a node is selected."""
-        # Skip selection logic if this is a quick search focus change
-        if self._is_quick_search:
-            return
-
         node = event.node
         if not node.data:
             return
@@ -311,12 +422,11 @@ class FileBrowser(Vertical):
             return
 
         self._start_path = path
+        self._cancel_loading()
+        self._index.clear()  # NOTE the cleared tree reuses the node ids
         self._tree.clear()
         self._tree.root.expand()
-        try:
-            self._add_directory(path, self._tree.root)
-        except Exception as e:
-            self._tree.root.add(f"⚠️ Error: {str(e)}")
+        self._add_directory(path, self._tree.root)
 
         self._update_status()
         self.refresh()
@@ -384,7 +494,7 @@ def FilePickerInputFactory(adaptor: "TextualAdaptor", tag: PathTag, **kwargs):
             """Handle button press event."""
             if event.button.id == "file_picker":
                 if not self.browser:
-                    self.browser = FileBrowser(self.tag)
+                    self.browser = FileBrowser(self.tag, adaptor.dir_cache)
                     self.mount(self.browser)
                     self.refresh()
                     self.set_timer(0.1, self._focus_tree)
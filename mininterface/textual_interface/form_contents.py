@@ -1,13 +1,15 @@
-from typing import TYPE_CHECKING
-from ..auxiliary import flatten
-from ..form_dict import formdict_to_widgetdict
+from itertools import chain
+from typing import TYPE_CHECKING, Iterable, Optional
+from ..tag import Tag
 from .widgets import TagWidget
 
 
 from textual import events
 from textual.app import ComposeResult
-from textual.containers import VerticalScroll
-from textual.widgets import Checkbox, Footer, Header, Input, Label, RadioSet, Rule, SelectionList, Static
+from textual.containers import Vertical, VerticalScroll
+from textual.geometry import Region
+from textual.widget import Widget
+from textual.widgets import Checkbox, Collapsible, Footer, Header, Input, Label, RadioSet, Rule, SelectionList, Static
 
 if TYPE_CHECKING:
     from .adaptor import TextualAdaptor
@@ -26,14 +28,27 @@ class FormContents(Static):
         self.focused_i: int = 0
         self.adaptor = adaptor
         self.output = Static("")
+        self.groups: list[LazyGroup] = []
+        """ Used if the form is virtualized. """
+        self.tags: list[Tag] = []
+        """ The tags of the virtualized form, in the order of the form. """
+        self._positions: dict[int, tuple[LazyGroup, int]] = {}
+        """ id(tag) -> the group of the tag and its offset within. (The tags compare by value, not by identity.) """
+        self.scroll: Optional[VerticalScroll] = None
 
     def compose(self) -> ComposeResult:
         # prepare widgets
         # since textual 1.0.0 we have to build widgets not earlier than the context app is ready
 
         self.widgets.clear()
-        self.widgets.extend(flatten(formdict_to_widgetdict(
-            self.adaptor.facet._form, self.adaptor.widgetize), include_keys=self.adaptor.header))
+        self.groups.clear()
+        self.tags.clear()
+        self._positions.clear()
+        if len(self.adaptor.facet._flat) >= self.adaptor.settings.virtualize_since:
+            yield from self._compose_virtual()
+            return
+        for item in self.adaptor.facet._flat.with_sections(lambda path: self.adaptor.header(path[-1])):
+            self.widgets.append(self.adaptor.widgetize(item) if isinstance(item, Tag) else item)
 
         # there are multiple sections in the list, <hr>ed by Rule elements. However, the first takes much space.
         if len(self.widgets) and isinstance(self.widgets[0], Rule):
@@ -49,26 +64,97 @@ class FormContents(Static):
             yield Label(text, id="buffered_text")
         with VerticalScroll():
             yield from self.adaptor.layout_elements
-            for i, fieldt in enumerate(self.widgets):
-                if isinstance(fieldt, Input):
-                    yield Label(fieldt.placeholder)
-                # TODO MyRadioSet not shown now: add name in widgetize and display here
-                # NOTE: has this something to do with the PathTag?
-                elif hasattr(fieldt, "tag") and fieldt.tag.name and not isinstance(fieldt, Input):
-                    yield Label(fieldt.tag.name)
-                yield fieldt
-                if isinstance(fieldt, TagWidget) and (arb := fieldt._arbitrary):
-                    yield arb
-                if isinstance(fieldt, TagWidget) and (desc := fieldt.tag.description):
-                    yield Label(desc)
-                yield Label("")
+            for fieldt in self.widgets:
+                yield from field_rows(fieldt)
         self.focusable_.clear()
         self.focusable_.extend(w for w in self.widgets if isinstance(w, (Input, TagWidget)))
 
+    def _compose_virtual(self) -> ComposeResult:
+        """ A large form: the fields are split into groups, mounted lazily when scrolled near the viewport.
+        The sections are collapsible. The values of the fields not mounted stay in their tags. """
+        if self.title:
+            yield Header()
+        yield Footer()
+        if text := self.adaptor.interface._redirected.join():
+            yield Label(text, id="buffered_text")
+
+        # the tags divided into the sections
+        sections: list[tuple[str, list[Tag]]] = [("", [])]
+        for item in self.adaptor.facet._flat.with_sections(lambda path: [path]):
+            if isinstance(item, Tag):
+                sections[-1][1].append(item)
+            else:
+                sections.append((item[-1], []))
+
+        with VerticalScroll() as self.scroll:
+            yield from self.adaptor.layout_elements
+            for title, tags in sections:
+                if not tags:
+                    continue
+                groups = [LazyGroup(self, tags[i:i + LazyGroup.SIZE], len(self.tags) + i)
+                          for i in range(0, len(tags), LazyGroup.SIZE)]
+                self.groups.extend(groups)
+                self.tags.extend(tags)
+                for group in groups:
+                    self._positions.update((id(tag), (group, offset)) for offset, tag in enumerate(group.tags))
+                if title:
+                    # the failed fields are to be seen
+                    yield Collapsible(*groups, title=title, collapsed=not any(t._error_text for t in tags))
+                else:
+                    yield from groups
+
     def on_mount(self):
-        self.widgets[self.focused_i].focus()
+        if self.groups:
+            self.watch(self.scroll, "scroll_y", lambda _: self.mount_visible(), init=False)
+            for group in self.groups:  # the failed fields are to be seen
+                if any(tag._error_text for tag in group.tags):
+                    group.materialize()
+            self.call_after_refresh(self.mount_visible)
+            self.call_after_refresh(lambda: self.focus_tag(0))
+        else:
+            self.widgets[self.focused_i].focus()
+
+    def on_resize(self):
+        if self.groups:
+            self.call_after_refresh(self.mount_visible)
+
+    def on_collapsible_expanded(self):
+        self.call_after_refresh(self.mount_visible)
+
+    def mount_visible(self):
+        """ Mount the groups in and near the viewport (a screen above and below). """
+        viewport = self.scroll.region
+        near = Region(viewport.x, viewport.y - viewport.height, viewport.width, viewport.height * 3)
+        for group in self.groups:
+            if not group.widgets and group.region.overlaps(near):
+                group.materialize()
+
+    def _update_widgets(self):
+        """ The mounted widgets, in the order of the form. """
+        self.widgets[:] = (w for group in self.groups for w in group.widgets)
+        self.focusable_[:] = self.widgets
+
+    def focus_tag(self, index: int):
+        """ Focus the field of the tag, mount it first if needed. """
+        if not self.tags:
+            return
+        group, offset = self._positions[id(self.tags[index % len(self.tags)])]
+        if isinstance(collapsible := group.parent, Collapsible):
+            collapsible.collapsed = False
+        if not group.widgets:
+            group.materialize()
+        self.call_after_refresh(group.widgets[offset].focus)
+
+    def _focused_tag_index(self) -> Optional[int]:
+        if isinstance(ff := self.app.focused, TagWidget) or isinstance(ff := getattr(self.app.focused, "parent", None), TagWidget):
+            if position := self._positions.get(id(ff.tag)):
+                group, offset = position
+                return group.start + offset
+        return None
 
     def on_key(self, event: events.Key) -> None:
+        if self.groups:
+            return self._on_key_virtual(event)
         f = self.focusable_
         ff = self.app.focused
         try:
@@ -108,3 +194,72 @@ class FormContents(Static):
                     if str(label).casefold().startswith(letter):
                         inp_.focus()
                         break
+
+    def _on_key_virtual(self, event: events.Key) -> None:
+        """ Navigate the tags, including the ones not mounted yet. """
+        if (index := self._focused_tag_index()) is None:
+            return
+        ff = self.app.focused
+        match event.key:
+            case "down":
+                if (not isinstance(ff, RadioSet) or ff._selected == len(ff._nodes) - 1) \
+                        and not isinstance(ff, SelectionList):
+                    self.focus_tag(index + 1)
+                    event.stop()
+            case "up":
+                if (not isinstance(ff, RadioSet) or ff._selected == 0) \
+                        and not isinstance(ff, SelectionList):
+                    self.focus_tag(index - 1)
+                    event.stop()
+            case "enter":
+                if self.app.submit:
+                    self.app.action_confirm()
+                    event.stop()
+            case letter if len(letter) == 1:  # navigate by letters
+                tags = self.tags
+                for i in chain(range(index + 1, len(tags)), range(index)):
+                    if str(tags[i].name or "").casefold().startswith(letter):
+                        self.focus_tag(i)
+                        break
+
+
+def field_rows(fieldt: Widget | TagWidget) -> Iterable[Widget]:
+    """ The widget with its label and description. """
+    if isinstance(fieldt, Input):
+        yield Label(fieldt.placeholder)
+    # TODO MyRadioSet not shown now: add name in widgetize and display here
+    # NOTE: has this something to do with the PathTag?
+    elif hasattr(fieldt, "tag") and fieldt.tag.name and not isinstance(fieldt, Input):
+        yield Label(fieldt.tag.name)
+    yield fieldt
+    if isinstance(fieldt, TagWidget) and (arb := fieldt._arbitrary):
+        yield arb
+    if isinstance(fieldt, TagWidget) and (desc := fieldt.tag.description):
+        yield Label(desc)
+    yield Label("")
+
+
+class LazyGroup(Vertical):
+    """ A group of form fields, its widgets are created and mounted on demand.
+    Till then, it just takes the estimated space so that the scrollbar reflects the whole form. """
+
+    SIZE = 25
+    """ Fields per group. """
+    ROWS = 5
+    """ Estimated rows per field. """
+
+    def __init__(self, contents: FormContents, tags: list[Tag], start: int):
+        super().__init__()
+        self.contents = contents
+        self.tags = tags
+        self.start = start
+        """ The index of the first tag within the form. """
+        self.widgets: list[TagWidget] = []
+        self.styles.height = len(tags) * self.ROWS
+
+    def materialize(self):
+        widgetize = self.contents.adaptor.widgetize
+        self.widgets = [widgetize(tag) for tag in self.tags]
+        self.styles.height = "auto"
+        self.mount_all(row for fieldt in self.widgets for row in field_rows(fieldt))
+        self.contents._update_widgets()
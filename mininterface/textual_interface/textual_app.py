@@ -1,14 +1,19 @@
-from typing import TYPE_CHECKING
+from asyncio import CancelledError, Future
+from contextlib import ExitStack, redirect_stderr, redirect_stdout
+import sys
+from typing import TYPE_CHECKING, Optional
 from textual import events
 from textual.app import App
 from textual.containers import Container
 from textual.widget import Widget
+from textual.worker import Worker
 
 from .form_contents import FormContents
 
 from .button_contents import ButtonContents
 
 
+from ..tag.tag import _Submission
 from .widgets import TagWidget
 
 
@@ -33,8 +38,24 @@ class TextualApp(App[bool | None]):
         self.focusable_: WidgetList = []
         self.adaptor = adaptor
         self.submit = submit
+        self.validated: bool | None = None
+        """ The submit result if the form has been validated while the app was still running. """
+        self._validating = False
+        self._validation: Optional[Worker] = None
+        """ Waits for the blocking validations. """
+        self._dialog: Optional[Future] = None
+        """ In a session, the app is not exited, the dialog result is set here instead. """
+        self._suspension: Optional[ExitStack] = None
+        """ Between the dialogs of a session, the terminal is given back. """
+        self._streams = sys.stdout, sys.stderr
+        """ The streams the app captures while running. """
+
+        self._bind_submit(submit)
+        self.bind("escape", "exit", description="Cancel")
 
+    def _bind_submit(self, submit: str | bool):
         # Form confirmation
+        self._bindings.key_to_bindings.pop("Enter", None)
         if submit:
             # enter w/o priority is still consumed by input fields (and recaught by on_key)
             # Second thing:
@@ -43,7 +64,6 @@ class TextualApp(App[bool | None]):
             # And I do want to send the form on enter.
             # So the shortcut does not work but is handled at 'on_key'.
             self.bind("Enter", "confirm", description=submit if isinstance(submit, str) else "Ok")
-        self.bind("escape", "exit", description="Cancel")
 
     def compose(self):
         self.contents = Container()
@@ -59,11 +79,84 @@ class TextualApp(App[bool | None]):
             c = FormContents(self.adaptor, self.widgets, self.focusable_)
         self.contents.mount(c)
 
+    def _suspend(self):
+        """ Between the dialogs of a session, the app is not driven. Leave the application mode so that
+        the terminal is given back: Ctrl+C works and the program output does not garble a frozen screen.
+        (Like App.suspend but the streams are the ones before the app started,
+        as the interface buffers the stdout for the next dialog.) """
+        if self._suspension:
+            return
+        self._suspension = suspension = ExitStack()
+        # NOTE The app captures the streams till it ends, not just while it is driven.
+        suspension.enter_context(redirect_stdout(self._streams[0]))
+        suspension.enter_context(redirect_stderr(self._streams[1]))
+        if self._driver and self._driver.can_suspend:
+            suspension.enter_context(self._driver.no_automatic_restart())  # ex. on Ctrl+Z, fg
+            self._driver.suspend_application_mode()
+            suspension.callback(self._driver.resume_application_mode)
+
+    def _resume(self):
+        """ Enter the application mode again. (Needs the running event loop.) """
+        if suspension := self._suspension:
+            self._suspension = None
+            suspension.close()
+            self.refresh(layout=True)
+
+    def start_dialog(self, submit: str | bool, title: str, dialog: Future):
+        """ In a session, show the next dialog in the running app. """
+        self._resume()
+        self.submit = submit
+        self._bind_submit(submit)
+        self.refresh_bindings()
+        self.title = title
+        self.validated = None
+        self._validating = False
+        self._dialog = dialog
+        self.on_mount()
+
+    def _finish(self, result: bool | None):
+        if self._dialog:
+            self._suspend()
+            if not self._dialog.done():
+                self._dialog.set_result(result)
+            self._dialog = None
+        else:
+            self.exit(result)
+
     def action_confirm(self):
         # next time, start on the same widget
         # NOTE the functionality is probably not used
         self.focused_i = next((i for i, inp in enumerate(self.focusable_) if inp == self.focused), None)
-        self.exit(True)
+        if self.adaptor.button_app:
+            self._finish(True)
+            return
+        if self._validating:
+            return
+        vals = list(self.adaptor._serialize_vals(self))
+        if any(tag._is_blocking() for tag, _ in vals):
+            # The blocking checks run in the validation workers, the app keeps responding meanwhile.
+            # The rest (ex. a validation changing the facet) runs here, in the app thread.
+            submission = _Submission(vals)
+            self._validating = True
+            self.notify("Validating…")
+            self._validation = self.run_worker(self._validate(submission))
+        else:
+            self._finish(True)  # the adaptor validates itself
+
+    async def _validate(self, submission: _Submission):
+        # An exception exits the app, as a worker exits on error.
+        try:
+            await submission.wait_async()
+        except CancelledError:
+            submission.cancel()
+            raise
+        self._validation_done(submission.finish())
+
+    def _validation_done(self, validated: bool):
+        self.validated = validated
+        self._finish(True)
 
     def action_exit(self):
-        self.exit()
+        if self._validating:
+            self._validation.cancel()
+        self._finish(None)
@@ -1,12 +1,17 @@
 import sys
 from typing import TYPE_CHECKING, Optional
+from rich.text import Text
 from textual import events
+from textual.containers import Vertical
 from textual.widget import Widget
-from textual.widgets import Button, Checkbox, Input, RadioButton, RadioSet, SelectionList
+from textual.widgets import Button, Checkbox, Input, OptionList, RadioButton, RadioSet, SelectionList
 
 
 from ..tag.tag import Tag, TagValue
 
+if TYPE_CHECKING:
+    from ..tag.select_tag import SelectTag
+
 
 class TagWidget:
     """ Widget that has a tag inside, this can implement on_change method etc. """
@@ -65,14 +70,48 @@ class MyRadioButton(RadioButton):
         super().__init__(*args, **kwargs)
 
 
-class MyRadioSet(TagWidget, RadioSet):
+class TypeToFilter:
+    """ Filter the options by typing, started by the slash. Backspace removes a character, Escape ends the filter.
+    Till then, the keys are left to the form (that navigates by the letters).
+    The matching is done by the search index of the SelectTag.
+    The widget implements `filter(shown: set[int])`, showing just the options at these positions. """
+
+    tag: "SelectTag"
+    _query: Optional[str] = None
+    """ None if not filtering. """
+
+    def filter_on_key(self, event: events.Key) -> bool:
+        """ Returns True if the key changed the query. """
+        query = self._query
+        if query is None:
+            if event.character != "/":
+                return False
+            query = ""
+        elif event.key == "escape":
+            query = None
+        elif event.key == "backspace":
+            query = query[:-1]
+        elif event.is_printable and event.character and event.character != " ":  # space toggles the option
+            query += event.character
+        else:
+            return False
+        event.stop()
+        self._query = query
+        self.border_subtitle = "" if query is None else f"Search: {query}"
+        self.filter(set(self.tag._search_options(query or "")))
+        return True
+
+
+class MyRadioSet(TypeToFilter, TagWidget, RadioSet):
     def on_radio_set_changed(self):
         return self.trigger_change()
 
     def on_key(self, event: events.Key) -> None:
         # if event.key == "down":
         #     return False
-        if event.key == "enter":
+        if self.filter_on_key(event):
+            return
+        if event.key == "enter" and self._selected is not None:
             # If the radio button is not selected, select it and prevent default
             # (which is form submittion).
             # If it is selected, do nothing, so the form will be submitted.
@@ -82,6 +121,14 @@ class MyRadioSet(TagWidget, RadioSet):
                 if len(self.tag.facet._form) > 1 or self.tag is not next(iter(self.tag.facet._form.values())):
                     event.stop()
 
+    def filter(self, shown: set[int]):
+        # The hidden buttons are disabled too, so that the arrow navigation skips them.
+        for i, button in enumerate(self._nodes):
+            button.disabled = i not in shown
+            button.display = i in shown
+        if self._selected not in shown:
+            self._selected = min(shown, default=None)
+
     def get_ui_value(self):
         if self.pressed_button:
             self.pressed_button: MyRadioButton
@@ -90,12 +137,122 @@ class MyRadioSet(TagWidget, RadioSet):
             return None
 
 
-class MySelectionList(TagWidget, SelectionList):
+class MySelectionList(TypeToFilter, TagWidget, SelectionList):
+    def __init__(self, tag: "SelectTag", *selections: tuple[str, TagValue, bool], **kwargs):
+        super().__init__(tag, *selections, **kwargs)
+        self._rows = [(label, value) for label, value, _ in selections]
+        self._hidden_selected: list[TagValue] = []
+        """ Selected values filtered out by the query. """
+
     def on_selection_changed(self):
         return self.trigger_change()
 
+    def on_key(self, event: events.Key) -> None:
+        self.filter_on_key(event)
+
+    def filter(self, shown: set[int]):
+        selected = self.get_ui_value()
+        chosen = set(selected)
+        with self.prevent(self.SelectedChanged):
+            self.clear_options()
+            self.add_options((label, value, value in chosen)
+                             for i, (label, value) in enumerate(self._rows) if i in shown)
+        self.highlighted = 0 if shown else None
+        self._hidden_selected = [v for v in selected if v not in self._selected]
+
+    def get_ui_value(self):
+        return self.selected + self._hidden_selected
+
+
+class MyOptionList(TagWidgetWithInput, Vertical):
+    """ Options fetched window by window: the first page, the next one when scrolled to the bottom,
+    the search results when typing. Used for the lazy options and for the options too many to be all rendered.
+    (OptionList renders just the visible rows.) """
+
+    DEFAULT_CSS = """
+    MyOptionList {
+        height: auto;
+    }
+
+    MyOptionList OptionList {
+        max-height: 12;
+    }
+    """
+
+    PAGE = 50
+
+    def __init__(self, tag: "SelectTag", *args, **kwargs):
+        super().__init__(tag, *args, **kwargs)
+        self.input = Input(placeholder="Type to search")
+        self.option_list = OptionList()
+        self._values: list[TagValue] = []
+        """ Values of the options loaded so far. """
+        self._labels: list[tuple[str, bool]] = []
+        self._query = ""
+        self._total = 0
+        self._selected = list(tag.val) if tag.multiple else tag.val
+
+    def compose(self):
+        yield self.input
+        yield self.option_list
+
+    def on_mount(self):
+        self._load(reset=True)
+        self.watch(self.option_list, "scroll_y", self._on_scroll, init=False)
+
+    def _on_scroll(self, scroll_y: float):
+        if scroll_y >= self.option_list.max_scroll_y:  # the mouse wheel or the scrollbar reached the bottom
+            self._load_more()
+
+    def _load_more(self):
+        if len(self._values) < self._total:
+            self._load()
+
+    def _load(self, reset=False):
+        if reset:
+            self.option_list.clear_options()
+            self._values.clear()
+            self._labels.clear()
+            self._total = self.tag._count_options(self._query)
+        rows = self.tag._get_page(len(self._values), self.PAGE, self._query)
+        self._values.extend(v for _, v, *_ in rows)
+        self._labels.extend((label, tip) for label, _, tip, _ in rows)
+        self.option_list.add_options(self._prompt(i) for i in range(len(self._values) - len(rows), len(self._values)))
+
+    def _is_selected(self, value) -> bool:
+        if self.tag.multiple:
+            return value in self._selected
+        return value == self._selected
+
+    def _prompt(self, i: int) -> Text:
+        label, tip = self._labels[i]
+        return Text(f"{'●' if self._is_selected(self._values[i]) else '○'} {label}", style="bold" if tip else "")
+
+    def on_input_changed(self, event: Input.Changed):
+        event.stop()
+        self._query = event.value
+        self._load(reset=True)
+
+    def on_option_list_option_highlighted(self, event: OptionList.OptionHighlighted):
+        if event.option_index >= len(self._values) - 1:
+            self._load_more()
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected):
+        event.stop()
+        value = previous = self._values[event.option_index]
+        if not self.tag.multiple:
+            previous, self._selected = self._selected, value
+        elif value in self._selected:
+            self._selected.remove(value)
+        else:
+            self._selected.append(value)
+        for i, v in enumerate(self._values):
+            if v == value or v == previous:
+                self.option_list.replace_option_prompt_at_index(i, self._prompt(i))
+        self.trigger_change()
+
     def get_ui_value(self):
-        return self.selected
+        return list(self._selected) if self.tag.multiple else self._selected
 
 
 class MyButton(TagWidget, Button):
@@ -8,7 +8,7 @@ from tktooltip import ToolTip
 from tkinter_form import Form, Value
 
 from ..exceptions import Cancelled, InterfaceNotAvailable
-from ..form_dict import TagDict, formdict_to_widgetdict
+from ..form_dict import TagDict
 from ..mininterface.adaptor import BackendAdaptor
 from ..mininterface.mixin import RichUiAdaptor
 from ..settings import GuiSettings
@@ -97,14 +97,14 @@ class TkAdaptor(Tk, RichUiAdaptor, BackendAdaptor):
 
         self.form = Form(self.frame,
                          name_form="",
-                         form_dict=formdict_to_widgetdict(form, self.widgetize),
+                         form_dict=self.facet._flat.nested(map(self.widgetize, self.facet._flat)),
                          name_button=submit if isinstance(submit, str) else "Ok",
                          button_command=self._ok if submit else None
                          )
         self.form.pack()
 
         # Add radio etc.
-        replace_widgets(self, self.form.fields, form)
+        replace_widgets(self, self.form.fields)
 
         # Set the submit and exit settings
         if self.form.button:
@@ -129,7 +129,7 @@ class TkAdaptor(Tk, RichUiAdaptor, BackendAdaptor):
         return self.mainloop(lambda: self.validate(form, title, submit))
 
     def validate(self, form: TagDict, title: str, submit) -> TagDict:
-        if not Tag._submit(form, self.form.get()) or not self.submit_done():
+        if not Tag._submit(self.facet._flat, self.form.get()) or not self.submit_done():
             return self.run_dialog(form, title, submit)
         return form
 
@@ -149,6 +149,16 @@ class TkAdaptor(Tk, RichUiAdaptor, BackendAdaptor):
                 button.bind("<Return>", lambda _: b.invoke())
         return self.mainloop()
 
+    def _call_later(self, delay: float, f: Callable[[], None]):
+        handle = self.after(round(delay * 1000), f)
+        return lambda: self.after_cancel(handle)
+
+    def _call_from_thread(self, f: Callable[[], None]):
+        try:
+            self.after(0, f)  # tkinter passes the call to the main loop thread
+        except RuntimeError:
+            pass  # the main loop is over, the result is stale
+
     def _bind_event(self, event, handler):
         self._event_bindings[event] = handler
         self.bind(event, handler)
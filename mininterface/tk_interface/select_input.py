@@ -1,5 +1,5 @@
-from tkinter import BooleanVar, Variable, Widget
-from tkinter.ttk import Checkbutton, Frame, Label, Radiobutton, Style
+from tkinter import BROWSE, END, MULTIPLE, BooleanVar, Listbox, StringVar, Variable, Widget
+from tkinter.ttk import Checkbutton, Entry, Frame, Label, Radiobutton, Scrollbar, Style
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 
@@ -52,11 +52,14 @@ class SetVar(set):
 
 class SelectInputWrapper:
 
+    PAGE = 100
+    """ Number of the options fetched at once to the paged list. """
+
     def __init__(self, master, tag: SelectTag, grid_info, widget: Widget, adaptor: "TkAdaptor"):
         # Replace with radio buttons
         self.tag = tag
         self.adaptor = adaptor
-        self.options: OptionsReturnType = tag._get_options()
+        self.options: OptionsReturnType = [] if tag._is_lazy() else tag._get_options()
         self.variable = Variable()
         self.widget = widget
 
@@ -72,7 +75,13 @@ class SelectInputWrapper:
         self.init_phase = True
         """ Becomes False few ms after mainloop """
 
-        if tag.multiple:
+        if self.is_paged(adaptor.settings):
+            if tag.multiple:
+                self.variable_wrapper = SetVar(tag.val)
+            else:
+                self.variable_wrapper = VariableAnyWrapper(self.variable, {})
+            self.widget = self.paged_list()
+        elif tag.multiple:
             self.variable_wrapper = SetVar()
             self.checkboxes(bg)
         else:
@@ -85,6 +94,12 @@ class SelectInputWrapper:
         # if radio_select_on_focus is True, we want to ignore the first FocusIn event
         nested_frame.after(200, self.end_init_phase)
 
+    def is_paged(self, settings) -> bool:
+        """ Whether to render the searchable paged list instead of the checkboxes, radios or combobox. """
+        if self.tag._is_lazy():
+            return True
+        return len(self.options) >= settings.search_since
+
     def checkboxes(self, bg):
         options = self.options
         tag = self.tag
@@ -175,6 +190,66 @@ class SelectInputWrapper:
         self.set_default_label()
         return widget
 
+    def paged_list(self):
+        """ A listbox fetching the options window by window (next when scrolled to the bottom),
+        with a search entry filtering the options as the user types. """
+        tag = self.tag
+        vw = self.variable_wrapper
+        query = StringVar()
+        entry = Entry(self.frame, textvariable=query)
+        entry.pack(fill="x")
+        listbox = Listbox(self.frame, height=10, exportselection=False,
+                          selectmode=MULTIPLE if tag.multiple else BROWSE)
+        scrollbar = Scrollbar(self.frame, command=listbox.yview)
+        listbox.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="left", fill="y")
+        values = []
+        total = 0
+
+        def load(reset=False):
+            nonlocal total
+            if reset:
+                listbox.delete(0, END)
+                values.clear()
+                total = tag._count_options(query.get())
+            for label, v, tip, _ in tag._get_page(len(values), self.PAGE, query.get()):
+                listbox.insert(END, label)
+                if tip:
+                    listbox.itemconfig(END, background="lightyellow")
+                if (v in vw) if tag.multiple else (v == vw.get()):
+                    listbox.selection_set(END)
+                if not tag.multiple:
+                    vw.mapping[label] = v
+                values.append(v)
+
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            if float(last) >= 1 and len(values) < total:
+                load()
+
+        def on_select(_):
+            selected = set(listbox.curselection())
+            if not tag.multiple:
+                if selected:
+                    vw.set(listbox.get(selected.pop()))
+                return
+            for i, v in enumerate(values):
+                if i in selected:
+                    vw.add(v)
+                else:
+                    vw.discard(v)
+            tag._last_ui_val = False
+            tag._on_change_trigger(vw.get())
+
+        listbox.configure(yscrollcommand=on_scroll)
+        listbox.bind("<<ListboxSelect>>", on_select)
+        query.trace_add("write", lambda *_: load(reset=True))
+        if not tag.multiple and (key := tag._get_selected_key()) is not None:
+            vw.mapping[key] = tag.val
+            vw.set(key)
+        load(reset=True)
+        return entry
+
     def end_init_phase(self):
         self.init_phase = False
 
@@ -16,9 +16,7 @@ from ..tag.select_tag import SelectTag
 
 from ..tag.internal import CallbackButtonWidget, FacetButtonWidget, SubmitButtonWidget
 
-from ..auxiliary import flatten
 from ..experimental import FacetCallback, SubmitButton
-from ..form_dict import TagDict
 from ..tag import Tag
 from ..tag.secret_tag import SecretTag
 from .select_input import SelectInputWrapper, VariableAnyWrapper
@@ -97,7 +95,7 @@ def _set_true(variable: Variable, tag: Tag):
     return _
 
 
-def replace_widgets(adaptor: "TkAdaptor", nested_widgets, form: TagDict):
+def replace_widgets(adaptor: "TkAdaptor", nested_widgets):
     def replace_variable(variable):
         """ On form submit, tkinter_form will return the output of this variable. """
         if widget.winfo_manager() == 'grid':
@@ -111,7 +109,7 @@ def replace_widgets(adaptor: "TkAdaptor", nested_widgets, form: TagDict):
     # NOTE should the button receive tag or directly
     #   the whole facet (to change the current form)? Specifiable by experimental.FacetCallback.
     nested_widgets = widgets_to_dict(nested_widgets)
-    for tag, field_form in zip(flatten(form), flatten(nested_widgets)):
+    for tag, field_form in adaptor.facet._flat.zip(nested_widgets):
         tag: Tag
         field_form: FieldForm
         label1: Widget = field_form.label
@@ -26,8 +26,11 @@ class AttrsModel:
     restrained: str = attr.ib(default="hello", validator=max_len(5))
 ```
 """
-from typing import overload
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Callable, overload
 from .tag import Tag
+from .tag.tag import TagValue, ValidationResult
 
 
 def not_empty(tag: Tag):
@@ -68,6 +71,9 @@ def not_empty(tag: Tag):
     return True
 
 
+ValidationCallback = Callable[[Tag], ValidationResult | tuple[ValidationResult, TagValue]]
+
+
 @overload
 def limit(maximum: int, lt: float | None = None, gt: float | None = None, transform=False):
     ...
@@ -141,3 +147,86 @@ def limit(maxOrMin: int | None = None, max_: int | None = None, lt: float | None
         return True
 
     return limiter
+
+
+def cross_field(validation: ValidationCallback):
+    """ Marks a validation that reads other fields. Such a validation is re-run on every form revision,
+    whereas the other validations are re-run only when the user changes the value.
+
+    ```python
+    from dataclasses import dataclass
+    from typing import Annotated
+    from mininterface import Validation, run
+    from mininterface.validators import cross_field
+
+    @cross_field
+    def greater_than_start(tag):
+        return tag.val > m.env.start or "The end must be after the start"
+
+    @dataclass
+    class Env:
+        start: int = 1
+        end: Annotated[int, Validation(greater_than_start)] = 10
+
+    m = run(Env)
+    ```
+
+    Args:
+        validation: The validation callback.
+    """
+    return _mark(validation, cross_field=True)
+
+
+@overload
+def blocking(validation: ValidationCallback, *, timeout: float | None = None) -> ValidationCallback:
+    ...
+
+
+@overload
+def blocking(*, timeout: float | None = None) -> Callable[[ValidationCallback], ValidationCallback]:
+    ...
+
+
+def blocking(validation: ValidationCallback | None = None, *, timeout: float | None = None):
+    """ Marks a validation that might take long, ex. it accesses a network disk, computes a checksum
+    or queries a database. On submit, the blocking validations run concurrently in a thread pool
+    and the interface stays responsive meanwhile. An async validation is considered blocking automatically.
+
+    ```python
+    from hashlib import sha256
+    from pathlib import Path
+    from mininterface import Tag, run
+    from mininterface.validators import blocking
+
+    @blocking(timeout=10)
+    def checksum_matches(tag: Tag):
+        return sha256(tag.val.read_bytes()).hexdigest() == EXPECTED or "Checksum mismatch"
+
+    m = run()
+    m.form({"Image": Tag(Path("image.iso"), validation=checksum_matches)})
+    ```
+
+    Args:
+        validation: The validation callback.
+        timeout: Seconds after which the validation is given up and fails.
+            (A running validation cannot be interrupted, it keeps its worker till it returns.)
+
+    (Note that [`PathTag`][mininterface.tag.PathTag] with `exist`, `is_dir` or `is_file` checks is blocking too.)
+    """
+    if validation is None:
+        return lambda validation: blocking(validation, timeout=timeout)
+    return _mark(validation, blocking=True, timeout=timeout)
+
+
+def _mark(validation: ValidationCallback, **attrs) -> ValidationCallback:
+    """ Wraps the validation and sets the attributes the submit checks. The async validation stays async. """
+    if iscoroutinefunction(validation):
+        @wraps(validation)
+        async def _(tag: Tag):
+            return await validation(tag)
+    else:
+        @wraps(validation)
+        def _(tag: Tag):
+            return validation(tag)
+    _.__dict__.update(attrs)
+    return _
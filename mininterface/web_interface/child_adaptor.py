@@ -5,7 +5,6 @@ import struct
 import sys
 from typing import TYPE_CHECKING
 
-from ..auxiliary import flatten
 
 from ..textual_interface import TextualAdaptor
 
@@ -75,9 +74,9 @@ class SerializedChildAdaptor(TextualAdaptor):
 
     def run_dialog(self, form: TagDict, title: str = "", submit: bool | str = True) -> TagDict:
         BackendAdaptor.run_dialog(self, form, title, submit)
-        vals: ValsType = self.send(SerCommand.FORM, self.facet._form)
+        vals: ValsType = self.send(SerCommand.FORM, self.facet._flat)
 
-        if not self._try_submit((orig_tag, ui_val) for orig_tag, (_, ui_val) in zip(flatten(self.facet._form), vals)):
+        if not self._try_submit((orig_tag, ui_val) for orig_tag, (_, ui_val) in self.facet._flat.zip(vals)):
             return self.run_dialog(form, title, submit)
 
         return self.facet._form
@@ -7,11 +7,10 @@ from types import GeneratorType
 from typing import TYPE_CHECKING
 
 
-from ..form_dict import TagDict
+from ..form_dict import FlatForm
 
 from .app import SerCommand, WebParentApp
 
-from ..auxiliary import flatten
 
 from ..textual_interface.facet import TextualFacet
 
@@ -55,15 +54,15 @@ class WebParentAdaptor(TextualAdaptor):
 
         self.interface._redirected.write(text)
         match command, data:
-            case SerCommand.FORM, [form]:
-                form: TagDict
+            case SerCommand.FORM, [flat]:
+                flat: FlatForm
 
                 # sets the facet to all the tags in the form
-                for t in flatten(form):
+                for t in flat:
                     t.facet = self.facet
 
                 self.button_app = False
-                self.facet._fetch_from_adaptor(form)
+                self.facet._fetch_from_adaptor(flat.form, flat)
             case SerCommand.BUTTONS, data:
                 data: ButtonAppType
                 self._build_buttons(*data)
@@ -0,0 +1,313 @@
+""" Performance benchmarks. They are not a part of the test suite, run them manually:
+
+    python3 tests/benchmarks.py  # all of them
+    python3 tests/benchmarks.py form_build  # just the chosen ones
+"""
+import sys
+from dataclasses import make_dataclass
+from pathlib import Path
+from time import perf_counter
+
+from tyro import cli
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # the mininterface of this repository
+from mininterface.auxiliary import get_description_index, guess_type, matches_annotation
+from mininterface.cli_parser import PreparedParser, parse_cli
+from mininterface.form_dict import dataclass_to_tagdict
+from mininterface.tag import Tag
+
+BENCHMARKS = {}
+
+
+def benchmark(f):
+    BENCHMARKS[f.__name__] = f
+    return f
+
+
+def measure(f, repeat=1) -> float:
+    """ Average seconds per call. """
+    start = perf_counter()
+    for _ in range(repeat):
+        f()
+    return (perf_counter() - start) / repeat
+
+
+def make_env(count: int, type_=int, default=0):
+    return make_dataclass(f"Env{count}", [(f"field_{i}", type_, default) for i in range(count)])
+
+
+@benchmark
+def form_build():
+    """ Building a form from a cold class. The time per field should stay the same, whatever the field count is. """
+    for count in (25, 50, 100, 200, 400):
+        env = make_env(count)()
+        get_description_index.cache_clear()
+        t = measure(lambda: dataclass_to_tagdict(env))
+        print(f"{count:>5} fields: {t * 1000:8.2f} ms, {t / count * 1e6:8.1f} µs per field")
+
+
+@benchmark
+def form_repeated():
+    """ Building a form of the same class again and again, ex. in a wizard loop. """
+    from mininterface.tag.tag_factory import get_form_schema
+
+    env = make_env(200)()
+
+    def cold():
+        get_form_schema.cache_clear()
+        dataclass_to_tagdict(env)
+
+    dataclass_to_tagdict(env)  # the descriptions are fetched once, with or without the schema
+    t_cold = measure(cold, 5)
+    t = measure(lambda: dataclass_to_tagdict(env), 20)
+    print(f"200 fields: compiling the schema {t_cold * 1000:8.2f} ms, reusing it {t * 1000:8.2f} ms per form")
+
+
+@benchmark
+def parse_repeated():
+    """ Parsing the same Env again and again. The parser is built just once. """
+    env = make_env(50)
+    args = ["--field-1", "5"]
+    t_tyro = measure(lambda: cli(env, args=args), 20)
+    t = measure(lambda: parse_cli(env, {}, False, False, args), 20)
+    print(f"tyro.cli: {t_tyro * 1000:8.2f} ms, parse_cli: {t * 1000:8.2f} ms per parse")
+
+
+@benchmark
+def tag_update():
+    """ Submitting the UI strings. The type reflection is done once per annotation, not per submit. """
+    tags = [Tag(0, annotation=int | None) for _ in range(500)]
+    t = measure(lambda: Tag._submit_values((tag, "5") for tag in tags), 20)
+    print(f"500 fields form: {t * 1000:8.2f} ms per submit")
+
+    tag = Tag([], annotation=list[int])
+    ui_val = str(list(range(100_000)))
+    t = measure(lambda: tag.update(ui_val), 5)
+    print(f"100k items list[int]: {t * 1000:8.2f} ms per submit")
+
+
+@benchmark
+def form_flat():
+    """ Walking a 1000 field form in 50 sections on a revision: pairing the tags with the UI values and the resolution.
+    (The tag updates themselves cost the same.) Compared to the recursive walks. """
+    from mininterface.auxiliary import flatten
+    from mininterface.form_dict import FlatForm, dict_to_tagdict, formdict_resolve
+
+    form = dict_to_tagdict({f"section_{s}": {f"field_{i}": i for i in range(20)} for s in range(50)})
+    ui = {section: {key: "5" for key in fields} for section, fields in form.items()}
+    flat = FlatForm(form)
+    ui_list = list(flatten(ui))
+    t_nested = measure(lambda: (list(zip(flatten(form), flatten(ui))), formdict_resolve(form)), 20)
+    t = measure(lambda: (list(flat.zip(ui_list)), flat.resolve()), 20)
+    t_build = measure(lambda: FlatForm(form), 20)
+    print(f"recursive: {t_nested * 1000:8.2f} ms, flat: {t * 1000:8.2f} ms per revision, flattening once: {t_build * 1000:8.2f} ms")
+
+
+@benchmark
+def form_revision():
+    """ Revising a 500 field form (paths checked to exist) whose values the user has not changed. """
+    from mininterface.tag import PathTag
+
+    tags = [PathTag(Path("/tmp"), exist=True) for _ in range(500)]
+    ui = ["/tmp"] * 500
+
+    def cold():
+        for tag in tags:
+            tag._validated = None
+        Tag._submit_values(zip(tags, ui))
+
+    t_all = measure(cold, 10)
+    t = measure(lambda: Tag._submit_values(zip(tags, ui)), 10)
+    print(f"validating all: {t_all * 1000:8.2f} ms, just the changed: {t * 1000:8.2f} ms per revision")
+
+
+@benchmark
+def blocking_validation():
+    """ Submitting a 40 field form whose validations wait 20 ms each (ex. a network disk). """
+    from time import sleep
+    from mininterface.validators import blocking
+
+    def slow(tag):
+        sleep(0.02)
+        return True
+    sequential = [Tag(0, validation=slow) for _ in range(40)]
+    concurrent = [Tag(0, validation=blocking(slow)) for _ in range(40)]
+    t_sequential = measure(lambda: Tag._submit_values((tag, "5") for tag in sequential))
+    t = measure(lambda: Tag._submit_values((tag, "5") for tag in concurrent))
+    print(f"sequential: {t_sequential * 1000:8.2f} ms, concurrent: {t * 1000:8.2f} ms per submit")
+
+
+@benchmark
+def tag_construction():
+    """ Tags constructed per second, for each Tag child. Compared to constructing a Tag and morphing it. """
+    from datetime import date
+    from enum import Enum
+    from mininterface.tag import CallbackTag
+    from mininterface.tag.tag_factory import new_tag, tag_assure_type
+
+    Color = Enum("Color", "RED GREEN BLUE")
+    n = 2000
+    for type_, val in (("Tag", 1), ("PathTag", Path("/tmp")), ("DatetimeTag", date(2025, 1, 1)),
+                       ("SelectTag", Color.RED)):
+        t_morph = measure(lambda: tag_assure_type(Tag(val, _src_key="field")), n)
+        t = measure(lambda: new_tag(val, _src_key="field"), n)
+        print(f"{type_:>12}: {1 / t_morph:10.0f} tags/sec morphed, {1 / t:10.0f} tags/sec single pass")
+    t = measure(lambda: CallbackTag(print), n)
+    print(f"{'CallbackTag':>12}: {1 / t:10.0f} tags/sec (never morphed)")
+
+
+@benchmark
+def tag_memory():
+    """ Memory taken by a tag in a form with tens of thousands of tags. """
+    import tracemalloc
+    from mininterface.tag import PathTag, SelectTag
+
+    options = ["one", "two", "three"]
+    path = Path("/tmp")
+    keys = [f"file_{i}" for i in range(20_000)]  # the values are not counted
+    for type_, f in (("Tag", lambda key: Tag(True, _src_key=key)),
+                     ("SelectTag", lambda key: SelectTag("one", options=options, _src_key=key)),
+                     ("PathTag", lambda key: PathTag(path, _src_key=key))):
+        tracemalloc.start()
+        start = tracemalloc.get_traced_memory()[0]
+        tags = [f(key) for key in keys]
+        size = tracemalloc.get_traced_memory()[0] - start
+        tracemalloc.stop()
+        del tags
+        print(f"{type_:>10}: {size / len(keys):6.0f} B per tag")
+
+
+@benchmark
+def pydantic_validation():
+    """ Submitting a 300 field pydantic model. The validation models are built once per field. """
+    from pydantic import Field, create_model
+    from mininterface.tag.tag import _get_cached_validation_model
+
+    model = create_model("Model300", **{f"field_{i}": (int, Field(0, ge=0)) for i in range(300)})
+    tags = list(dataclass_to_tagdict(model())[""].values())
+
+    def uncached():
+        _get_cached_validation_model.cache_clear()
+        Tag._submit_values((tag, "5") for tag in tags)
+
+    t_uncached = measure(uncached, 3)
+    t = measure(lambda: Tag._submit_values((tag, "5") for tag in tags), 3)
+    print(f"model built per validation: {t_uncached * 1000:8.2f} ms, cached: {t * 1000:8.2f} ms per submit")
+
+
+@benchmark
+def large_collection():
+    """ Typing million-element lists. Compared to checking element by element. """
+
+    for annotation, val in ((list[int], list(range(1_000_000))),
+                            (list[Path], [Path("/tmp")] * 1_000_000)):
+        subtype = annotation.__args__[0]
+        t_items = measure(lambda: all(matches_annotation(x, subtype) for x in val))
+        t_check = measure(lambda: matches_annotation(val, annotation))
+        t_guess = measure(lambda: guess_type(val))
+        t_tag = measure(lambda: Tag(val))
+        print(f"{annotation}: by element {t_items * 1000:.1f} ms, matches_annotation {t_check * 1000:.1f} ms,"
+              f" guess_type {t_guess * 1000:.1f} ms, Tag creation {t_tag * 1000:.1f} ms")
+
+
+@benchmark
+def list_input():
+    """ Editing a list in a text input: the value round trip to the UI and back. Compared to literal_eval. """
+    from ast import literal_eval
+
+    for annotation, val in ((list[int], list(range(100_000))),
+                            (list[float], [i / 3 for i in range(100_000)]),
+                            (list[Path], [Path(f"/tmp/{i}") for i in range(100_000)])):
+        tag = Tag(val, annotation=annotation)
+        ui_val = str(tag._get_ui_val())
+        subtype = annotation.__args__[0]
+        t_literal = measure(lambda: [subtype(v) for v in literal_eval(ui_val)])
+        t_update = measure(lambda: tag.update(ui_val))
+        t_serialize = measure(lambda: str(tag._get_ui_val()))
+        print(f"{str(annotation):>17}: literal_eval {t_literal * 1000:7.1f} ms, update {t_update * 1000:7.1f} ms,"
+              f" to UI {t_serialize * 1000:7.1f} ms")
+
+
+@benchmark
+def select_options():
+    """ Submitting a choice from 50k options. """
+    from mininterface.tag import SelectTag
+
+    options = [f"host-{i}.example.com" for i in range(50_000)]
+    tag = SelectTag(options[0], options=options)
+    multi = SelectTag(options[:1000], options=options)
+    t_index = measure(lambda: tag.update(options[-1]))  # builds the index
+    t = measure(lambda: tag.update(options[-1]), 20)
+    multi.update(options[-1000:])
+    t_multi = measure(lambda: (multi.update(options[-1000:]), multi._get_selected_keys()), 20)
+    t_rebuild = measure(lambda: (setattr(tag, "options", options), tag.update(options[-1])), 5)
+    print(f"first submit: {t_index * 1000:8.2f} ms, submit: {t * 1000:8.3f} ms, multiple submit: {t_multi * 1000:8.2f} ms,"
+          f" submit with changed options: {t_rebuild * 1000:8.2f} ms")
+
+
+@benchmark
+def option_search():
+    """ Type-to-filter in 100k options, the user types a host name character by character. Compared to a plain scan. """
+    from mininterface.tag.option_search import OptionSearch
+
+    labels = [f"host-{i}.example.com" for i in range(100_000)]
+    typed = "host-4242."
+    queries = [typed[:i] for i in range(1, len(typed) + 1)]
+    lowered = [label.lower() for label in labels]
+    t_scan = measure(lambda: [[i for i, label in enumerate(lowered) if q in label] for q in queries])
+    t_build = measure(lambda: OptionSearch(labels))
+    search = OptionSearch(labels)
+
+    def typing(limit):
+        search._last = None
+        for q in queries:
+            search.search(q, limit=limit)
+            search.search(q)  # the count of all the matches, cached for the next keystroke
+
+    t = measure(lambda: typing(None), 5)
+    search._last = "host-4242", search.search("host-4242")
+    t_page = measure(lambda: search.search("host-4242.", limit=50), 1000)
+    t_query = measure(lambda: (setattr(search, "_last", None), search.search("4242.ex")), 100)
+    print(f"plain scan: {t_scan / len(queries) * 1000:6.2f} ms per keystroke, index build: {t_build * 1000:6.2f} ms,"
+          f" typing: {t / len(queries) * 1000:6.2f} ms per keystroke, a fresh query: {t_query * 1e6:6.1f} µs,"
+          f" the 10th keystroke: {t_page * 1e6:6.1f} µs")
+
+
+Env20 = make_env(20)
+Env20.__module__ = __name__  # picklable for the process pool
+
+
+@benchmark
+def batch_parse():
+    """ Throughput of parsing many argument vectors. """
+    argvs = [["--field-1", str(i), "--field-2", str(i)] for i in range(5000)]
+    parser = PreparedParser(Env20)
+    for label, f in (("parse_cli", lambda: [parse_cli(Env20, {}, False, True, argv) for argv in argvs]),
+                     ("PreparedParser.parse", lambda: [parser.parse(argv) for argv in argvs]),
+                     ("parse_many, 4 processes", lambda: list(parser.parse_many(argvs, processes=4)))):
+        t = measure(f)
+        print(f"{label:>25}: {len(argvs) / t:10.0f} parses/sec")
+
+
+@benchmark
+def schema_cache():
+    """ Fetching the descriptions at the program start, without and with the on-disk cache. """
+    from tempfile import TemporaryDirectory
+    from unittest.mock import patch
+    from configs import NestedDefaultedEnv
+
+    def cold():
+        get_description_index.cache_clear()
+        get_description_index(NestedDefaultedEnv)
+
+    t_cold = measure(cold, 20)
+    with TemporaryDirectory() as tmp, patch.dict("os.environ", {"MININTERFACE_CACHE": tmp}):
+        cold()  # fill the cache
+        t_warm = measure(cold, 20)
+    print(f"without cache: {t_cold * 1000:8.2f} ms, warm cache: {t_warm * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS:
+        print(f"# {name}: {BENCHMARKS[name].__doc__.strip()}")
+        BENCHMARKS[name]()
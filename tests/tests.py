@@ -1,17 +1,31 @@
+from ast import literal_eval
+import asyncio
 import logging
 import os
+import subprocess
 import sys
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, redirect_stderr, redirect_stdout
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields, make_dataclass
+from functools import partialmethod
 from datetime import date, datetime
 from io import StringIO
 from pathlib import Path, PosixPath
+from tempfile import TemporaryDirectory
+from threading import Barrier, Event, Thread, current_thread, main_thread
+from time import sleep, time
 from types import NoneType, SimpleNamespace
-from typing import Optional, Type, get_type_hints
+from typing import Any, Callable, Optional, Type, get_args, get_origin, get_type_hints
 from unittest import TestCase, main
 from unittest.mock import DEFAULT, Mock, patch
 
+from textual import events
+from textual.app import App
+from tyro._parsers import ParserSpecification
+from tyro.extras import get_parser
+
 from attrs_configs import AttrsModel, AttrsNested, AttrsNestedRestraint
 from configs import (AnnotatedClass, ColorEnum, ColorEnumSingle,
                      ConflictingEnv, ConstrainedEnv, DatetimeTagClass,
@@ -23,23 +37,32 @@ from configs import (AnnotatedClass, ColorEnum, ColorEnumSingle,
 from pydantic_configs import PydModel, PydNested, PydNestedRestraint
 
 from mininterface import EnvClass, Mininterface, run
-from mininterface.auxiliary import (flatten, matches_annotation,
-                                    subclass_matches_annotation)
-from mininterface.cli_parser import (_merge_settings, parse_cli,
+from mininterface.auxiliary import (flatten, get_description_index, guess_type,
+                                    matches_annotation, subclass_matches_annotation)
+from mininterface.cli_parser import (PreparedParser, _merge_settings, parse_cli,
                                      parse_config_file)
 from mininterface.exceptions import Cancelled
-from mininterface.form_dict import (TagDict, dataclass_to_tagdict,
+from mininterface.form_dict import (FlatForm, TagDict, dataclass_to_tagdict,
                                     dict_to_tagdict, formdict_resolve)
 from mininterface.interfaces import TextInterface
-from mininterface.settings import UiSettings
+from mininterface.schema_cache import stats
+from mininterface.tag.converter import get_converter, parse_scalars
+from mininterface.tag.option_search import OptionSearch
+from mininterface.settings import GuiSettings as GuiUiSettings, TextualSettings as TextualUiSettings, UiSettings
 from mininterface.start import Start
 from mininterface.subcommands import SubcommandPlaceholder
 from mininterface.tag import CallbackTag, DatetimeTag, PathTag, Tag
 from mininterface.tag.secret_tag import SecretTag
-from mininterface.tag.select_tag import SelectTag
-from mininterface.tag.tag_factory import tag_assure_type
+from mininterface.tag.tag import VALIDATION_WORKERS
+from mininterface.tag.select_tag import OptionsProvider, SelectTag
+from mininterface.tag.tag_factory import _tag_source, tag_assure_type, tag_factory
 from mininterface.text_interface import AssureInteractiveTerminal
-from mininterface.validators import limit, not_empty
+from mininterface.textual_interface import TextualInterface
+from mininterface.textual_interface.file_picker_input import DirCache, FileBrowser
+from mininterface.textual_interface.form_contents import FormContents
+from mininterface.textual_interface.textual_app import TextualApp
+from mininterface.textual_interface.widgets import MyOptionList, MyRadioSet
+from mininterface.validators import blocking, cross_field, limit, not_empty
 from dumb_settings import (GuiSettings, MininterfaceSettings,
                            TextSettings, TextualSettings, TuiSettings, UiSettings as UiDumb, WebSettings)
 
@@ -123,6 +146,193 @@ class TestCli(TestAbstract):
         self.sys("--further.host='example.net'")
         self.assertRaises(SystemExit, lambda: run(SimpleEnv, interface=Mininterface, prog="My application"))
 
+    def test_parser_cache(self):
+        @dataclass
+        class Env:
+            token: str
+            items: list[int] = field(default_factory=list)
+
+        get_description_index(Env)  # the descriptions of the missing fields have their own parser
+        with patch.object(ParserSpecification, "from_callable_or_type",
+                          wraps=ParserSpecification.from_callable_or_type) as mocked:
+            env1, wf = parse_cli(Env, {}, args=["--token", "a"])
+            env2, wf2 = parse_cli(Env, {}, args=[])
+            env3, _ = parse_cli(Env, {}, args=["--token", "c", "--items", "1", "2"])
+            # The parser was built just once, even for the missing field.
+            self.assertEqual(1, mocked.call_count)
+
+        self.assertEqual("a", env1.token)
+        self.assertEqual({}, wf)
+        self.assertEqual(["token"], list(wf2))
+        self.assertEqual([1, 2], env3.items)
+        # The default_factory values are not shared among the parses
+        env1.items.append(1)
+        self.assertEqual([], env2.items)
+
+    def test_tyro_internals(self):
+        """ The cached parser builds on the tyro internals, they are checked on import. """
+        from mininterface import cli_parser
+        self.assertTrue(cli_parser._TYRO_INTERNALS)  # the installed tyro is supported
+        with patch.object(cli_parser._calling, "callable_with_args", lambda f, spec, values: None):
+            self.assertFalse(cli_parser._has_tyro_internals())
+
+    def test_tyro_fallback(self):
+        """ Without the expected tyro internals, the parser uses the public tyro.cli. """
+        from mininterface import cli_parser
+
+        @dataclass
+        class Env:
+            token: str
+            number: int = 3
+            items: list[int] = field(default_factory=list)
+
+        with patch.object(cli_parser, "_TYRO_INTERNALS", False), patch.object(cli_parser, "_parsers", OrderedDict()):
+            env, wf = parse_cli(Env, {}, args=["--token", "a", "--number", "5", "--items", "1", "2"])
+            self.assertEqual((Env("a", 5, [1, 2]), {}), (env, wf))
+            self.assertIsInstance(next(iter(cli_parser._parsers.values())), cli_parser._PlainParser)
+
+            env, wf = parse_cli(Env, {}, args=["--number", "5"])  # missing field
+            self.assertEqual((5, ["token"]), (env.number, list(wf)))
+
+            with patch("logging.basicConfig") as mocked:
+                env, _ = parse_cli(Env, {}, args=["-v", "--token", "b"])
+            self.assertEqual("b", env.token)
+            mocked.assert_called_once_with(level=logging.INFO, format='%(levelname)s - %(message)s')
+
+            with redirect_stderr(StringIO()):
+                self.assertRaises(SystemExit, parse_cli, Env, {}, args=["--number", "x", "--token", "a"])
+
+    def test_parse_concurrently(self):
+        @dataclass
+        class Env:
+            token: str
+            number: int = 0
+
+        @dataclass
+        class Inner:
+            my_val: int = 1
+
+        @dataclass
+        class UnderscoredEnv:
+            my_field: int = 0
+            inner: Inner = field(default_factory=Inner)
+
+        def parse(i):
+            match i % 4:
+                case 0 | 1:
+                    return parse_cli(Env, {}, args=["--number", str(i)] + (["--token", str(i)] if i % 2 else []))
+                case 2:  # the delimiter differs
+                    return parse_cli(UnderscoredEnv, {"use_underscores": True},
+                                     args=["--my_field", str(i), "--inner.my_val", str(i)])
+                case 3:  # a prepared parser, sometimes a new one is being built meanwhile
+                    parser = PreparedParser(make_dataclass(f"Env{i}", [("number", int, field(default=0))])) \
+                        if i % 40 == 3 else prepared
+                    return parser.parse(["--number", str(i)])
+
+        prepared = PreparedParser(Env)
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # make the threads switch often
+        try:
+            with ThreadPoolExecutor(16) as executor:
+                for i, (env, wf) in enumerate(executor.map(parse, range(2000))):
+                    match i % 4:
+                        case 0:
+                            self.assertEqual((i, ["token"]), (env.number, list(wf)))
+                        case 1:
+                            self.assertEqual((i, str(i), {}), (env.number, env.token, wf))
+                        case 2:
+                            self.assertEqual((i, i), (env.my_field, env.inner.my_val))
+                        case 3:
+                            self.assertEqual(i, env.number)
+        finally:
+            sys.setswitchinterval(interval)
+
+    def test_prepared_parser(self):
+        @dataclass
+        class Env:
+            token: str
+            items: list[int] = field(default_factory=list)
+            number: int = 3
+
+        get_description_index(Env)  # not to count the parser fetching the descriptions
+        with patch.object(ParserSpecification, "from_callable_or_type",
+                          wraps=ParserSpecification.from_callable_or_type) as m:
+            parser = PreparedParser(Env)
+            count = m.call_count
+            env, wf = parser.parse(["--token", "a", "--number", "5"])
+            self.assertEqual(Env("a", [], 5), env)
+            self.assertEqual({}, wf)
+
+            envs = list(parser.parse_many([["--token", str(i)] for i in range(10)] + [[]]))
+            self.assertEqual([str(i) for i in range(10)], [env.token for env, _ in envs[:10]])
+            self.assertEqual(["token"], list(envs[10][1]))
+            self.assertEqual(count, m.call_count)  # built just once
+
+        # fresh instances
+        envs[0][0].items.append(1)
+        self.assertEqual([], envs[1][0].items)
+
+        # config file defaults are read once
+        with TemporaryDirectory() as tmp:
+            config = Path(tmp, "config.yaml")
+            config.write_text("number: 7")
+            parser = PreparedParser(Env, config)
+            config.write_text("number: 8")
+            self.assertEqual(7, parser.parse(["--token", "a"])[0].number)
+
+    def test_prepared_parser_threads(self):
+        @dataclass
+        class Env:
+            token: str
+            items: list[int] = field(default_factory=list)
+            number: int = 3
+
+        parser = PreparedParser(Env)
+
+        def parse(i):
+            env, wf = parser.parse(["--number", str(i), "--items", str(i)] + (["--token", str(i)] if i % 2 else []))
+            env.items.append(-1)  # must not leak to another parse
+            return env, wf
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # make the threads switch often
+        try:
+            with ThreadPoolExecutor(16) as executor:
+                for i, (env, wf) in enumerate(executor.map(parse, range(2000))):
+                    self.assertEqual((i, [i, -1]), (env.number, env.items))
+                    self.assertEqual(({}, str(i)) if i % 2 else (["token"], None),
+                                     (wf, env.token) if i % 2 else (list(wf), None))
+        finally:
+            sys.setswitchinterval(interval)
+
+    def test_parse_without_lock(self):
+        """ Parsing takes no lock, the tyro delimiter is kept per context. """
+        from mininterface import cli_parser
+
+        @dataclass
+        class Env:
+            my_field: int = 0
+
+        parser = PreparedParser(Env, use_underscores=True)
+        held, release = Event(), Event()
+
+        def hold():
+            with cli_parser.tyro_lock:
+                held.set()
+                release.wait(5)
+
+        thread = Thread(target=hold)
+        thread.start()
+        held.wait()
+        try:
+            with patch.object(cli_parser._strings, "DELIMETER", "-"):  # as if a tyro.cli ran meanwhile
+                with ThreadPoolExecutor(1) as executor:
+                    env, _ = executor.submit(parser.parse, ["--my_field", "2"]).result(timeout=2)
+            self.assertEqual(2, env.my_field)
+        finally:
+            release.set()
+            thread.join()
+
 
 def mock_interactive_terminal(func):
     # mock the session could be made interactive
@@ -264,6 +474,38 @@ class TestConversion(TestAbstract):
         self.assertEqual({"": {"one": 1}}, formdict_resolve({"": {"one": Tag(Tag(1))}}))
         self.assertEqual({"one": 1}, formdict_resolve({"": {"one": Tag(Tag(1))}}, extract_main=True))
 
+    def test_flat_form(self):
+        form = dict_to_tagdict({"": {"one": 1}, "section": {"two": 2, "empty": {}, "sub": {"three": 3}}, "four": 4})
+        flat = FlatForm(form)
+        self.assertEqual([1, 2, 3, 4], [tag.val for tag in flat])
+        self.assertEqual([("", "one"), ("section", "two"), ("section", "sub", "three"), ("four",)], flat.paths)
+        self.assertEqual([(0, ("",)), (1, ("section",)), (2, ("section", "empty")), (2, ("section", "sub"))], flat.sections)
+        self.assertEqual("three", flat.tags[2].name)
+
+        # the same output and the same key order as the recursive resolution
+        for extract_main in (False, True):
+            resolved = flat.resolve(extract_main)
+            self.assertEqual(formdict_resolve(form, extract_main), resolved)
+            self.assertEqual(list(formdict_resolve(form, extract_main)), list(resolved))
+
+        # just the top-level sections are headed, as in the widget flattening
+        header = lambda key: [f"# {key}"]
+        self.assertEqual(list(flatten(form, include_keys=header)), list(flat.with_sections(lambda path: header(path[-1]))))
+        self.assertEqual(["# ", 1, "# section", 2, 3, 4],
+                         [getattr(item, "val", item) for item in flat.with_sections(lambda path: header(path[-1]))])
+
+        # a tag whose value is a dict is resolved the same way too
+        nested = {"": {"conf": Tag({"inner": Tag(5), "plain": 6})}}
+        self.assertEqual(formdict_resolve(nested), FlatForm(nested).resolve())
+        self.assertEqual({"conf": {"inner": 5, "plain": 6}}, FlatForm(nested).resolve(extract_main=True))
+
+        # the UI values are paired either from a nested dict or from a list
+        ui = {"": {"one": "10"}, "section": {"two": "20", "empty": {}, "sub": {"three": "30"}}, "four": "40"}
+        self.assertEqual(list(flat.zip(ui)), list(flat.zip(["10", "20", "30", "40"])))
+        self.assertTrue(Tag._submit(flat, ui))
+        self.assertEqual({"one": 10, "section": {"two": 20, "empty": {}, "sub": {"three": 30}}, "four": 40},
+                         flat.resolve(extract_main=True))
+
     def test_normalize_types(self):
         """ Conversion str("") to None and back.
         When using GUI interface, we input an empty string and that should mean None
@@ -313,6 +555,39 @@ class TestConversion(TestAbstract):
         self.assertTrue(tag.update(new_date))
         self.assertEqual(datetime.fromisoformat(new_date), tag.val)
 
+    def test_converter_cache(self):
+        get_converter.cache_clear()
+        tags = [Tag(1, annotation=int | None) for _ in range(10)]
+        self.assertTrue(Tag._submit_values((tag, str(i)) for i, tag in enumerate(tags)))
+        self.assertEqual(list(range(10)), [tag.val for tag in tags])
+        self.assertEqual(1, get_converter.cache_info().misses)  # compiled once for all the tags
+
+        convert = get_converter(list[int])
+        self.assertEqual([1, 2], convert("[1, 2]"))
+        self.assertFalse(Tag([], annotation=list[int]).update("[1, 'a']"))  # not convertible
+        self.assertEqual((1, "a"), get_converter(tuple[int, str])("[1, 'a']"))
+        self.assertIsNone(get_converter(int | None)(""))
+        with self.assertRaises(ValueError):
+            get_converter(list)("[1, ")
+
+    def test_parse_scalars(self):
+        self.assertEqual([1, 2, -3], parse_scalars("[1, 2,-3 ]", int))
+        self.assertEqual([1.5, 2.0], parse_scalars("(1.5, 2)", float))
+        self.assertEqual([Path("/tmp"), Path("/usr")], parse_scalars("['/tmp', \"/usr\"]", Path))
+        self.assertEqual([], parse_scalars("[]", int))
+        # not simple enough, literal_eval is used instead
+        for ui_value, cast_to in (("[0x10]", int), ("[1,]", int), ("(1)", int), ("[nan]", float), ("1, 2", int),
+                                  ("['a, b']", str), ("['a\\'b']", str), ("[a]", str), ("[[1]]", int)):
+            self.assertIsNone(parse_scalars(ui_value, cast_to), ui_value)
+
+        # The result is the same as with literal_eval
+        for ui_value, annotation in (("[1, 2]", list[int]), ("[0x10, 2]", list[int]), ("['a, b', 'c']", list[str]),
+                                     ("(1.5, 2)", list[float]), ("[1, 1]", set[int]), ("['/tmp']", list[Path])):
+            tag = Tag(annotation=annotation)
+            self.assertTrue(tag.update(ui_value))
+            cast_to, = get_args(annotation)
+            self.assertEqual(get_origin(annotation)(cast_to(v) for v in literal_eval(ui_value)), tag.val)
+
     def test_validation(self):
         def validate(tag: Tag):
             val = tag.val
@@ -445,11 +720,123 @@ class TestConversion(TestAbstract):
 
 
 class TestTag(TestAbstract):
+    def test_tag_source(self):
+        """ The source attributes are the ones a constructed Tag would have. """
+        src, tag = _tag_source(name="n", description="d"), Tag(name="n", description="d")
+        for f in fields(Tag):
+            if f.init:
+                self.assertEqual(getattr(tag, f.name), getattr(src, f.name), f.name)
+
     def test_get_ui_val(self):
         self.assertEqual([1, 2], Tag([1, 2])._get_ui_val())
         self.assertEqual(["/tmp"], Tag([Path("/tmp")])._get_ui_val())
         self.assertEqual([(1, "a")], Tag([(1, 'a')])._get_ui_val())
 
+    def test_single_construction(self):
+        """ The final Tag child is chosen before constructing, the tag is not constructed twice. """
+        for val, annotation, type_ in ((Path("/tmp"), None, PathTag),
+                                       ("/tmp", Path, PathTag),
+                                       (date(2025, 1, 1), None, DatetimeTag),
+                                       (ColorEnum.RED, None, SelectTag),
+                                       (1, None, Tag)):
+            expected = tag_assure_type(Tag(val, None, annotation, _src_key="field"))  # the former way
+            with patch.object(Tag, "__post_init__", side_effect=Tag.__post_init__, autospec=True) as m:
+                tag = tag_factory(val, annotation=annotation, _src_key="field")
+                self.assertEqual(1, m.call_count)
+            self.assertIs(type_, type(tag))
+            self.assertEqual(repr(expected), repr(tag))
+            self.assertEqual(("field", "field"), (tag.name, tag._original_name))
+
+        for env in (PathTagClass(), DatetimeTagClass()):
+            with patch.object(Tag, "__post_init__", side_effect=Tag.__post_init__, autospec=True) as m:
+                d = dataclass_to_tagdict(env)[""]
+                self.assertEqual(len(d), m.call_count)
+
+    def test_on_change(self):
+        """ The fast successive changes coalesce into a single callback, the stale async results are dropped. """
+        m = Mininterface()
+        adaptor = m._adaptor
+        scheduled = []
+
+        def call_later(delay, f):
+            scheduled.append(f)
+            return lambda: scheduled.remove(f)
+
+        calls = []
+        tag = dict_to_tagdict({"number": Tag(1, on_change=lambda tag: calls.append(tag.val))}, m)["number"]
+        tag._on_change_trigger("2")  # no delay by default
+        self.assertEqual([2], calls)
+
+        tag.on_change_delay = 0.3
+        with patch.object(adaptor, "_call_later", side_effect=call_later):
+            for ui_val in "345":
+                tag._on_change_trigger(ui_val)
+            self.assertEqual(1, len(scheduled))  # the previous callbacks were cancelled
+            scheduled.pop()()
+        self.assertEqual([2, 5], calls)
+        self.assertEqual({}, adaptor._on_change_pending)  # the fired callbacks do not accumulate
+
+        # an async callback runs off the UI thread, its result is applied only if still valid
+        started, proceed, applied = Event(), Event(), []
+
+        async def slow(tag):
+            started.set()
+            proceed.wait(5)
+            return lambda: applied.append(tag.val)
+
+        tag.on_change, tag.on_change_delay = slow, None
+        with patch.object(adaptor, "_call_from_thread", side_effect=lambda f: f()):
+            tag._on_change_trigger("6")
+            started.wait(5)
+            started.clear()
+            tag._on_change_trigger("7")  # makes the result of "6" stale
+            proceed.set()
+            self.assertTrue(started.wait(5))
+            for _ in range(100):
+                if applied and not adaptor._on_change_pending:
+                    break
+                sleep(0.01)
+        self.assertEqual([7], applied)
+        self.assertEqual({}, adaptor._on_change_pending)
+
+        # the callbacks run in a single worker, a failing one does not keep its entry
+        threads = []
+
+        async def failing(tag):
+            threads.append(current_thread())
+            raise ValueError("failed")
+
+        tag.on_change = failing
+        with patch.object(adaptor, "_call_from_thread", side_effect=lambda f: f()), \
+                self.assertLogs("mininterface.mininterface.adaptor", logging.ERROR):
+            for ui_val in "89":
+                tag._on_change_trigger(ui_val)
+                for _ in range(100):
+                    if not adaptor._on_change_pending:
+                        break
+                    sleep(0.01)
+                self.assertEqual({}, adaptor._on_change_pending)
+        self.assertEqual(2, len(threads))
+        self.assertIs(threads[0], threads[1])
+
+    def test_slots(self):
+        from copy import copy
+        from pickle import dumps, loads
+
+        for tag in (Tag(1, name="one"), SelectTag("a", options=["a", "b"]), PathTag(Path("/tmp")),
+                    DatetimeTag(date(2025, 1, 1)), SecretTag("token")):
+            self.assertFalse(hasattr(tag, "__dict__"))  # compact
+            for clone in (copy(tag), loads(dumps(tag))):
+                self.assertIs(type(tag), type(clone))
+                self.assertEqual(tag.val, clone.val)
+                self.assertEqual(tag.name, clone.name)
+        self.assertFalse(hasattr(CallbackTag(print), "__dict__"))  # (its annotation is not picklable)
+
+        t = SelectTag("a", options=["a", "b"])
+        t._get_options()
+        t.options = ["c"]  # the index is dropped
+        self.assertEqual(["c"], [k for k, *_ in t._get_options()])
+
 
 class TestAuxiliary(TestAbstract):
     def test_matches_annotation(self):
@@ -462,6 +849,22 @@ class TestAuxiliary(TestAbstract):
         self.assertTrue(matches_annotation([(1, "a"), (2, "b")], list[tuple[int, str]]))
         self.assertFalse(matches_annotation([(1, 2)], list[tuple[int, str]]))
 
+    def test_matches_large_collection(self):
+        paths = [Path("/tmp")] * 10_000
+        self.assertTrue(matches_annotation(paths, list[Path]))  # PosixPath is a subclass
+        self.assertTrue(matches_annotation(paths + [None], list[Path | None]))
+        self.assertFalse(matches_annotation(paths + [1], list[Path]))
+        self.assertTrue(matches_annotation({i: str(i) for i in range(10_000)}, dict[int, str]))
+        # the elements are checked by their types, not one by one
+        with patch("mininterface.auxiliary.matches_annotation", wraps=matches_annotation) as m:
+            self.assertTrue(matches_annotation(list(range(10_000)), list[int]))
+            m.assert_not_called()
+
+    def test_guess_type(self):
+        self.assertEqual(list[int], guess_type([1, 2]))
+        self.assertEqual(list, guess_type([1, "a"]))
+        self.assertEqual(set[str], guess_type({"a"}))
+
     def test_subclass_matches_annotation(self):
         annotation = Optional[list[int] | str | tuple[int, str]]
         self.assertTrue(subclass_matches_annotation(NoneType, annotation))
@@ -473,6 +876,38 @@ class TestAuxiliary(TestAbstract):
         # NOTE but this should work too
         # self.assertTrue(Tag(annotation=annotation)._is_subclass(list[int]))
 
+    def test_description_index(self):
+        Env = make_dataclass("Env", [(f"field_{i}", int, i) for i in range(50)])
+        get_description_index.cache_clear()
+        with patch("tyro.extras.get_parser", wraps=get_parser) as mocked:
+            dataclass_to_tagdict(Env())
+            dataclass_to_tagdict(Env())
+            # Just a single parser was built for all the fields and both forms.
+            self.assertEqual(1, mocked.call_count)
+
+    def test_schema_cache(self):
+        def descriptions(cls):
+            get_description_index.cache_clear()  # as if the program was launched again
+            return get_description_index(cls)
+
+        with TemporaryDirectory() as tmp, patch.dict(os.environ, {"MININTERFACE_CACHE": tmp}), \
+                patch("tyro.extras.get_parser", wraps=get_parser) as mocked:
+            stats.hits = stats.misses = 0
+            expected = descriptions(NestedDefaultedEnv)
+            self.assertEqual(expected, descriptions(NestedDefaultedEnv))
+            self.assertEqual((1, 1, 1), (stats.hits, stats.misses, mocked.call_count))  # no reflection on the warm start
+            self.assertEqual(1, len(list(Path(tmp).iterdir())))
+
+            # another tyro version invalidates the cache
+            with patch("mininterface.schema_cache._versions", return_value="other"):
+                self.assertEqual(expected, descriptions(NestedDefaultedEnv))
+            self.assertEqual((1, 2, 2), (stats.hits, stats.misses, mocked.call_count))
+
+            # dynamically created classes do not collide
+            self.assertIn("field1", descriptions(make_dataclass("Env", [("field1", int, 1)])))
+            self.assertIn("field2", descriptions(make_dataclass("Env", [("field2", int, 1)])))
+            self.assertEqual((1, 4), (stats.hits, stats.misses))
+
 
 class TestInheritedTag(TestAbstract):
     def test_inherited_path(self):
@@ -692,6 +1127,142 @@ class TestValidators(TestAbstract):
         self.assertFalse(t2.update(11))
         self.assertEqual(10, t2.val)
 
+    def test_revision_validates_changed(self):
+        """ On a form revision, only the values the user has changed are validated again. """
+        calls = {"number": 0, "text": 0, "cross": 0}
+
+        def counted(key, validation):
+            def _(tag):
+                calls[key] += 1
+                return validation(tag)
+            return _
+
+        number = Tag(1, validation=counted("number", limit(1, 10)))
+        text = Tag("", validation=counted("text", not_empty))
+        cross = Tag(2, validation=cross_field(counted("cross", lambda tag: tag.val > number.val or "Too small")))
+        facet = Mininterface().facet
+        facet._fetch_from_adaptor({"number": number, "text": text, "cross": cross})
+        flat = facet._flat
+
+        self.assertFalse(Tag._submit(flat, ["5", "", "6"]))
+        self.assertEqual({"number": 1, "text": 1, "cross": 1}, calls)
+        # the user fixes the text, the number is not validated again, the cross field validation is
+        self.assertTrue(Tag._submit(flat, ["5", "hello", "6"]))
+        self.assertEqual({"number": 1, "text": 2, "cross": 2}, calls)
+        self.assertEqual([5, "hello", 6], [tag.val for tag in flat])
+
+        # a value set by the program is validated again
+        number.set_val(7)
+        self.assertTrue(Tag._submit(flat, ["5", "hello", "6"]))
+        self.assertEqual({"number": 2, "text": 2, "cross": 3}, calls)
+
+        # a failed value has its error text, it is validated again even if unchanged
+        self.assertFalse(Tag._submit(flat, ["50", "hello", "6"]))
+        self.assertFalse(Tag._submit(flat, ["50", "hello", "6"]))
+        self.assertEqual(4, calls["number"])
+
+        # a new dialog validates everything
+        self.assertTrue(Tag._submit(flat, ["5", "hello", "6"]))
+        facet._fetch_from_adaptor({"number": number, "text": text, "cross": cross})
+        self.assertTrue(Tag._submit(facet._flat, ["5", "hello", "6"]))
+        self.assertEqual({"number": 6, "text": 3, "cross": 7}, calls)
+
+    def test_blocking(self):
+        """ The blocking validations run concurrently. """
+        barrier = Barrier(4, timeout=5)
+
+        @blocking
+        def wait_for_others(tag):
+            barrier.wait()  # breaks if not all the four validations run at once
+            return True
+
+        tags = [Tag(i, validation=wait_for_others) for i in range(4)]
+        self.assertTrue(Tag._submit_values((tag, "5") for tag in tags))
+        self.assertEqual([5] * 4, [tag.val for tag in tags])
+        self.assertTrue(PathTag(Path("/tmp"), exist=True)._is_blocking())
+        self.assertFalse(PathTag(Path("/tmp"))._is_blocking())
+
+        # the error texts are kept per tag, whatever order the validations finish in
+        @blocking
+        def positive(tag):
+            sleep(0.05 * (3 - tag.val) if tag.val > 0 else 0)
+            return tag.val > 0 or f"{tag.val} is not positive"
+        tags = [Tag(1, validation=positive) for _ in range(4)]
+        self.assertFalse(Tag._submit_values(zip(tags, ("1", "-1", "2", "-2"))))
+        self.assertEqual([None, "-1 is not positive", None, "-2 is not positive"], [tag._error_text for tag in tags])
+
+    def test_blocking_timeout(self):
+        @blocking(timeout=0.05)
+        def hung(tag):
+            sleep(1)
+            return True
+        tag = Tag(1, validation=hung)
+        self.assertFalse(tag.update(2))
+        self.assertEqual("Validation timed out after 0.05 s", tag._error_text)
+        self.assertEqual(1, tag.val)
+
+        # More timed validations than the workers: they do not wait for each other, nor pile up threads.
+        from threading import active_count
+        threads = active_count()
+
+        @blocking(timeout=0.5)
+        def quick(tag):
+            sleep(0.01)
+            return True
+        tags = [Tag(1, validation=quick) for _ in range(VALIDATION_WORKERS + 4)]
+        self.assertTrue(Tag._submit_values((tag, 2) for tag in tags))
+        self.assertEqual([2] * len(tags), [tag.val for tag in tags])
+
+        release = Event()
+
+        @blocking(timeout=0.05)
+        def stuck(tag):
+            release.wait(5)
+            return True
+        try:
+            for _ in range(3):
+                tags = [Tag(1, validation=stuck) for _ in range(VALIDATION_WORKERS + 4)]
+                start = time()
+                self.assertFalse(Tag._submit_values((tag, 2) for tag in tags))
+                self.assertLess(time() - start, 0.5)
+                self.assertEqual({"Validation timed out after 0.05 s"}, {tag._error_text for tag in tags})
+            self.assertLessEqual(active_count(), threads + VALIDATION_WORKERS)
+        finally:
+            release.set()  # free the workers
+        sleep(0.1)
+
+        # the check finishing after the timeout changes neither the tag nor its source
+        late = Event()
+
+        @blocking(timeout=0.05)
+        def slow(tag):
+            late.wait(5)
+            return True
+        source = {"a": 1, "b": 1}
+        tags = list(dict_to_tagdict(source).values())
+        for tag in tags:
+            tag.validation = slow
+        self.assertFalse(Tag._submit_values((tag, "2") for tag in tags))
+        self.assertEqual([1, 1], [tag.val for tag in tags])
+        late.set()
+        sleep(0.1)
+        self.assertEqual({"a": 1, "b": 1}, source)
+        self.assertEqual([(1, None)] * 2, [(tag.val, tag._validated) for tag in tags])
+
+    def test_async(self):
+        async def positive(tag):
+            await asyncio.sleep(0)
+            return tag.val > 0 or "Must be positive"
+        tag = Tag(1, validation=positive)
+        self.assertTrue(tag._is_blocking())
+        self.assertFalse(tag.update(-1))
+        self.assertEqual("Must be positive", tag._error_text)
+
+        async def in_event_loop():  # ex. in Textual
+            return tag.update(2)
+        self.assertTrue(asyncio.run(in_event_loop()))
+        self.assertEqual(2, tag.val)
+
 
 class TestLog(TestAbstract):
     @staticmethod
@@ -777,6 +1348,15 @@ class TestPydanticIntegration(TestAbstract):
         self.assertTrue(f.update(""))
         self.assertEqual("Restrained name ", f.description)
 
+    def test_validation_model_cache(self):
+        import pydantic
+        tags = [dataclass_to_tagdict(PydNestedRestraint())["inner"]["name"] for _ in range(3)]
+        with patch.object(pydantic, "create_model", wraps=pydantic.create_model) as m:
+            for tag in tags:
+                self.assertTrue(tag.update("short"))
+                self.assertFalse(tag.update("long words"))
+            self.assertLessEqual(m.call_count, 1)  # built once, might have been built by another test before
+
     # NOTE
     # def test_run_ask_for_missing(self):
     #   Might be a mess. Seems that missing fields are working better
@@ -815,6 +1395,15 @@ class TestAttrsIntegration(TestAbstract):
         self.assertTrue(f.update(""))
         self.assertEqual("Restrained name ", f.description)
 
+    def test_validation_model_cache(self):
+        import attr
+        tags = [dataclass_to_tagdict(AttrsNestedRestraint())["inner"]["name"] for _ in range(3)]
+        with patch.object(attr, "make_class", wraps=attr.make_class) as m:
+            for tag in tags:
+                self.assertTrue(tag.update("short"))
+                self.assertFalse(tag.update("long words"))
+            self.assertLessEqual(m.call_count, 1)
+
 
 class TestAnnotated(TestAbstract):
     # NOTE some of the entries are not well supported
@@ -858,6 +1447,26 @@ class TestAnnotated(TestAbstract):
         # self.assertEqual(list[Path], d["files7"].annotation)
         # self.assertEqual(list[Path], d["files8"].annotation)
 
+    def test_form_schema(self):
+        env = run(AnnotatedClass, interface=Mininterface).env
+        first = dataclass_to_tagdict(env)[""]
+        with patch("mininterface.tag.tag_factory.get_type_hints") as m:
+            d = dataclass_to_tagdict(env)[""]
+            m.assert_not_called()  # the class schema is resolved just once
+        self.assertEqual(list[Path], d["files1"].annotation)
+        self.assertEqual(list[Path], d["files5"].annotation)
+        self.assertIsNot(first["files1"], d["files1"])
+        self.assertEqual({k: type(t) for k, t in first.items()}, {k: type(t) for k, t in d.items()})
+
+        env.files1 = [Path("/tmp")]
+        self.assertEqual([Path("/tmp")], dataclass_to_tagdict(env)[""]["files1"].val)
+
+        # pydantic and attrs models
+        for model in (PydNestedRestraint(), AttrsNestedRestraint()):
+            tag = dataclass_to_tagdict(model)["inner"]["name"]
+            self.assertEqual(tag.annotation, dataclass_to_tagdict(model)["inner"]["name"].annotation)
+            self.assertFalse(tag.update("long words"))
+
     def test_missing_positional(self):
         # m = run(MissingPositional, interface=Mininterface)
         # d = dataclass_to_tagdict(m.env)[""]
@@ -1253,6 +1862,525 @@ class TestSelectTag(TestAbstract):
         t.options = [Tag(1, name='A')]
         self.assertDictEqual({"A": 1}, t._build_options())
 
+    def test_option_index(self):
+        t = SelectTag(2, options={"one": 1, "two": 2, "list": [1, 2]})
+        with patch.object(SelectTag, "_build_options_uncached", wraps=t._build_options_uncached) as m:
+            self.assertEqual("two", t._get_selected_key())
+            self.assertTrue(t.update(1))
+            self.assertTrue(t.update([1, 2]))  # unhashable value
+            self.assertFalse(t.update(3))
+            self.assertEqual(["one", "two", "list"], [k for k, *_ in t._get_options()])
+            self.assertEqual(1, m.call_count)  # indexed just once
+
+            t.tips = [2]  # tips change the order
+            self.assertEqual(["two", "one", "list"], [k for k, *_ in t._get_options()])
+            t.options = {"three": 3}
+            self.assertTrue(t.update(3))
+            self.assertEqual(3, m.call_count)
+
+        t = SelectTag([2, 3], options=list(range(10)))
+        self.assertEqual(["2", "3"], t._get_selected_keys())
+
+    def test_option_search(self):
+        labels = ["Apple", "pineapple", "banana", "grape", "apricot"]
+        search = OptionSearch(labels)
+        self.assertEqual([0, 1, 3, 4], search.search("ap"))
+        self.assertEqual([0, 1], search.search("APP"))  # case insensitive, narrowing the previous results
+        self.assertEqual([1], search.search("eapp"))
+        self.assertEqual([3], search.search("pe"))  # not a narrowing, all the labels searched again
+        self.assertEqual([2], search.search("nan"))  # trigram index
+        self.assertEqual([], search.search("xyz"))
+        self.assertEqual([0, 1], search.search("p", limit=2))
+        self.assertEqual(list(range(5)), search.search(""))
+
+        # the same results as the plain scan
+        labels = [f"host-{i}.example.com" for i in range(2000)]
+        search = OptionSearch(labels)
+        for query in ("1", "12", "x", "12", "2", "123", "-12", "st-19", "9.ex", "host-1999.example.com", "ample.co"):
+            self.assertEqual([i for i, label in enumerate(labels) if query in label], search.search(query))
+
+        t = SelectTag(options=["one", "two", "three"], tips=["three"])
+        self.assertEqual(["three", "two"], [t._get_options()[i][0] for i in t._search_options("t")])
+        self.assertEqual(2, t._count_options("t"))
+
+
+class Numbers(OptionsProvider):
+    """ Lazy options, the numbers below n. """
+
+    def __init__(self, n: int):
+        self.n = n
+        self.requested = 0
+        """ Number of the options fetched. """
+
+    def count(self):
+        return self.n
+
+    def page(self, offset, limit):
+        out = [(f"number {i}", i) for i in range(offset, min(self.n, offset + limit))]
+        self.requested += len(out)
+        return out
+
+    def search(self, query, limit):
+        out = [(f"number {i}", i) for i in range(self.n) if query in str(i)][:limit]
+        self.requested += len(out)
+        return out
+
+    def resolve(self, value):
+        if isinstance(value, int) and 0 <= value < self.n:
+            return f"number {value}"
+
+
+class TestLazyOptions(TestAbstract):
+    def test_select_tag(self):
+        numbers = Numbers(1_000_000)
+        t = SelectTag(5, options=numbers, tips=[7])
+        self.assertEqual("number 5", t._get_selected_key())
+        self.assertTrue(t.update(999_999))
+        self.assertFalse(t.update(1_000_000))
+        self.assertEqual("Must be one of the options", t._error_text)
+        self.assertEqual(1_000_000, t._count_options())
+        self.assertEqual([("number 7", 7, True, ("number 7",))], t._get_page(7, 1))
+        self.assertEqual([7, 17, 27], [v for _, v, *_ in t._get_page(0, 3, "7")])
+        self.assertLess(numbers.requested, 2000)  # never fetched all
+
+        t = SelectTag([1, 2], options=numbers)
+        self.assertEqual(["number 1", "number 2"], t._get_selected_keys())
+        self.assertTrue(t.update([3, 4]))
+        self.assertFalse(t.update([3, -1]))
+
+        # materialized options are paged the same way
+        t = SelectTag(options=["one", "two", "three"])
+        self.assertEqual(["two", "three"], [v for _, v, *_ in t._get_page(1, 5)])
+        self.assertEqual(["two"], [v for _, v, *_ in t._get_page(0, 5, "w")])
+
+    def test_select(self):
+        m = run(interface=Mininterface)
+        self.assertEqual(0, m.select(Numbers(1)))  # skippable
+
+    @mock_interactive_terminal
+    def test_text_interface(self):
+        m = TextInterface()
+        t = SelectTag(options=Numbers(1_000_000), name="Number")
+        # 0 = search, 1 = next page, then the options
+        with patch.object(m._adaptor, "_choose", side_effect=[1, 4]), patch.object(m, "ask", return_value=""):
+            self.assertEqual(21, m._adaptor._choose_paged(t))
+        with patch.object(m._adaptor, "_choose", side_effect=[0, 2]), patch.object(m, "ask", return_value="12345"):
+            # 0 = search, 1 = next page (more than PAGE results), then the search results
+            self.assertEqual(112345, m._adaptor._choose_paged(t))
+
+        t = SelectTag([], options=Numbers(10), multiple=True, name="Numbers")
+        # 0 = ok, 1 = search
+        with patch.object(m._adaptor, "_choose", side_effect=[2, 4, 2, 0]):
+            self.assertEqual([2], m._adaptor._choose_paged(t))
+
+
+class TestTkSelect(TestAbstract):
+    def setUp(self):
+        super().setUp()
+        from tkinter import TclError, Tk
+        try:
+            self.root = Tk()
+        except TclError:
+            self.skipTest("No display")
+        self.addCleanup(self.root.destroy)
+
+    def test_paged_list(self):
+        """ Many options are paged in a listbox (next page when scrolled to the bottom), the entry filters them. """
+        from tkinter import Listbox
+        from mininterface.tk_interface.select_input import SelectInputWrapper
+
+        tag = SelectTag("option 0", options=[f"option {i}" for i in range(300)])
+        adaptor = SimpleNamespace(settings=GuiUiSettings(search_since=100))
+        wrapper = SelectInputWrapper(self.root, tag, {"row": 0, "column": 0}, None, adaptor)
+        listbox = next(w for w in wrapper.frame.winfo_children() if isinstance(w, Listbox))
+        self.root.update()
+        self.assertEqual(SelectInputWrapper.PAGE, listbox.size())
+        self.assertEqual((0,), listbox.curselection())
+
+        listbox.yview_moveto(1)
+        self.root.update()
+        self.assertEqual(2 * SelectInputWrapper.PAGE, listbox.size())
+
+        wrapper.widget.insert(0, "OPTION 29")  # the search entry
+        self.root.update()
+        self.assertEqual(["option 29", *(f"option 29{i}" for i in range(10))], list(listbox.get(0, "end")))
+        listbox.selection_set(0)
+        listbox.event_generate("<<ListboxSelect>>")
+        self.root.update()
+        self.assertEqual("option 29", wrapper.variable_wrapper.get())
+
+
+class TestImport(TestAbstract):
+    def imported(self, module: str) -> set[str]:
+        """ The modules loaded by a cold import of the module. """
+        res = subprocess.run([sys.executable, "-c", f"import sys, {module}; print(*sys.modules)"],
+                             cwd=Path(__file__).parent.parent, capture_output=True, text=True, check=True)
+        return set(res.stdout.split())
+
+    def test_lazy_import(self):
+        """ Heavy modules are loaded just when needed. """
+        for module in ("mininterface", "mininterface.interfaces"):
+            imported = self.imported(module)
+            for heavy in ("tyro", "textual", "tkinter", "yaml", "unittest", "pydantic", "attr",
+                          "mininterface.cli_parser"):
+                self.assertNotIn(heavy, imported, module)
+
+
+@contextmanager
+def headless_textual(dialog: Callable[[TextualApp], None] = TextualApp.action_confirm):
+    """ Run the textual app headless. Once shown, every dialog is handled by the function (submitted by default). """
+    apps: list[TextualApp] = []
+    on_mount = TextualApp.on_mount
+
+    def mount(app: TextualApp):
+        apps.append(app)
+        on_mount(app)
+        app.call_after_refresh(dialog, app)
+
+    with (patch.object(TextualApp, "run", partialmethod(TextualApp.run, headless=True)),
+          patch.object(TextualApp, "run_async", partialmethod(TextualApp.run_async, headless=True)),
+          patch.object(TextualApp, "on_mount", mount)):
+        yield apps
+
+
+async def until(condition: Callable[[], Any]):
+    """ Give the textual app a while to get to the condition. """
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+
+
+class TestTextualSession(TestAbstract):
+    """ Within the with statement, the textual app is kept running between the dialogs. """
+
+    def test_session(self):
+        stdout = sys.stdout
+        with headless_textual() as apps, TextualInterface(need_atty=False) as m:
+            self.assertEqual({"a": 1}, m.form({"a": 1}))
+            adaptor = m._adaptor
+            loop, task = adaptor._session
+            # between the dialogs, the app is suspended, the prints go to the interface
+            self.assertIsNotNone(apps[0]._suspension)
+            self.assertIs(m._redirected, sys.stdout)
+            print("between")
+            self.assertEqual({"b": "text"}, m.form({"b": "text"}))
+            self.assertEqual("between\n", str(apps[1].query_one("#buffered_text").renderable))
+        # the second dialog reused the running app
+        self.assertEqual(2, len(apps))
+        self.assertIs(apps[0], apps[1])
+        # the app is ended on exit
+        self.assertIsNone(adaptor._session)
+        self.assertTrue(task.done())
+        self.assertTrue(loop.is_closed())
+        self.assertIs(stdout, sys.stdout)
+
+    def test_session_crash(self):
+        def dialog(app: TextualApp):
+            if "crash" in app.adaptor.facet._form:
+                raise RuntimeError("crash")
+            app.action_confirm()
+
+        with headless_textual(dialog) as apps, TextualInterface(need_atty=False) as m:
+            self.assertEqual({"a": 1}, m.form({"a": 1}))
+            loop, task = m._adaptor._session
+            with self.assertRaises(Cancelled):  # the app has not returned the dialog result
+                m.form({"crash": 1})
+            # the crashed app is ended, the next dialog starts a new one
+            self.assertIsNone(m._adaptor._session)
+            self.assertTrue(task.done())
+            self.assertTrue(loop.is_closed())
+            self.assertEqual({"b": 2}, m.form({"b": 2}))
+        self.assertEqual(3, len(apps))
+        self.assertIs(apps[0], apps[1])
+        self.assertIsNot(apps[1], apps[2])
+
+
+class TestDirCache(TestAbstract):
+    def test_listing(self):
+        with TemporaryDirectory() as tmp:
+            d = Path(tmp)
+            for name in ("b.txt", "A.txt", ".hidden", "c.txt"):
+                (d / name).touch()
+            for name in ("zdir", "Ydir", ".hidden_dir"):
+                (d / name).mkdir()
+            cache = DirCache()
+            # directories first, case-insensitive sort, hidden skipped
+            listing = cache.get(d)
+            self.assertEqual([("Ydir", True), ("zdir", True), ("A.txt", False), ("b.txt", False), ("c.txt", False)],
+                             listing)
+            self.assertIs(listing, cache.get(d))  # reused
+
+            # the directory changed
+            (d / "d.txt").touch()
+            st = os.stat(d)
+            os.utime(d, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))  # the mtime resolution might be coarse
+            self.assertIn(("d.txt", False), cache.get(d))
+
+            self.assertRaises(FileNotFoundError, cache.get, d / "missing")
+
+    def test_cancelled(self):
+        with TemporaryDirectory() as tmp:
+            d = Path(tmp)
+            (d / "a.txt").touch()
+            cache = DirCache()
+            self.assertIsNone(cache.get(d, lambda: True))
+            self.assertEqual([("a.txt", False)], cache.get(d))  # the cancelled listing was not cached
+
+    def test_lru(self):
+        with TemporaryDirectory() as tmp:
+            dirs = [Path(tmp, str(i)) for i in range(3)]
+            for d in dirs:
+                d.mkdir()
+            cache = DirCache()
+            cache.SIZE = 2
+            first = cache.get(dirs[0])
+            cache.get(dirs[1])
+            self.assertIs(first, cache.get(dirs[0]))  # recently used
+            cache.get(dirs[2])
+            self.assertEqual([str(dirs[0]), str(dirs[2])], list(cache._listings))  # the least recently used dropped
+
+
+class TestFileBrowser(TestAbstract):
+    def test_quick_search_navigate(self):
+        """ The quick search index follows the tree across a navigation. """
+        class Picker(App):
+            def compose(self):
+                yield FileBrowser(PathTag(Path(tmp)))
+
+        async def run():
+            async with Picker().run_test() as pilot:
+                browser = pilot.app.query_one(FileBrowser)
+
+                async def loaded():
+                    await browser.workers.wait_for_complete()
+                    await pilot.pause()
+
+                def search(prefix):
+                    browser._search_prefix = prefix
+                    browser._find_matching_node()
+                    return browser._tree.cursor_node.data
+
+                await loaded()
+                self.assertEqual(["apple", "avocado", "sub"], [name for name, _ in browser._index])
+                self.assertEqual(d / "avocado", search("av"))
+
+                browser._navigate_to(d / "sub")
+                await loaded()
+                self.assertEqual(["almond", "banana"], [name for name, _ in browser._index])
+                self.assertEqual(d / "sub" / "banana", search("b"))
+                self.assertEqual(d / "sub" / "almond", search("a"))
+
+        with TemporaryDirectory() as tmp:
+            d = Path(tmp)
+            (d / "sub").mkdir()
+            for path in ("apple", "avocado", "sub/almond", "sub/banana"):
+                (d / path).touch()
+            asyncio.run(run())
+
+    def test_quick_search_index(self):
+        """ The pages and the expanded directories are merged into the sorted index.
+        The search stops at the first match after the cursor. """
+        class Picker(App):
+            def compose(self):
+                yield FileBrowser(PathTag(Path(tmp)))
+
+        async def run():
+            async with Picker().run_test() as pilot:
+                browser = pilot.app.query_one(FileBrowser)
+                tree = browser._tree
+
+                async def loaded():
+                    await browser.workers.wait_for_complete()
+                    await pilot.pause()
+
+                def search(prefix):
+                    browser._search_prefix = prefix
+                    browser._find_matching_node()
+                    return tree.cursor_node.data
+
+                await loaded()
+                tree.root.children[0].expand()  # a_dir
+                await loaded()
+                names = [name for name, _ in browser._index]
+                self.assertEqual(["a", "a_dir", "b1", "b2", "b3", "b4", "b5", "c"], names)
+
+                with patch.object(tree, "get_node_by_id", wraps=tree.get_node_by_id) as m:
+                    self.assertEqual(d / "b1", search("b"))
+                    self.assertEqual(1, m.call_count)
+                tree.move_cursor(tree.root.children[-1])  # b5
+                self.assertEqual(d / "a_dir" / "a", search("a"))  # wraps around
+
+        with TemporaryDirectory() as tmp, patch.object(FileBrowser, "PAGE", 2):
+            d = Path(tmp)
+            (d / "a_dir").mkdir()
+            for path in ("b1", "b2", "b3", "b4", "b5", "a_dir/c", "a_dir/a"):
+                (d / path).touch()
+            asyncio.run(run())
+
+
+class TestTextualForm(TestAbstract):
+    def test_blocking_validation(self):
+        """ Just the blocking checks run in the workers, the other validations run in the app thread. """
+        threads = {}
+
+        @blocking
+        def slow(tag):
+            threads["slow"] = current_thread()
+            return True
+
+        def quick(tag):
+            threads["quick"] = current_thread()
+            tag.facet.set_title("Validated")  # touches the widgets
+            return True
+
+        form = {"a": Tag(1, validation=slow), "b": Tag(2, validation=quick), "c": Tag(3, validation=slow)}
+        with headless_textual() as apps:
+            m = TextualInterface(need_atty=False)
+            self.assertEqual({"a": 1, "b": 2, "c": 3}, m.form(form))
+        self.assertIsNotNone(apps[0].validated)  # validated in the app
+        self.assertIs(main_thread(), threads["quick"])
+        self.assertIsNot(main_thread(), threads["slow"])
+
+        # cancelled while validating, the tags keep their values
+        release = Event()
+
+        @blocking
+        def stuck(tag):
+            release.wait(5)
+            return True
+
+        def cancel(app: TextualApp):
+            app.widgets[0].value = "5"
+            app.action_confirm()
+            app.call_later(app.action_exit)
+
+        tag = Tag(1, validation=stuck)
+        try:
+            with headless_textual(cancel):
+                m = TextualInterface(need_atty=False)
+                self.assertRaises(Cancelled, m.form, {"a": tag, "b": Tag(2, validation=stuck)})
+            self.assertEqual(1, tag.val)
+        finally:
+            release.set()
+
+    def test_option_list(self):
+        """ Many options are shown in an option list, loaded page by page: on scrolling, on highlighting
+        the last one and on typing. """
+        shown = {}
+
+        def dialog(app: TextualApp):
+            app.run_worker(script(app))
+
+        async def script(app: TextualApp):
+            widget = app.widgets[0]
+            shown["widget"] = type(widget)
+            if isinstance(widget, MyOptionList):
+                options = widget.option_list
+                await until(lambda: options.max_scroll_y)  # laid out
+                shown["mounted"] = options.option_count
+                options.scroll_end(animate=False)
+                await until(lambda: options.option_count > MyOptionList.PAGE)
+                shown["scrolled"] = options.option_count
+                options.highlighted = options.option_count - 1
+                await until(lambda: options.option_count > 2 * MyOptionList.PAGE)
+                shown["highlighted"] = options.option_count
+                widget.input.value = "option 199"
+                await until(lambda: options.option_count == 1)
+                shown["searched"] = options.option_count
+                options.highlighted = 0
+                options.action_select()
+                await until(lambda: widget.get_ui_value() == "option 199")
+            app.action_confirm()
+
+        def form(settings=None):
+            with headless_textual(dialog):
+                m = TextualInterface(need_atty=False, settings=settings)
+                return m.form({"choice": SelectTag("option 0", options=[f"option {i}" for i in range(200)])})
+
+        self.assertEqual({"choice": "option 199"}, form(TextualUiSettings(search_since=100)))
+        self.assertEqual((MyOptionList, MyOptionList.PAGE, 2 * MyOptionList.PAGE, 3 * MyOptionList.PAGE, 1),
+                         (shown["widget"], shown["mounted"], shown["scrolled"], shown["highlighted"],
+                          shown["searched"]))
+
+        # under the threshold, the radio buttons are used
+        shown.clear()
+        self.assertEqual({"choice": "option 0"}, form())
+        self.assertIs(MyRadioSet, shown["widget"])
+
+    def test_type_to_filter(self):
+        """ The slash starts filtering the options. Till then, the letters navigate the form. """
+        shown = {}
+
+        def dialog(app: TextualApp):
+            app.run_worker(script(app))
+
+        async def script(app: TextualApp):
+            radio, selection, beta = app.widgets
+
+            def visible(widget):
+                return sum(button.display for button in radio._nodes) if widget is radio else selection.option_count
+
+            async def press(widget, *keys: tuple[str, str]):
+                widget.focus()
+                await until(lambda: app.focused is widget)
+                for key, character in keys:
+                    widget.post_message(events.Key(key, character))
+                await asyncio.sleep(0.05)
+
+            for widget in (radio, selection):
+                await press(widget, ("b", "b"))
+                shown[widget, "letter"] = app.focused is beta
+                await press(widget, ("slash", "/"), ("t", "t"), ("w", "w"))
+                shown[widget, "filtered"] = widget.border_subtitle, visible(widget), app.focused is widget
+                await press(widget, ("escape", None), ("b", "b"))
+                shown[widget, "escaped"] = widget.border_subtitle, visible(widget), app.focused is beta
+            app.action_confirm()
+
+        form = {"choice": SelectTag("one", options=["one", "two", "three"]),
+                "many": SelectTag(["one"], options=["one", "two", "three"], multiple=True),
+                "beta": "b"}
+        with headless_textual(dialog) as apps:
+            m = TextualInterface(need_atty=False)
+            self.assertEqual({"choice": "one", "many": ["one"], "beta": "b"}, m.form(form))
+        for widget in apps[0].widgets[:2]:
+            self.assertTrue(shown[widget, "letter"])
+            self.assertEqual(("Search: tw", 1, True), shown[widget, "filtered"])
+            self.assertEqual(("", 3, True), shown[widget, "escaped"])  # the filter ended
+
+    def test_virtualized(self):
+        """ A large form mounts just the fields near the viewport. The values of the others survive the submit. """
+        shown = {}
+
+        def dialog(app: TextualApp):
+            app.run_worker(script(app))  # not to block the app while waiting
+
+        async def script(app: TextualApp):
+            contents = app.query_one(FormContents)
+            await until(lambda: app.widgets)  # the groups near the viewport are being mounted
+            shown.update(groups=len(contents.groups), mounted=len(app.widgets))
+            app.widgets[0].value = "100"
+            if contents.groups:  # focus a field not mounted yet
+                contents.focus_tag(70)
+                await until(lambda: contents._focused_tag_index() == 70)
+                shown.update(focused=app.focused.tag.name)
+            app.action_confirm()
+
+        settings = TextualUiSettings(virtualize_since=50)
+        form = {f"field{i}": i for i in range(80)}
+        with headless_textual(dialog):
+            m = TextualInterface(need_atty=False, settings=settings)
+            self.assertEqual(form | {"field0": 100}, m.form(form))
+        self.assertEqual(4, shown["groups"])
+        self.assertLess(shown["mounted"], len(form))
+        self.assertEqual("field70", shown["focused"])
+
+        # under the threshold, all the fields are mounted
+        with headless_textual(dialog):
+            m = TextualInterface(need_atty=False, settings=settings)
+            self.assertEqual({"field0": 100, "field1": 1}, m.form({"field0": 0, "field1": 1}))
+        self.assertEqual(0, shown["groups"])
+
 
 if __name__ == '__main__':
     main()